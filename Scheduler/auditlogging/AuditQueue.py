@@ -0,0 +1,326 @@
+"""
+A bounded in-memory queue of audit trails, drained by a background thread, used by ``Auditor`` in asynchronous
+mode (please see ``Auditor.enable_async``). A caller only appends a trail, agents capture trails on the drainer
+thread in batches, once ``batch_size`` trails are queued or the first of them waited ``linger`` seconds.
+
+When the queue is full, the ``overflow_policy`` decides what happens with a new trail.
+
++---------------+-------------------------------------------------------------------+
+|  Policy       |     Behaviour when the queue is full                              |
++===============+===================================================================+
+|  block        |  the caller waits until the drainer took a batch off the queue    |
++---------------+-------------------------------------------------------------------+
+|  drop         |  the new trail is dropped and counted as dropped                  |
++---------------+-------------------------------------------------------------------+
+|  spill        |  the new trail is appended to a file, spilled trails are captured |
+|               |  once the queue is empty                                          |
++---------------+-------------------------------------------------------------------+
+
+While spilled trails are pending, new trails are spilled as well, therefore trails are captured in the order
+they were put. The default spill file is one per process, trails spilled by a previous process are captured
+after a restart only if both use the same ``spill_path``, e.g. on a persistent volume.
+
+An agent failing to capture a batch does not stop the drainer, failures are counted and printed on console,
+they are not audited again.
+
+"""
+
+import collections
+import json
+import os
+import tempfile
+import threading
+import time
+
+import utils.Constants as Sc
+from auditlogging.Trail import Trail
+
+
+class AuditQueue:
+
+    def __init__(self, agents, max_size: int = Sc.DEFAULT_AUDIT_QUEUE_SIZE,
+                 batch_size: int = Sc.DEFAULT_AUDIT_BATCH_SIZE, linger: float = Sc.DEFAULT_AUDIT_LINGER,
+                 overflow_policy: str = Sc.DEFAULT_AUDIT_OVERFLOW_POLICY, spill_path: str = None):
+        """
+        Creates the queue and starts the drainer thread. Trails spilled to ``spill_path`` before, e.g. by a
+        previous process, are captured first, new trails are spilled after them until all have been captured.
+
+        Parameters
+        ----------
+        agents : callable
+                 returns the agents a batch is captured by, it is called once per batch
+        max_size : int
+                   maximum number of trails waiting in memory. Default 10000
+        batch_size : int
+                     maximum number of trails captured by an agent at once. Default 100
+        linger : float
+                 maximum seconds a trail waits to be batched with others. Default 0.2 seconds
+        overflow_policy : str
+                          one of ``block``, ``drop`` or ``spill``. Default block
+        spill_path : str
+                     file spilled trails are appended to, one JSON trail per line. It is required to capture
+                     trails spilled before a restart, e.g. a file on a persistent volume. Default a file per process
+                     in the temporary directory, which is not found again after a restart
+
+        Raises
+        ------
+        ValueError
+                if queue or batch size is less than 1, linger is negative or the overflow policy is unknown
+
+        """
+        if overflow_policy not in Sc.AUDIT_OVERFLOW_POLICIES:
+            raise ValueError(Sc.MSG_EX_ILLEGAL_AUDIT_OVERFLOW_POLICY)
+
+        if max_size < 1 or batch_size < 1 or linger < 0:
+            raise ValueError(Sc.MSG_EX_ILLEGAL_AUDIT_QUEUE)
+
+        self._agents = agents
+        self._max_size = max_size
+        self._batch_size = batch_size
+        self._linger = linger
+        self._overflow_policy = overflow_policy
+        self._spill_path = spill_path or os.path.join(tempfile.gettempdir(),
+                                                      Sc.DEFAULT_AUDIT_SPILL_FILE.format(os.getpid()))
+        self._spill_offset = 0
+        self._spilled = self._count_spilled()
+        self._queue = collections.deque()
+        self._condition = threading.Condition()
+        self._in_flight = 0
+        self._flushing = 0
+        self._captured = 0
+        self._dropped = 0
+        self._failed = 0
+        self._closed = False
+        self._drainer = threading.Thread(target=self._run, name='Audit-Drainer', daemon=True)
+        self._drainer.start()
+
+    def put(self, trail: Trail) -> bool:
+        """
+        Queues a trail, it never waits for an agent. When the queue is full the overflow policy applies,
+        while spilled trails are pending the trail is spilled after them.
+
+        Parameters
+        ----------
+        trail : Trail
+                a trail to be captured by all agents
+
+        Returns
+        --------
+        bool
+            ``True`` if the trail has been queued, spilled or dropped, ``False`` if the queue is closed
+
+        """
+        with self._condition:
+            if self._closed:
+                return False
+
+            if self._spilled:
+                self._spill(trail)
+                return True
+
+            if len(self._queue) >= self._max_size:
+                if self._overflow_policy == Sc.AUDIT_OVERFLOW_DROP:
+                    self._dropped += 1
+                    return True
+
+                if self._overflow_policy == Sc.AUDIT_OVERFLOW_SPILL:
+                    self._spill(trail)
+                    return True
+
+                while len(self._queue) >= self._max_size and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return False
+
+            first = not self._queue
+            self._queue.append(trail)
+            if first or len(self._queue) >= self._batch_size:
+                self._condition.notify_all()
+        return True
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Waits until all queued and spilled trails have been captured, queued trails do not linger meanwhile.
+
+        Parameters
+        ----------
+        timeout : float
+                  maximum seconds to wait. Default ``None``, waits until all trails have been captured
+
+        Returns
+        --------
+        bool
+            ``True`` if no trail is waiting, ``False`` if the timeout elapsed before
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            self._flushing += 1
+            self._condition.notify_all()
+            try:
+                while self._queue or self._in_flight or self._spilled:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._condition.wait(remaining)
+            finally:
+                self._flushing -= 1
+        return True
+
+    def close(self, timeout: float = None) -> bool:
+        """
+        Flushes the queue and stops the drainer thread, trails put afterwards are rejected.
+
+        Parameters
+        ----------
+        timeout : float
+                  maximum seconds to wait for the flush. Default ``None``, waits until all trails have been captured
+
+        Returns
+        --------
+        bool
+            ``True`` if all trails have been captured, ``False`` if the timeout elapsed before
+
+        """
+        flushed = self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if flushed:
+            self._drainer.join()
+        return flushed
+
+    def depth(self) -> int:
+        """
+        Returns
+        --------
+        int
+            trails queued, spilled or being captured at the moment
+
+        """
+        with self._condition:
+            return len(self._queue) + self._in_flight + self._spilled
+
+    def stats(self) -> dict:
+        """
+        Retrieves current statistics of this queue.
+
+        Returns
+        --------
+        dict
+            ``queued``, ``in_flight`` and ``spilled`` trails waiting, ``captured``, ``dropped`` and ``failed``
+            trails so far. A trail is either captured by all agents or failed, i.e. at least one agent failed
+            to capture it
+
+        """
+        with self._condition:
+            return {'max_size': self._max_size,
+                    'overflow_policy': self._overflow_policy,
+                    'queued': len(self._queue),
+                    'in_flight': self._in_flight,
+                    'spilled': self._spilled,
+                    'captured': self._captured,
+                    'dropped': self._dropped,
+                    'failed': self._failed}
+
+    def _run(self):
+        """
+        Drainer thread, takes a batch once it is full, it lingered long enough, the queue is flushed or closed.
+        Spilled trails are taken once the queue is empty.
+
+        """
+        while True:
+            with self._condition:
+                while not self._queue and not self._spilled and not self._closed:
+                    self._condition.wait()
+                if self._queue and len(self._queue) < self._batch_size and not self._closed and not self._flushing:
+                    self._condition.wait(self._linger)
+                if self._queue:
+                    batch = [self._queue.popleft() for _ in range(min(self._batch_size, len(self._queue)))]
+                elif self._spilled:
+                    batch = self._unspill()
+                else:
+                    return
+                self._in_flight = len(batch)
+                self._condition.notify_all()
+
+            self._capture(batch)
+            with self._condition:
+                self._in_flight = 0
+                self._condition.notify_all()
+
+    def _capture(self, batch: list):
+        """
+        Reports a batch to all agents, it is counted as captured once all of them captured it, otherwise as failed.
+
+        """
+        failed = False
+        for agent in self._agents():
+            try:
+                agent.capture_batch(batch)
+            except Exception as e:
+                failed = True
+                print(Sc.MSG_AUDIT_AGENT_FAILED.format(type(agent).__name__, len(batch), repr(e)))
+        with self._condition:
+            if failed:
+                self._failed += len(batch)
+            else:
+                self._captured += len(batch)
+
+    def _spill(self, trail: Trail):
+        """
+        Appends a trail to the spill file, it is called holding the lock so spilled trails keep their order.
+
+        """
+        try:
+            with open(self._spill_path, 'a', encoding='utf-8') as sf:
+                sf.write(json.dumps(trail.build_trail()) + '\n')
+        except OSError as e:
+            self._dropped += 1
+            print(Sc.MSG_AUDIT_SPILL_FAILED.format(self._spill_path, repr(e)))
+            return
+        self._spilled += 1
+        self._condition.notify_all()
+
+    def _unspill(self) -> list:
+        """
+        Reads the next batch of spilled trails, the spill file is removed once all of them have been read.
+        It is called holding the lock.
+
+        """
+        batch = []
+        try:
+            with open(self._spill_path, 'r', encoding='utf-8') as sf:
+                sf.seek(self._spill_offset)
+                while len(batch) < self._batch_size:
+                    line = sf.readline()
+                    if not line:
+                        break
+                    batch.append(_trail(line))
+                self._spill_offset = sf.tell()
+        except OSError as e:
+            print(Sc.MSG_AUDIT_SPILL_FAILED.format(self._spill_path, repr(e)))
+
+        self._spilled = 0 if not batch else max(0, self._spilled - len(batch))
+        if not self._spilled:
+            self._spill_offset = 0
+            try:
+                os.remove(self._spill_path)
+            except OSError:
+                pass
+        return batch
+
+    def _count_spilled(self) -> int:
+        try:
+            with open(self._spill_path, 'r', encoding='utf-8') as sf:
+                return sum(1 for _ in sf)
+        except OSError:
+            return 0
+
+
+def _trail(line: str) -> Trail:
+    try:
+        payload = json.loads(line)
+    except ValueError:
+        return Trail().comments(line.rstrip('\n'))
+    return Trail().operation(payload.get('operation')).status(payload.get('status')).comments(payload.get('comments'))
@@ -1,10 +1,17 @@
 from auditlogging.agents.AuditAgent import AuditAgent
 from auditlogging.agents.DefaultAgent import DefaultAgent
+from auditlogging.AuditQueue import AuditQueue
 from auditlogging.Trail import Trail
+import utils.Constants as Sc
+
+import threading
 
 
 __agents = {}
 _default_agent = DefaultAgent()
+_in_flight = 0
+_in_flight_lock = threading.Lock()
+_queue = None
 
 
 def add_agent(namekey: str, agent: AuditAgent):
@@ -41,7 +48,8 @@ def remove_agent(namekey: str):
 def audit_params(operation: str, status: str, comments: str):
     """
     Parameterised audit trail capture method. Internally Auditor will create a Trail object
-    and assign to all AuditAgent
+    and assign to all AuditAgent, in asynchronous mode the trail is queued and the caller does not wait
+    for agents (please see ``enable_async``)
 
     Parameters
     ----------
@@ -87,13 +95,128 @@ def audit_custom(jsontrail: str):
         agent.capture_custom(jsontrail)
 
 
+def enable_async(max_size: int = Sc.DEFAULT_AUDIT_QUEUE_SIZE, batch_size: int = Sc.DEFAULT_AUDIT_BATCH_SIZE,
+                 linger: float = Sc.DEFAULT_AUDIT_LINGER, overflow_policy: str = Sc.DEFAULT_AUDIT_OVERFLOW_POLICY,
+                 spill_path: str = None):
+    """
+    Switches to asynchronous mode, trails are queued in memory and captured by agents in batches
+    on a background thread (please see ``AuditQueue``). ``audit_custom`` stays synchronous.
+    Calling it again flushes the current queue and replaces it.
+
+    Parameters
+    ----------
+    max_size : int
+               maximum number of trails waiting in memory. Default 10000
+    batch_size : int
+                 maximum number of trails captured by an agent at once. Default 100
+    linger : float
+             maximum seconds a trail waits to be batched with others. Default 0.2 seconds
+    overflow_policy : str
+                      one of ``block``, ``drop`` or ``spill``, when the queue is full. Default block
+    spill_path : str
+                 file spilled trails are appended to, required to capture them after a restart.
+                 Default a file per process in the temporary directory
+
+    Raises
+    ------
+    ValueError
+            if queue or batch size is less than 1, linger is negative or the overflow policy is unknown
+
+    """
+    global _queue
+    queue = AuditQueue(lambda: list(__agents.values()), max_size, batch_size, linger, overflow_policy, spill_path)
+    previous, _queue = _queue, queue
+    if previous is not None:
+        previous.close()
+
+
+def disable_async(timeout: float = None) -> bool:
+    """
+    Switches back to synchronous mode once queued trails have been captured.
+
+    Parameters
+    ----------
+    timeout : float
+              maximum seconds to wait for queued trails. Default ``None``, waits until all are captured
+
+    Returns
+    --------
+    bool
+        ``True`` if all queued trails have been captured, ``False`` if the timeout elapsed before
+
+    """
+    global _queue
+    queue, _queue = _queue, None
+    return True if queue is None else queue.close(timeout)
+
+
+def flush(timeout: float = None) -> bool:
+    """
+    Waits until queued trails have been captured by all agents, e.g. on shutdown.
+    In synchronous mode there is nothing to wait for.
+
+    Parameters
+    ----------
+    timeout : float
+              maximum seconds to wait. Default ``None``, waits until all are captured
+
+    Returns
+    --------
+    bool
+        ``True`` if no trail is waiting, ``False`` if the timeout elapsed before
+
+    """
+    queue = _queue
+    return True if queue is None else queue.flush(timeout)
+
+
+def queue_depth() -> int:
+    """
+    Number of trails not yet captured by all agents, i.e. trails queued, spilled or being reported to agents
+    at the moment, including audits waiting on slow agents
+
+    Returns
+    --------
+    int
+        trails not yet captured by all agents
+
+    """
+    queue = _queue
+    return _in_flight + (0 if queue is None else queue.depth())
+
+
+def queue_stats() -> dict:
+    """
+    Retrieves statistics of the asynchronous mode, please see ``AuditQueue.stats``.
+
+    Returns
+    --------
+    dict
+        statistics of the queue, empty in synchronous mode
+
+    """
+    queue = _queue
+    return {} if queue is None else queue.stats()
+
+
 def _prepare_audit_agents():
     add_agent('Default-Agent', _default_agent)
 
 
 def _report_to_agents(trail: Trail):
-    for agent in __agents.values():
-        agent.capture(trail)
+    global _in_flight
+    queue = _queue
+    if queue is not None and queue.put(trail):
+        return
+
+    with _in_flight_lock:
+        _in_flight += 1
+    try:
+        for agent in list(__agents.values()):
+            agent.capture(trail)
+    finally:
+        with _in_flight_lock:
+            _in_flight -= 1
 
 
 _prepare_audit_agents()
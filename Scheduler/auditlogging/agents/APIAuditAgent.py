@@ -17,11 +17,15 @@ class APIAuditAgent(AuditAgent):
     2. After each call to capture() or capture_custom() latest response is preserved
         until next endpoint request.
         To get the response, after each invocation please call endpoint_response() to get response
+    3. In asynchronous mode of Auditor trails are captured in batches over one kept alive connection,
+        or in one POST of a JSON array if a batch endpoint URL has been set using change_batch_endpoint()
 
     """
 
     def __init__(self):
         self._url = 'http://localhost:3000/auditlogs/create'
+        self._batch_url = None
+        self._session = None
         self._resp = None
 
     def change_endpoint(self, url: str):
@@ -39,6 +43,19 @@ class APIAuditAgent(AuditAgent):
         if not is_empty(url):
             self._url = url
 
+    def change_batch_endpoint(self, url: str):
+        """
+        Sets a POST endpoint URL accepting a JSON array of trails, batches are captured in one request.
+
+        Parameters
+        ----------
+        url : str
+              a POST endpoint URL for batches
+
+        """
+        if not is_empty(url):
+            self._batch_url = url
+
     def capture(self, trail: Trail):
         """
         Capture Trail to endpoint. Internally it transforms JSON
@@ -52,6 +69,26 @@ class APIAuditAgent(AuditAgent):
         """
         self._call_endpoint(trail)
 
+    def capture_batch(self, trails: list):
+        """
+        Capture a batch of trails to endpoint, on the drainer thread of Auditor
+
+        Parameters
+        ----------
+        trails : list
+                 a list of trail objects to be used for POST
+
+        """
+        if self._session is None:
+            self._session = requests.Session()
+
+        if self._batch_url is not None:
+            self._check_response(self._session.post(self._batch_url, json=[trail.build_trail() for trail in trails]))
+            return
+
+        for trail in trails:
+            self._check_response(self._session.post(self._url, json=trail.build_trail()))
+
     def capture_custom(self, jsontrail: str):
         """
         Capture custom JSON trail to endpoint
@@ -81,9 +118,10 @@ class APIAuditAgent(AuditAgent):
 
     def _call_endpoint(self, trail: Trail):
 
-        _resp = requests.post(self._url, json=trail.build_trail())
+        self._check_response(requests.post(self._url, json=trail.build_trail()))
 
-        if _resp.status_code is not 200:
+    def _check_response(self, _resp: Response):
+        if _resp.status_code != 200:
             print(_resp.json())
 
         self._set_response(resp=_resp)
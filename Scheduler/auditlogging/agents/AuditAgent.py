@@ -36,3 +36,17 @@ class AuditAgent(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def capture_batch(self, trails: list):
+        """
+        Captures a batch of trails queued by Auditor in asynchronous mode, on the drainer thread.
+        By default every trail is captured one by one, a subclass may override it to capture them at once,
+        e.g. in one request.
+
+        Parameters
+        ----------
+        trails : list
+                 a list of Trail instances, in the order they have been queued
+
+        """
+        for trail in trails:
+            self.capture(trail)
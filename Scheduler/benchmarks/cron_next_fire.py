@@ -0,0 +1,46 @@
+"""
+Measures next fire time computation of cron triggers.
+
+Run from the ``Scheduler`` directory, ``python -m benchmarks.cron_next_fire [count]``
+
+"""
+
+import sys
+import time
+
+from scheduling.CronTrigger import CronTrigger
+
+EXPRESSIONS = ('*/15 8-17 * * MON-FRI',
+               '0 18 LW * *',
+               '30 6 1,15 * *',
+               '0 0 29 2 *',
+               '@hourly')
+
+_YEAR = 365 * 86400
+
+
+def run(count: int = 1000000) -> dict:
+    """
+    Computes ``count`` next fire times for every expression, starting from times spread over a year.
+
+    Returns
+    -------
+    dict
+        next fire times per second by expression
+
+    """
+    results = {}
+    for expression in EXPRESSIONS:
+        trigger = CronTrigger(expression)
+        base = time.time()
+        started = time.perf_counter()
+        for i in range(count):
+            trigger.next_fire(base + (i * 997) % _YEAR)
+        results[expression] = count / (time.perf_counter() - started)
+    return results
+
+
+if __name__ == '__main__':
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    for expr, rate in run(total).items():
+        print('{:<24} {:>12,.0f} next fire times/s'.format(expr, rate))
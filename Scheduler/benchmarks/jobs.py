@@ -0,0 +1,49 @@
+"""
+Synthetic jobs used by the benchmarks, they do (almost) nothing so the scheduler itself is measured.
+
+"""
+
+import threading
+import time
+
+from jobs.Job import Job
+
+
+class CountingJob(Job):
+    """
+    Counts its runs in a shared counter and optionally records their start times.
+
+    """
+
+    def __init__(self, job_name: str, counter: list, lock: threading.Lock, starts: list = None):
+        self._job_name = job_name
+        self._counter = counter
+        self._lock = lock
+        self._starts = starts
+
+    def goal(self):
+        started = time.time()
+        with self._lock:
+            self._counter[0] += 1
+            if self._starts is not None:
+                self._starts.append((self._job_name, started))
+
+    def name(self) -> str:
+        return self._job_name
+
+
+class SleepingJob(Job):
+    """
+    Sleeps for a number of seconds, a stand in for a job waiting on I/O.
+
+    """
+
+    def __init__(self, job_name: str, seconds: float):
+        self._job_name = job_name
+        self._seconds = seconds
+
+    def goal(self):
+        time.sleep(self._seconds)
+
+    def name(self) -> str:
+        return self._job_name
@@ -0,0 +1,241 @@
+"""
+End to end benchmarks of ``Scheduler``, results are written as JSON to be tracked over time, e.g. in CI.
+
++----------------+--------------------------------------------------------------------------------------+
+|  Benchmark     |  Measures                                                                            |
++================+======================================================================================+
+|  jitter        |  delay between the requested fire time and the start of the job goal (p50, p99, max) |
++----------------+--------------------------------------------------------------------------------------+
+|  throughput    |  job runs per second of a burst of due jobs, ``inline`` and ``thread`` execution     |
++----------------+--------------------------------------------------------------------------------------+
+|  memory        |  bytes allocated per registered job, with and without the job instance               |
++----------------+--------------------------------------------------------------------------------------+
+|  idle_cpu      |  CPU time used by an idle scheduler, percent of one core per scheduler               |
++----------------+--------------------------------------------------------------------------------------+
+|  drain         |  seconds ``shutdown`` takes while jobs are running, safe and forced                  |
++----------------+--------------------------------------------------------------------------------------+
+
+Run from the ``Scheduler`` directory, ``python -m benchmarks.scheduler_suite [--quick] [--output results.json]``
+
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import math
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+
+import utils.Constants as Sc
+from benchmarks.jobs import CountingJob, SleepingJob
+from scheduling.ScheduleConfig import ScheduleConfig
+from scheduling.Scheduler import Scheduler
+
+_EVERY_SECOND = ScheduleConfig(every=1, time_unit=Sc.SECONDS)
+_EVERY_HOUR = ScheduleConfig(every=1, time_unit=Sc.HOURS)
+
+
+def _percentile(values: list, percent: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(math.ceil(percent / 100.0 * len(ordered))) - 1)]
+
+
+def jitter(jobs: int = 20, seconds: float = 5.0) -> dict:
+    """
+    Runs jobs every second and measures how late their goals start compared to their fire times.
+
+    Returns
+    -------
+    dict
+        ``p50_ms``, ``p99_ms``, ``max_ms`` and number of ``samples`` per execution mode
+
+    """
+    results = {}
+    for execution in (Sc.EXECUTION_INLINE, Sc.EXECUTION_THREAD):
+        counter, lock, starts = [0], threading.Lock(), []
+        scheduler = Scheduler(separate_thread=True)
+        scheduler.schedule_jobs([CountingJob('jitter-{}'.format(i), counter, lock, starts) for i in range(jobs)],
+                                schedule_config=_EVERY_SECOND, run_continuous=True, execution=execution)
+        first = scheduler.what_is_next_run().timestamp()
+        scheduler.start(print_next_run=False)
+        time.sleep(seconds)
+        scheduler.shutdown(force=True)
+
+        delays = []
+        for _, started in starts:
+            fire_time = first + math.floor(started - first)
+            delays.append((started - fire_time) * 1000.0)
+        results[execution] = {'samples': len(delays),
+                              'p50_ms': _percentile(delays, 50) if delays else None,
+                              'p99_ms': _percentile(delays, 99) if delays else None,
+                              'max_ms': max(delays) if delays else None}
+    return results
+
+
+def throughput(jobs: int = 20000, timeout: float = 60.0) -> dict:
+    """
+    Schedules a burst of jobs due at the same fire time and measures how fast the scheduler runs them,
+    i.e. the maximum sustainable rate of job runs.
+
+    Returns
+    -------
+    dict
+        ``runs_per_second`` between the first and the last run of the burst per execution mode
+
+    """
+    results = {}
+    for execution in (Sc.EXECUTION_INLINE, Sc.EXECUTION_THREAD):
+        counter, lock, starts = [0], threading.Lock(), []
+        scheduler = Scheduler(separate_thread=True)
+        scheduler.schedule_jobs([CountingJob('throughput-{}'.format(i), counter, lock, starts) for i in range(jobs)],
+                                schedule_config=_EVERY_SECOND, run_continuous=True, execution=execution,
+                                misfire_grace_time=None)
+        scheduler.start(print_next_run=False)
+        deadline = time.time() + timeout
+        while counter[0] < jobs and time.time() < deadline:
+            time.sleep(0.1)
+        scheduler.shutdown(force=True)
+
+        times = sorted(started for _, started in starts)[:jobs]
+        elapsed = times[-1] - times[0] if len(times) > 1 else 0.0
+        results[execution] = {'jobs': jobs,
+                              'completed': len(times),
+                              'runs_per_second': (len(times) - 1) / elapsed if elapsed > 0 else None}
+    return results
+
+
+def memory(jobs: int = 10000) -> dict:
+    """
+    Measures memory allocated by registering jobs on a scheduler.
+
+    Returns
+    -------
+    dict
+        ``bytes_per_job`` including the job instance, ``scheduler_bytes_per_job`` excluding it
+
+    """
+    counter, lock = [0], threading.Lock()
+    scheduler = Scheduler(separate_thread=True)
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        instances = [CountingJob('memory-{}'.format(i), counter, lock) for i in range(jobs)]
+        created = tracemalloc.get_traced_memory()[0]
+        scheduler.schedule_jobs(instances, schedule_config=_EVERY_HOUR, run_continuous=True)
+        registered = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return {'jobs': jobs,
+            'bytes_per_job': (registered - baseline) / jobs,
+            'scheduler_bytes_per_job': (registered - created) / jobs}
+
+
+def idle_cpu(schedulers: int = 10, seconds: float = 5.0) -> dict:
+    """
+    Starts schedulers whose only job is due in an hour and measures the CPU time the process uses meanwhile.
+
+    Returns
+    -------
+    dict
+        ``percent_per_scheduler`` of one core, after subtracting the CPU time of the idle process
+
+    """
+    started = time.process_time()
+    time.sleep(seconds)
+    baseline = time.process_time() - started
+
+    counter, lock = [0], threading.Lock()
+    instances = []
+    for i in range(schedulers):
+        scheduler = Scheduler(separate_thread=True)
+        scheduler.schedule_job(CountingJob('idle-{}'.format(i), counter, lock), schedule_config=_EVERY_HOUR,
+                               run_continuous=True)
+        scheduler.start(print_next_run=False)
+        instances.append(scheduler)
+
+    time.sleep(0.5)
+    started = time.process_time()
+    time.sleep(seconds)
+    used = time.process_time() - started
+    for scheduler in instances:
+        scheduler.shutdown(force=True)
+    return {'schedulers': schedulers,
+            'percent_per_scheduler': max(0.0, used - baseline) / seconds / schedulers * 100.0}
+
+
+def drain(jobs: int = 20, job_seconds: float = 0.5) -> dict:
+    """
+    Shuts down a scheduler while its parallel jobs are running.
+
+    Returns
+    -------
+    dict
+        ``safe_seconds`` until a safe shutdown returned, running jobs complete first,
+        and ``force_seconds`` until a forced shutdown returned
+
+    """
+    results = {'jobs': jobs, 'job_seconds': job_seconds}
+    for force in (False, True):
+        scheduler = Scheduler(separate_thread=True)
+        scheduler.schedule_jobs([SleepingJob('drain-{}'.format(i), job_seconds) for i in range(jobs)],
+                                schedule_config=_EVERY_SECOND, run_continuous=True, execute_parallel=True)
+        scheduler.start(print_next_run=False)
+        time.sleep(1.0 + job_seconds / 2)
+        started = time.perf_counter()
+        scheduler.shutdown(force=force)
+        results['force_seconds' if force else 'safe_seconds'] = time.perf_counter() - started
+    return results
+
+
+def run(quick: bool = False) -> dict:
+    """
+    Runs all benchmarks, the scheduler console output is discarded.
+
+    Parameters
+    ----------
+    quick : bool
+            if ``True`` fewer jobs and shorter measurements, e.g. for a smoke test
+
+    Returns
+    -------
+    dict
+        environment details and results by benchmark
+
+    """
+    scale, seconds = (0.1, 2.0) if quick else (1.0, 5.0)
+    benchmarks = (('jitter', lambda: jitter(seconds=seconds)),
+                  ('throughput', lambda: throughput(jobs=int(20000 * scale))),
+                  ('memory', lambda: memory(jobs=int(10000 * scale))),
+                  ('idle_cpu', lambda: idle_cpu(seconds=seconds)),
+                  ('drain', lambda: drain()))
+
+    results = {}
+    for name, benchmark in benchmarks:
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[name] = benchmark()
+
+    return {'suite': 'scheduler',
+            'timestamp': datetime.datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'quick': quick,
+            'results': results}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Scheduler benchmark suite')
+    parser.add_argument('--quick', action='store_true', help='fewer jobs and shorter measurements')
+    parser.add_argument('--output', help='JSON results file, default standard output')
+    arguments = parser.parse_args()
+
+    report = json.dumps(run(arguments.quick), indent=2)
+    if arguments.output:
+        with open(arguments.output, 'w') as output:
+            output.write(report + '\n')
+    else:
+        sys.stdout.write(report + '\n')
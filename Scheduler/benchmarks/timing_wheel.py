@@ -0,0 +1,135 @@
+"""
+Compares the cost of dispatcher ticks of the job indexes at 1k, 10k and 100k jobs.
+
+* ``scan`` - the former engine, every pulse scans all jobs for due ones and sorts them for the next run
+* ``heap`` - the default ``Dispatcher`` index
+* ``wheel`` - the ``TimingWheel`` index
+
+Jobs fire every 1 to 60 minutes. A tick advances the simulated clock by one second, fires all due jobs
+and schedules them for their next fire time, as the dispatch loop does.
+
+Run from the ``Scheduler`` directory, ``python -m benchmarks.timing_wheel [ticks]``
+
+"""
+
+import random
+import sys
+import time
+
+from scheduling.Dispatcher import _HeapIndex
+from scheduling.TimingWheel import TimingWheel
+
+COUNTS = (1000, 10000, 100000)
+
+# the scan engine costs O(n log n) per tick, it is measured over fewer ticks
+_SCAN_TICKS = 20
+
+
+class _Entry:
+
+    __slots__ = ('deadline', 'priority', 'period', 'cancelled')
+
+    def __init__(self, deadline: float, period: float):
+        self.deadline = deadline
+        self.priority = 2
+        self.period = period
+        self.cancelled = False
+
+
+def _entries(count: int, now: float) -> list:
+    generator = random.Random(count)
+    entries = []
+    for _ in range(count):
+        period = 60.0 * generator.randint(1, 60)
+        entries.append(_Entry(now + generator.random() * period, period))
+    return entries
+
+
+def _scan(entries: list, now: float, ticks: int) -> tuple:
+    fired = 0
+    started = time.perf_counter()
+    for _ in range(ticks):
+        now += 1
+        for entry in sorted((e for e in entries if e.deadline <= now), key=lambda e: e.deadline):
+            entry.deadline += entry.period
+            fired += 1
+        min(entries, key=lambda e: e.deadline)
+    return time.perf_counter() - started, fired
+
+
+def _index(index, entries: list, now: float, ticks: int) -> tuple:
+    fired = 0
+    started = time.perf_counter()
+    for _ in range(ticks):
+        now += 1
+        while True:
+            entry = index.peek(now)
+            if entry is None or entry.deadline > now:
+                break
+            index.remove(entry)
+            entry.deadline += entry.period
+            index.push(entry)
+            fired += 1
+    return time.perf_counter() - started, fired
+
+
+def _insert_cancel(index, entries: list) -> tuple:
+    started = time.perf_counter()
+    for entry in entries:
+        index.push(entry)
+    inserted = time.perf_counter() - started
+
+    cancelled = entries[::10]
+    started = time.perf_counter()
+    for entry in cancelled:
+        entry.cancelled = True
+        index.discard(entry)
+    return inserted / len(entries), (time.perf_counter() - started) / len(cancelled)
+
+
+def run(ticks: int = 3600) -> list:
+    """
+    Measures every engine at every job count.
+
+    Returns
+    -------
+    list
+        a dict per engine and job count holding microseconds per tick, per fired job, per insert and per cancel
+
+    """
+    results = []
+    for count in COUNTS:
+        now = time.time()
+        for engine in ('scan', 'heap', 'wheel'):
+            entries = _entries(count, now)
+            insert = cancel = None
+            if engine == 'scan':
+                measured = _SCAN_TICKS
+                elapsed, fired = _scan(entries, now, measured)
+            else:
+                measured = ticks
+                index = _HeapIndex() if engine == 'heap' else TimingWheel(now=now)
+                insert, cancel = _insert_cancel(index, _entries(count, now))
+                index = _HeapIndex() if engine == 'heap' else TimingWheel(now=now)
+                index.push_all(entries)
+                elapsed, fired = _index(index, entries, now, measured)
+            results.append({'engine': engine,
+                            'jobs': count,
+                            'tick_us': elapsed / measured * 1e6,
+                            'fire_us': elapsed / fired * 1e6 if fired else None,
+                            'insert_us': None if insert is None else insert * 1e6,
+                            'cancel_us': None if cancel is None else cancel * 1e6})
+    return results
+
+
+def _format(value) -> str:
+    return '{:>12}'.format('-') if value is None else '{:>12,.2f}'.format(value)
+
+
+if __name__ == '__main__':
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 3600
+    print('{:<8}{:>8}{:>12}{:>12}{:>12}{:>12}'.format('engine', 'jobs', 'us/tick', 'us/fire', 'us/insert',
+                                                      'us/cancel'))
+    for result in run(total):
+        print('{:<8}{:>8}'.format(result['engine'], result['jobs']) +
+              ''.join(_format(result[key]) for key in ('tick_us', 'fire_us', 'insert_us', 'cancel_us')))
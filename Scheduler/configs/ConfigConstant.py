@@ -29,4 +29,11 @@ ACTION = "ACTION"
 EVERY = "EVERY"
 TIME_UNIT = "TIME_UNIT"
 AT = "AT"
+CRON = "CRON"
+JITTER = "JITTER"
+SPREAD = "SPREAD"
+JOBS = "JOBS"
+WATCH_CONFIG = "WATCH_CONFIG"
+
+METRICS_PORT = "METRICS_PORT"
 
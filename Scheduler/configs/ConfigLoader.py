@@ -1,8 +1,11 @@
+import hashlib
+import pickle
 import yaml
 import os
 import configs.ConfigConstant as Cc
 import utils.Constants as Sc
 from auditlogging.Auditor import audit_params
+from configs.ConfigSnapshot import ConfigSnapshot, merge
 
 
 class Box:
@@ -14,42 +17,245 @@ __box = Box()
 __box.all_configs = None
 __box.env = None
 __box.valid = False
+__box.snapshots = {}
+__box.snapshot = None
 
+# libyaml based loader if PyYAML has been built with it, roughly ten times faster
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_CACHE_VERSION = 2
 
-def reload_config(which_env=Sc.ENV_DEV):
+
+def reload_config(which_env=Sc.ENV_DEV, force: bool = False) -> bool:
+    """
+    Loads configurations of the environment from file once.
+
+    Parameters
+    ----------
+    which_env : str
+                the environment (DEV/TEST/PROD)
+    force : bool
+            if ``True`` configurations are read from file again, e.g. once the file changed.
+            If the file can not be read or the new configurations are invalid,
+            the previously loaded valid configurations are kept
+
+    Returns
+    --------
+    bool
+        true if loaded configurations are valid, false otherwise
+
+    """
     __box.env = which_env
-    if __box.all_configs is None:
+    if __box.all_configs is None or force:
         _init()
+    else:
+        _select()
+    return __box.valid
+
+
+def config_file() -> str:
+    """
+    Retrieves path of the configurations file
+
+    Returns
+    --------
+    str
+        path of the configurations file
+
+    """
+    return os.path.dirname(__file__) + Sc.CONFIG_FILE
+
+
+def config_paths() -> list:
+    """
+    Retrieves directories of the configuration layers, i.e. of the configurations file along with environment files
+    and of job files, e.g. to be watched for changes.
+
+    Returns
+    --------
+    list
+        a list of directory paths
+
+    """
+    return [os.path.normpath(os.path.dirname(config_file())), os.path.normpath(_jobs_directory())]
+
+
+def _jobs_directory() -> str:
+    return os.path.join(os.path.dirname(config_file()), Sc.CONFIG_JOBS_DIRECTORY)
+
+
+def _layers() -> list:
+    """
+    Retrieves paths of existing configuration files in the order they are merged.
+
+    """
+    directory, name = os.path.split(config_file())
+    stem, extension = os.path.splitext(name)
+    environments = sorted(entry for entry in os.listdir(directory)
+                          if entry.startswith(stem + '.') and entry.endswith(extension) and entry != name)
+    jobs = _jobs_directory()
+    jobs = sorted(entry for entry in os.listdir(jobs) if entry.endswith(extension)) if os.path.isdir(jobs) else []
+    return [config_file()] + [os.path.join(directory, entry) for entry in environments] + \
+        [os.path.join(_jobs_directory(), entry) for entry in jobs]
 
 
 def _init():
     """
-    Initialise and load all configurations from file. This method also validates configurations for errors.
+    Initialise and load all configurations from file. This method also validates configurations for errors,
+    a ``ConfigSnapshot`` is created per environment.
+
+    Configurations are merged from layers, values of a later layer override values of an earlier one
+    (mappings are merged key by key, please see ``ConfigSnapshot.merge``).
+
+    1. ``config.yaml`` - a section per environment
+    2. ``config.<ENV>.yaml`` - configurations of one environment, e.g. ``config.PROD.yaml``
+    3. ``jobs.d/*.yaml`` - job names to their configurations, merged into ``JOBS`` of every environment
+    4. environment variables - ``SCHEDULER__<KEY>`` or ``SCHEDULER__JOBS__<JOB>__<KEY>``, values are parsed
+       as YAML, e.g. ``SCHEDULER__JOBS__orders-feed__SOURCE_PORT=2222``
 
     """
     print(Sc.MSG_CONFIG_LOADING)
 
     audit_params(Sc.OPERATION_CONFIGURATION, Sc.STATUS_LOADING, 'Loading configurations from file')
 
-    _working_dir = os.path.dirname(__file__)
-    _scheduler_config_file = _working_dir + Sc.CONFIG_FILE
+    previous = (__box.all_configs, __box.snapshots, __box.valid)
 
-    # config_file_path = scheduler_config_file
+    try:
+        loaded = _merge_layers(_read(_layers()))
+        if not isinstance(loaded.get(env()), dict):
+            raise ValueError('environment {} not found'.format(env()))
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        if previous[0] is None:
+            raise
+        audit_params(Sc.OPERATION_CONFIGURATION, Sc.STATUS_FAILED,
+                     'Configurations could not be read, keeping loaded configurations: ' + repr(e))
+        return
 
-    with open(_scheduler_config_file) as jf:
-        __box.all_configs = yaml.load(jf)
+    __box.all_configs = loaded
+    __box.snapshots = {name: ConfigSnapshot(name, values) for name, values in loaded.items()}
+    _select()
 
     audit_params(Sc.OPERATION_CONFIGURATION, Sc.STATUS_LOADED, 'Loaded configurations from file')
 
-    errors = _validate()
-    __box.valid = _empty_arr(errors)
-
     if not __box.valid:
         audit_params(Sc.OPERATION_CONFIGURATION, Sc.STATUS_INVALID, 'Invalid configurations found')
+        if previous[2]:
+            __box.all_configs, __box.snapshots = previous[0], previous[1]
+            _select()
+            audit_params(Sc.OPERATION_CONFIGURATION, Sc.STATUS_INVALID, 'Keeping loaded configurations')
 
     print(Sc.MSG_CONFIG_LOADED)
 
 
+def _merge_layers(layers: list) -> dict:
+    """
+    Merges parsed configuration layers and environment variables into configurations per environment.
+
+    Parameters
+    ----------
+    layers : list
+             a list of path and parsed content pairs, the configurations file first
+
+    Returns
+    --------
+    dict
+        environment to its configurations
+
+    """
+    base = layers[0][1]
+    if not isinstance(base, dict):
+        raise ValueError('{} should contain a section per environment'.format(layers[0][0]))
+
+    stem, extension = os.path.splitext(os.path.basename(config_file()))
+    configs = {name: values for name, values in base.items() if isinstance(values, dict)}
+    jobs = {}
+    for path, content in layers[1:]:
+        if content is None:
+            continue
+        if not isinstance(content, dict):
+            raise ValueError('{} should contain a mapping of keys to values'.format(path))
+        if os.path.dirname(path) == _jobs_directory():
+            jobs = merge(jobs, content)
+        else:
+            name = os.path.basename(path)[len(stem) + 1:-len(extension)]
+            configs[name] = merge(configs.get(name, {}), content)
+
+    overrides = {}
+    for key, value in os.environ.items():
+        if key.startswith(Sc.CONFIG_ENV_PREFIX):
+            value = _parse(value)
+            for nested in reversed(key[len(Sc.CONFIG_ENV_PREFIX):].split('__')):
+                value = {nested: value}
+            overrides = merge(overrides, value)
+
+    for name, values in configs.items():
+        values = merge(values, {Cc.JOBS: jobs}) if jobs else values
+        configs[name] = merge(values, overrides)
+    return configs
+
+
+def _parse(value: str):
+    try:
+        return yaml.load(value, Loader=_Loader)
+    except yaml.YAMLError:
+        return value
+
+
+def _read(paths: list) -> list:
+    """
+    Parses configuration files. Parse results are cached in a binary file next to the configurations file,
+    which is read instead as long as modification times and hashes of all files are unchanged,
+    e.g. on restarts and in worker processes.
+
+    Parameters
+    ----------
+    paths : list
+            paths of configuration files
+
+    Returns
+    --------
+    list
+        a list of path and parsed content pairs
+
+    """
+    contents, key = [], [_CACHE_VERSION]
+    for path in paths:
+        with open(path, 'rb') as jf:
+            content = jf.read()
+            key.append((path, os.fstat(jf.fileno()).st_mtime_ns, hashlib.sha256(content).hexdigest()))
+        contents.append(content)
+    cache = config_file() + Sc.CONFIG_CACHE_SUFFIX
+
+    try:
+        with open(cache, 'rb') as cf:
+            cached_key, loaded = pickle.load(cf)
+        if cached_key == key:
+            return loaded
+    except Exception:
+        pass  # missing, stale or unreadable cache, parse the files
+
+    loaded = [(path, yaml.load(content, Loader=_Loader)) for path, content in zip(paths, contents)]
+
+    temporary = '{}.{}'.format(cache, os.getpid())
+    try:
+        with open(temporary, 'wb') as cf:
+            pickle.dump((key, loaded), cf, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, cache)
+    except OSError:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        audit_params(Sc.OPERATION_CONFIGURATION, Sc.STATUS_SKIPPED, 'Configurations cache could not be written')
+    return loaded
+
+
+def _select():
+    """
+    Selects the snapshot of the current environment.
+
+    """
+    __box.snapshot = __box.snapshots.get(env())
+    __box.valid = __box.snapshot is not None and __box.snapshot.valid
+
+
 def env():
     """
     Retrieve current environment
@@ -107,125 +313,60 @@ def get_by_env(k: str, envp: str):
         value of corresponding key, INVALID otherwise
 
     """
-    return all_configs().get(envp).get(k, "INVALID")
+    return __box.snapshots[envp].get(k)
 
 
-def get(k: str):
+def snapshot(envp: str = None) -> ConfigSnapshot:
     """
-    Retrieves value of a key of the default environment
+    Retrieves the typed and validated configurations of an environment, configurations are loaded
+    if they have not been loaded yet. Please see ``ConfigSnapshot``.
 
     Parameters
     ----------
-    k : str
-        a key to be search in configurations
+    envp : str
+            the environment, default current environment
 
     Returns
     --------
-    object
-        value of corresponding key if present, INVALID otherwise
+    ConfigSnapshot
+        an immutable snapshot, ``None`` if the environment is not configured
 
     """
-    if __box.all_configs is None or not __box.valid:
+    if __box.all_configs is None:
         reload_config()
 
-    return all_by_environment().get(k, "INVALID")
-
-
-def is_valid():
-    """
-    Returns whether configurations are valid which had checked during loading.
-
-    Returns
-    --------
-    bool
-        true if configurations are valid, false otherwise
-
-    """
-    return __box.valid
-
-
-def _validate():
-    """
-    Validates configurations
-
-    """
-    errors = []
-
-    if _empty(Cc.SOURCE_DIRECTORY) or _empty(Cc.TARGET_DIRECTORY):
-        errors.append(Sc.ERR_MSG_DIR_EMPTY)
-
-    if _empty(Cc.ERROR_DIRECTORY) or _empty(Cc.OUTPUT_DIRECTORY):
-        errors.append(Sc.ERR_MSG_ERR_DIR_EMPTY)
-
-    if get(Cc.IS_REMOTE):
-        if _empty(Cc.SOURCE_HOST) or _empty(Cc.SOURCE_USERNAME) or _empty(Cc.SOURCE_SECRET):
-            errors.append(Sc.ERR_MSG_REMOTE_CFG_EMPTY)
-
-    # if self._empty(Const.SCHEDULE) or self._empty(Const.ACTION):
-    #     errors.append(CC.ERR_MSG_SCHEDULE_ACTION_EMPTY)
-    if _empty(Cc.ACTION):
-        errors.append(Sc.ERR_MSG_SCHEDULE_ACTION_EMPTY)
-
-    if not _isnone(get(Cc.EVERY)) and not _empty(Cc.AT):
-        errors.append(Sc.ERR_MSG_SCHEDULE_INVALID)
+    return __box.snapshot if envp is None else __box.snapshots.get(envp)
 
-    if _empty(Cc.TIME_UNIT):
-        errors.append(Sc.ERR_MSG_TIME_UNIT_EMPTY)
 
-    return errors
-
-
-def _isnone(o):
-    """
-    check whether input is None
-
-    Parameters
-    ----------
-    o : object
-        any object
-
-    Returns
-    --------
-    bool
-        true if input is None, false otherwise
-
-    """
-    return o is None
-
-
-def _empty(k):
+def get(k: str):
     """
-    check whether required value is missing in configurations
+    Retrieves value of a key of the default environment
 
     Parameters
     ----------
     k : str
-        a key to be searched in configurations
+        a key to be search in configurations
 
     Returns
     --------
-    bool
-        true if value not present, false otherwise
+    object
+        value of corresponding key if present, INVALID otherwise
 
     """
-    str1 = str(get(k))
-    return _isnone(str1) or len(str1.strip()) == 0
+    if __box.all_configs is None:
+        reload_config()
 
+    return __box.snapshot.get(k)
 
-def _empty_arr(arr):
-    """
-    checks whether input collection is empty
 
-    Parameters
-    ----------
-    arr: []
-        input array/collection
+def is_valid():
+    """
+    Returns whether configurations are valid which had checked during loading.
 
     Returns
     --------
     bool
-        true if collection is empty, false otherwise
+        true if configurations are valid, false otherwise
 
     """
-    return _isnone(arr) or len(arr) == 0
-
+    return __box.valid
@@ -0,0 +1,230 @@
+"""
+An immutable, validated view of the configurations of one environment, created by ``ConfigLoader`` once per load.
+
+Values are converted to their types once, e.g. ``FILE_EXTENSIONS`` to a frozenset and ``SOURCE_PORT`` to an int,
+blank values to ``None``. Reading a field is a plain attribute access, it never reads or validates the file again.
+A hot reload replaces the snapshot, a snapshot held by a component never changes.
+
+Every entry of ``JOBS`` overrides configurations of the environment for one job, e.g. its ``SOURCE_HOST`` and
+``SOURCE_DIRECTORY``. Views of all jobs are merged and validated along with the snapshot, ``job`` looks them up.
+
+Example
+--------
+1.  snapshot = ConfigLoader.snapshot()
+    if snapshot.valid and name.rsplit('.', 1)[-1] in snapshot.file_extensions:
+        ...
+2.  host = ConfigLoader.snapshot().job('orders-feed').source_host
+
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import configs.ConfigConstant as Cc
+import utils.Constants as Sc
+
+_MISSING = "INVALID"
+# a schedule of a job replaces the schedule of the environment as a whole
+_SCHEDULE = (Cc.EVERY, Cc.TIME_UNIT, Cc.AT, Cc.CRON)
+
+
+def _blank(value) -> bool:
+    return value is None or (isinstance(value, str) and len(value.strip()) == 0)
+
+
+def merge(base, override):
+    """
+    Merges two configurations, values of ``override`` win. Mappings are merged recursively,
+    any other value (including lists) is replaced.
+
+    Returns
+    --------
+    object
+        the merged configurations, inputs are not changed
+
+    """
+    if not isinstance(base, Mapping) or not isinstance(override, Mapping):
+        return override
+    merged = dict(base)
+    for key, value in override.items():
+        merged[key] = merge(merged[key], value) if key in merged else value
+    return merged
+
+
+def _freeze(value):
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class ConfigSnapshot:
+
+    __slots__ = ('env', 'is_remote', 'source_directory', 'archive_directory', 'remote_error_directory',
+                 'source_host', 'source_port', 'source_username', 'source_secret', 'target_directory',
+                 'error_directory', 'output_directory', 'log_directory', 'file_extensions', 'notifications',
+                 'action', 'every', 'time_unit', 'at', 'cron', 'jitter', 'spread', 'jobs', 'watch_config',
+                 'metrics_port', 'job_name', 'errors', '_values', '_views')
+
+    def __init__(self, env: str, values: dict, job_name: str = None):
+        """
+        Converts and validates configurations of an environment.
+
+        Parameters
+        ----------
+        env : str
+              the environment (DEV/TEST/PROD)
+        values : dict
+                 configurations of the environment as read from file
+        job_name : str
+                   name of the job, if these are configurations of the environment merged with
+                   the entry of the job in ``JOBS``. Default ``None``
+
+        """
+        errors = []
+        values = _freeze(values or {})
+
+        def text(key: str):
+            value = values.get(key)
+            return None if _blank(value) else str(value).strip()
+
+        def number(key: str, convert):
+            value = values.get(key)
+            if _blank(value):
+                return None
+            try:
+                return convert(value)
+            except (TypeError, ValueError):
+                errors.append(Sc.ERR_MSG_NUMBER_INVALID.format(key, value))
+                return None
+
+        extensions = values.get(Cc.FILE_EXTENSIONS)
+        jobs = values.get(Cc.JOBS)
+        fields = {'env': env,
+                  'is_remote': bool(values.get(Cc.IS_REMOTE)),
+                  'source_directory': text(Cc.SOURCE_DIRECTORY),
+                  'archive_directory': text(Cc.ARCHIVE_DIRECTORY),
+                  'remote_error_directory': text(Cc.REMOTE_ERROR_DIRECTORY),
+                  'source_host': text(Cc.SOURCE_HOST),
+                  'source_port': number(Cc.SOURCE_PORT, int),
+                  'source_username': text(Cc.SOURCE_USERNAME),
+                  'source_secret': text(Cc.SOURCE_SECRET),
+                  'target_directory': text(Cc.TARGET_DIRECTORY),
+                  'error_directory': text(Cc.ERROR_DIRECTORY),
+                  'output_directory': text(Cc.OUTPUT_DIRECTORY),
+                  'log_directory': text(Cc.LOG_DIRECTORY),
+                  'file_extensions': frozenset(str(ext) for ext in extensions or () if not _blank(ext)),
+                  'notifications': values.get(Cc.NOTIFICATIONS) or (),
+                  'action': text(Cc.ACTION),
+                  'every': number(Cc.EVERY, int),
+                  'time_unit': text(Cc.TIME_UNIT),
+                  'at': text(Cc.AT),
+                  'cron': text(Cc.CRON),
+                  'jitter': number(Cc.JITTER, float),
+                  'spread': bool(values.get(Cc.SPREAD)),
+                  'jobs': jobs if isinstance(jobs, MappingProxyType) else MappingProxyType({}),
+                  'watch_config': bool(values.get(Cc.WATCH_CONFIG)),
+                  'metrics_port': number(Cc.METRICS_PORT, int),
+                  'job_name': job_name,
+                  '_values': values}
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+        errors += self._validate()
+
+        views = {}
+        if job_name is None:
+            shared = {key: value for key, value in values.items() if key != Cc.JOBS}
+            schedule = {key: None for key in _SCHEDULE}
+            for name, definition in self.jobs.items():
+                if not isinstance(definition, Mapping):
+                    errors.append(Sc.ERR_MSG_JOB_CONFIG_INVALID.format(name))
+                    continue
+                if any(key in definition for key in _SCHEDULE):
+                    definition = merge(schedule, definition)
+                view = ConfigSnapshot(env, merge(shared, definition), str(name))
+                views[str(name)] = view
+                errors += ['{}: {}'.format(name, error) for error in view.errors if error not in errors]
+        object.__setattr__(self, '_views', MappingProxyType(views))
+        object.__setattr__(self, 'errors', tuple(errors))
+
+    @property
+    def valid(self) -> bool:
+        """
+        Returns
+        --------
+        bool
+            true if configurations are valid, false otherwise
+
+        """
+        return not self.errors
+
+    def job(self, job_name: str):
+        """
+        Retrieves configurations of a job, i.e. configurations of the environment merged with
+        the entry of the job in ``JOBS``.
+
+        Parameters
+        ----------
+        job_name : str
+                   name of the job
+
+        Returns
+        --------
+        ConfigSnapshot
+            configurations of the job, this snapshot if the job has no entry or the name is ``None``
+
+        """
+        return self if job_name is None else self._views.get(job_name, self)
+
+    def get(self, k: str):
+        """
+        Retrieves a value as read from file, lists and mappings are read-only.
+
+        Parameters
+        ----------
+        k : str
+            a key to be search in configurations
+
+        Returns
+        --------
+        object
+            value of corresponding key if present, INVALID otherwise
+
+        """
+        return self._values.get(k, _MISSING)
+
+    def _validate(self) -> list:
+        errors = []
+
+        if self.source_directory is None or self.target_directory is None:
+            errors.append(Sc.ERR_MSG_DIR_EMPTY)
+
+        if self.error_directory is None or self.output_directory is None:
+            errors.append(Sc.ERR_MSG_ERR_DIR_EMPTY)
+
+        if self.is_remote and (self.source_host is None or self.source_username is None
+                               or self.source_secret is None):
+            errors.append(Sc.ERR_MSG_REMOTE_CFG_EMPTY)
+
+        if self.action is None:
+            errors.append(Sc.ERR_MSG_SCHEDULE_ACTION_EMPTY)
+
+        if self.every is not None and self.at is not None:
+            errors.append(Sc.ERR_MSG_SCHEDULE_INVALID)
+
+        if self.time_unit is None:
+            errors.append(Sc.ERR_MSG_TIME_UNIT_EMPTY)
+
+        if self.cron is not None and (self.every is not None or self.at is not None):
+            errors.append(Sc.ERR_MSG_CRON_INVALID)
+
+        return errors
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{} is immutable'.format(type(self).__name__))
+
+    def __repr__(self):
+        if self.job_name is not None:
+            return 'ConfigSnapshot(env={}, job={}, valid={})'.format(self.env, self.job_name, self.valid)
+        return 'ConfigSnapshot(env={}, valid={})'.format(self.env, self.valid)
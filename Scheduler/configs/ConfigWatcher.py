@@ -0,0 +1,219 @@
+"""
+Watches configuration files and invokes a callback once one of them changed, e.g. to reschedule jobs
+(please see ``Scheduler.reload_config``). A watched directory changes when a file matching the pattern
+is written, added or removed.
+
+On Linux the directories are watched with inotify, the watcher thread sleeps until a file is written
+and closed, moved or removed, e.g. by an editor replacing the file. Elsewhere, or if inotify is not available,
+the modification time, size and inode of the files are polled every ``interval`` seconds.
+Directories are watched with inotify only if they exist on start.
+
+Example
+--------
+1.  watcher = ConfigWatcher(ConfigLoader.config_paths(), on_change=lambda: print('changed'))
+    watcher.start()
+    watcher.stop()
+
+"""
+
+import ctypes
+import ctypes.util
+import fnmatch
+import os
+import select
+import struct
+import sys
+import threading
+
+import utils.Constants as Sc
+from auditlogging.Auditor import audit_params
+
+# inotify(7) flags
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_DELETE = 0x00000200
+_EVENTS = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_DELETE
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_EVENT = struct.Struct('iIII')
+
+
+def _inotify():
+    """
+    Returns the C library if it provides inotify, ``None`` otherwise.
+
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+    except OSError:
+        return None
+    return libc if hasattr(libc, 'inotify_init1') and hasattr(libc, 'inotify_add_watch') else None
+
+
+def _signature(path: str, pattern: str):
+    try:
+        if os.path.isdir(path):
+            return tuple(sorted((entry.name, _signature(entry.path, pattern)) for entry in os.scandir(path)
+                                if fnmatch.fnmatch(entry.name, pattern) and entry.is_file()))
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+class ConfigWatcher:
+
+    def __init__(self, paths, on_change, interval: float = Sc.DEFAULT_CONFIG_POLL_INTERVAL,
+                 use_inotify: bool = True, pattern: str = '*.yaml'):
+        """
+        Parameters
+        ----------
+        paths : list
+                files and directories to watch, or a single path
+        on_change : callable
+                    invoked without arguments on the watcher thread, once per change
+        interval : float
+                   seconds between two checks when polling. Default 1
+        use_inotify : bool
+                      if ``False`` the files are polled even if inotify is available. Default True
+        pattern : str
+                  names of files to watch in a directory. Default ``*.yaml``
+
+        Raises
+        ------
+        ValueError
+            if interval is not a positive number
+
+        """
+        if not isinstance(interval, (int, float)) or interval <= 0:
+            raise ValueError(Sc.MSG_EX_ILLEGAL_POLL_INTERVAL.format(interval))
+        paths = [paths] if isinstance(paths, str) else paths
+        self._paths = [os.path.abspath(path) for path in paths]
+        self._pattern = pattern
+        self._on_change = on_change
+        self._interval = interval
+        self._libc = _inotify() if use_inotify else None
+        self._stopped = threading.Event()
+        self._wakeup = None
+        self._thread = None
+        self._signature = None
+
+    def start(self):
+        """
+        Starts watching on a daemon thread, calling this method more than once has no effect.
+
+        """
+        if self._thread is not None:
+            return
+
+        self._signature = self._signatures()
+        self._stopped.clear()
+        fd = self._watch() if self._libc is not None else None
+        target = self._poll if fd is None else lambda: self._listen(fd)
+        self._thread = threading.Thread(target=target, name='Config-Watcher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops watching and waits for the watcher thread, unless it is called from the callback.
+
+        """
+        if self._thread is None:
+            return
+
+        self._stopped.set()
+        if self._wakeup is not None:
+            os.write(self._wakeup[1], b'\0')
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        if self._wakeup is not None:
+            os.close(self._wakeup[0])
+            os.close(self._wakeup[1])
+            self._wakeup = None
+        self._thread = None
+
+    def uses_inotify(self) -> bool:
+        """
+        Returns
+        --------
+        bool
+            ``True`` if the files are watched with inotify, ``False`` if they are polled
+
+        """
+        return self._wakeup is not None
+
+    def _signatures(self) -> tuple:
+        return tuple(_signature(path, self._pattern) for path in self._paths)
+
+    def _watch(self):
+        """
+        Adds inotify watches of the directories and of the directories of the files,
+        editors often replace a file instead of writing it.
+
+        Returns
+        --------
+        int
+            the inotify file descriptor, ``None`` if inotify could not be initialised
+
+        """
+        fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            return None
+        directories = {path if os.path.isdir(path) else os.path.dirname(path) for path in self._paths}
+        for directory in directories:
+            if os.path.isdir(directory) and self._libc.inotify_add_watch(fd, directory.encode(), _EVENTS) < 0:
+                os.close(fd)
+                return None
+        self._wakeup = os.pipe()
+        return fd
+
+    def _listen(self, fd: int):
+        try:
+            while not self._stopped.is_set():
+                ready, _, _ = select.select([fd, self._wakeup[0]], [], [])
+                if fd in ready and self._drain(fd):
+                    self._check()
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _drain(fd: int) -> bool:
+        """
+        Reads all pending inotify events, e.g. of a file written in several steps, they are checked at once.
+
+        Returns
+        --------
+        bool
+            ``True`` if an event was read
+
+        """
+        read = False
+        while True:
+            try:
+                data = os.read(fd, 64 * 1024)
+            except BlockingIOError:
+                return read
+            read = read or len(data) >= _EVENT.size
+
+    def _poll(self):
+        while not self._stopped.wait(self._interval):
+            self._check()
+
+    def _check(self):
+        """
+        Invokes the callback if a file changed since the last check, errors are audited.
+
+        """
+        signature = self._signatures()
+        if signature == self._signature:
+            return
+
+        self._signature = signature
+        try:
+            self._on_change()
+        except Exception as e:
+            audit_params(Sc.OPERATION_CONFIGURATION, Sc.STATUS_FAILED,
+                         'Configurations could not be reloaded: ' + repr(e))
@@ -1,5 +1,8 @@
 import getpass
 
+import configs.ConfigConstant as Cc
+from utils.Utils import cfg_snapshot
+
 
 class HostConfig:
     """
@@ -13,6 +16,38 @@ class HostConfig:
     def __init__(self):
         self._config = {}
 
+    @staticmethod
+    def for_job(job_name: str = None, src: str = Cc.SOURCE_DIRECTORY, dest: str = Cc.TARGET_DIRECTORY):
+        """
+        Builds a HostConfig from configurations of a job, i.e. configurations of the environment
+        merged with the entry of the job in ``JOBS``. Values which are not configured are not set,
+        their getters return defaults.
+
+        Parameters
+        ----------
+        job_name : str
+                   name of the job, if None configurations of the environment are used. Default None
+        src : str
+              configuration key of the source directory. Default SOURCE_DIRECTORY
+        dest : str
+               configuration key of the destination directory. Default TARGET_DIRECTORY
+
+        Returns
+        --------
+        HostConfig
+            a new HostConfig object
+
+        """
+        snapshot = cfg_snapshot().job(job_name)
+        config = HostConfig()
+        values = {'src': getattr(snapshot, src.lower()), 'dest': getattr(snapshot, dest.lower()),
+                  'host': snapshot.source_host, 'port': snapshot.source_port,
+                  'user': snapshot.source_username, 'secret': snapshot.source_secret}
+        for k, v in values.items():
+            if v is not None:
+                config.append(k, v)
+        return config.fileext(sorted(snapshot.file_extensions))
+
     def append(self, k, v):
         """
         Optionally a developer can use this method to append as many as
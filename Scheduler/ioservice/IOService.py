@@ -5,6 +5,13 @@ import utils.Constants as Sc
 from auditlogging.Auditor import audit_params
 from utils.Utils import current_time_in_millis, time_taken
 
+import os
+import threading
+
+# operation to number of transfers, files, bytes, seconds and bytes per second of the last transfer
+_transfers = {Sc.OPERATION_DOWNLOAD: [0, 0, 0, 0.0, None], Sc.OPERATION_UPLOAD: [0, 0, 0, 0.0, None]}
+_transfers_lock = threading.Lock()
+
 
 def download(downloader: Downloader) -> list:
     """
@@ -28,6 +35,7 @@ def download(downloader: Downloader) -> list:
     audit_params(Sc.OPERATION_DOWNLOAD, Sc.STATUS_PROCESSING, 'Files are downloading from source to destination')
 
     files = downloader.download()
+    _record_transfer(Sc.OPERATION_DOWNLOAD, files, _start)
 
     audit_params(Sc.OPERATION_DOWNLOAD, Sc.STATUS_COMPLETE, 'Files are downloaded to destination' + time_taken(_start))
 
@@ -55,6 +63,7 @@ def upload(uploader: Uploader) -> list:
     audit_params(Sc.OPERATION_UPLOAD, Sc.STATUS_PROCESSING, 'Files are uploading from source to destination')
 
     files = uploader.upload()
+    _record_transfer(Sc.OPERATION_UPLOAD, files, _start)
 
     audit_params(Sc.OPERATION_UPLOAD, Sc.STATUS_COMPLETE, 'Files are uploaded to destination' + time_taken(_start))
 
@@ -80,3 +89,38 @@ def cleanup(cleaner: Cleaner):
 
     audit_params(Sc.OPERATION_FILE_DELETE, Sc.STATUS_COMPLETE, 'Processed files are cleaned' + time_taken(_start))
 
+
+def transfer_stats() -> dict:
+    """
+    Retrieves statistics of downloads and uploads performed by this module since the process started.
+    Bytes are the sizes of the returned files which exist on localhost.
+
+    Returns
+    --------
+    dict
+        ``Download`` and ``Upload`` to number of ``transfers``, ``files``, ``bytes``, ``seconds`` spent
+        and ``bytes_per_second`` of the last transfer (``None`` before the first transfer)
+
+    """
+    with _transfers_lock:
+        return {operation: {'transfers': transfers, 'files': files, 'bytes': size, 'seconds': seconds,
+                            'bytes_per_second': rate}
+                for operation, (transfers, files, size, seconds, rate) in _transfers.items()}
+
+
+def _record_transfer(operation: str, files: list, start: int):
+    seconds = (current_time_in_millis() - start) / 1000
+    size = 0
+    for file in files or []:
+        try:
+            size += os.path.getsize(file)
+        except (OSError, TypeError):
+            pass
+
+    with _transfers_lock:
+        stats = _transfers[operation]
+        stats[0] += 1
+        stats[1] += len(files or [])
+        stats[2] += size
+        stats[3] += seconds
+        stats[4] = size / seconds if seconds > 0 else None
@@ -1,8 +1,7 @@
 import os
 import shutil
-from utils.Utils import cfg, current_time_in_millis, time_taken, is_empty
+from utils.Utils import cfg_snapshot, current_time_in_millis, time_taken, is_empty
 import utils.Constants as Sc
-import configs.ConfigConstant as Cc
 from ioservice.downloaders.Downloader import Downloader
 from auditlogging.Auditor import audit_params
 
@@ -14,7 +13,7 @@ class LocalDownloader(Downloader):
 
     """
 
-    def __init__(self):
+    def __init__(self, job_name: str = None):
         """
         Retrieve required file system paths from configurations
 
@@ -22,10 +21,16 @@ class LocalDownloader(Downloader):
         2. Destination directory path
         3. File extensions which will be used to filter out only required files
 
+        Parameters
+        ----------
+        job_name : str
+                   name of a job in ``JOBS`` of configurations whose overrides apply, default None
+
         """
-        self._srcDir = cfg(Cc.SOURCE_DIRECTORY)
-        self._destDir = cfg(Cc.TARGET_DIRECTORY)
-        self._file_ext = cfg(Cc.FILE_EXTENSIONS)
+        snapshot = cfg_snapshot().job(job_name)
+        self._srcDir = snapshot.source_directory
+        self._destDir = snapshot.target_directory
+        self._file_ext = snapshot.file_extensions
 
     def change_dir(self, src: str = None, dest: str = None):
         """
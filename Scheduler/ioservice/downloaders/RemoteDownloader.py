@@ -1,7 +1,6 @@
 import pysftp
 import os
-from utils.Utils import cfg, current_time_in_millis, time_taken
-import configs.ConfigConstant as Cc
+from utils.Utils import cfg_snapshot, current_time_in_millis, time_taken
 import utils.Constants as Sc
 from utils.Utils import is_empty, is_empty_arr
 from ioservice.HostConfig import HostConfig
@@ -18,7 +17,7 @@ class RemoteDownloader(Downloader):
 
     """
 
-    def __init__(self):
+    def __init__(self, job_name: str = None):
         """
         Retrieves required SFTP configurations from configurations
 
@@ -31,14 +30,20 @@ class RemoteDownloader(Downloader):
         6. localhost destination directory path
         7. File extensions to be filter
 
+        Parameters
+        ----------
+        job_name : str
+                   name of a job in ``JOBS`` of configurations whose overrides apply, default None
+
         """
-        self._srcDir = cfg(Cc.SOURCE_DIRECTORY)
-        self._sftpHost = cfg(Cc.SOURCE_HOST)
-        self._sftpPort = cfg(Cc.SOURCE_PORT)
-        self._sftpUsername = cfg(Cc.SOURCE_USERNAME)
-        self._sftpSecret = cfg(Cc.SOURCE_SECRET)
-        self._destDir = cfg(Cc.TARGET_DIRECTORY)
-        self._file_ext = cfg(Cc.FILE_EXTENSIONS)
+        snapshot = cfg_snapshot().job(job_name)
+        self._srcDir = snapshot.source_directory
+        self._sftpHost = snapshot.source_host
+        self._sftpPort = snapshot.source_port
+        self._sftpUsername = snapshot.source_username
+        self._sftpSecret = snapshot.source_secret
+        self._destDir = snapshot.target_directory
+        self._file_ext = snapshot.file_extensions
 
     def fromconfig(self, configs: HostConfig):
         """
@@ -56,7 +61,7 @@ class RemoteDownloader(Downloader):
         self._sftpUsername = configs.getuser()
         self._sftpSecret = configs.getsecret()
         self._destDir = configs.getdest()
-        self._file_ext = configs.getfile_ext()
+        self._file_ext = frozenset(configs.getfile_ext())
 
     def change_dir(self, src: str = None, dest: str = None):
         """
@@ -87,7 +92,7 @@ class RemoteDownloader(Downloader):
 
         """
         if not is_empty_arr(file_ext):
-            self._file_ext = file_ext
+            self._file_ext = frozenset(file_ext)
 
     def change_files(self, files: list = None):
         """
@@ -1,6 +1,5 @@
 from ioservice.uploaders.Uploader import Uploader
-from utils.Utils import cfg, current_time_in_millis, time_taken, is_empty, is_empty_arr
-import configs.ConfigConstant as Cc
+from utils.Utils import cfg_snapshot, current_time_in_millis, time_taken, is_empty, is_empty_arr
 import utils.Constants as Sc
 from auditlogging.Auditor import audit_params
 import os
@@ -14,7 +13,7 @@ class LocalUploader(Uploader):
 
     """
 
-    def __init__(self, files: list, move: bool = False):
+    def __init__(self, files: list, move: bool = False, job_name: str = None):
         """
         Accepts a list of files for upload operation and copy to destination directory.
 
@@ -28,11 +27,14 @@ class LocalUploader(Uploader):
 
         move : bool
                 If true files will be moved to destination, copy otherwise
+        job_name : str
+                   name of a job in ``JOBS`` of configurations whose overrides apply, default None
 
         """
-        self._srcDir = cfg(Cc.TARGET_DIRECTORY)
-        self._destDir = cfg(Cc.OUTPUT_DIRECTORY)
-        self._file_ext = cfg(Cc.FILE_EXTENSIONS)
+        snapshot = cfg_snapshot().job(job_name)
+        self._srcDir = snapshot.target_directory
+        self._destDir = snapshot.output_directory
+        self._file_ext = snapshot.file_extensions
         self._move = move
         self._files = files
 
@@ -81,7 +83,7 @@ class LocalUploader(Uploader):
 
         """
         if not is_empty_arr(file_ext):
-            self._file_ext = file_ext
+            self._file_ext = frozenset(file_ext)
 
     def set_move(self, move: bool = False):
         """
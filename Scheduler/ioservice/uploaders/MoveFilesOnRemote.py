@@ -1,8 +1,7 @@
 import pysftp
 import os
 from ioservice.uploaders.Uploader import Uploader
-from utils.Utils import cfg, current_time_in_millis, time_taken, is_empty, is_empty_arr
-import configs.ConfigConstant as Cc
+from utils.Utils import cfg_snapshot, current_time_in_millis, time_taken, is_empty, is_empty_arr
 import utils.Constants as Sc
 from ioservice.HostConfig import HostConfig
 from auditlogging.Auditor import audit_params
@@ -17,7 +16,7 @@ class MoveFilesOnRemote(Uploader):
 
     """
 
-    def __init__(self, files: list):
+    def __init__(self, files: list, job_name: str = None):
         """
         Initiates the required SFTP configurations from 'config.yaml'
         file to prepare for file move
@@ -34,15 +33,18 @@ class MoveFilesOnRemote(Uploader):
         ----------
         files : list
                 a list of files to be moveed on remote host
+        job_name : str
+                   name of a job in ``JOBS`` of configurations whose overrides apply, default None
 
         """
         self._files = files
-        self._srcDir = cfg(Cc.SOURCE_DIRECTORY)
-        self._sftpHost = cfg(Cc.SOURCE_HOST)
-        self._sftpPort = cfg(Cc.SOURCE_PORT)
-        self._sftpUsername = cfg(Cc.SOURCE_USERNAME)
-        self._sftpSecret = cfg(Cc.SOURCE_SECRET)
-        self._destDir = cfg(Cc.ARCHIVE_DIRECTORY)
+        snapshot = cfg_snapshot().job(job_name)
+        self._srcDir = snapshot.source_directory
+        self._sftpHost = snapshot.source_host
+        self._sftpPort = snapshot.source_port
+        self._sftpUsername = snapshot.source_username
+        self._sftpSecret = snapshot.source_secret
+        self._destDir = snapshot.archive_directory
 
     def fromconfig(self, configs: HostConfig):
         self._srcDir = configs.getsrc()
@@ -1,8 +1,7 @@
 import pysftp
 import os
 from ioservice.uploaders.Uploader import Uploader
-from utils.Utils import cfg, current_time_in_millis, time_taken, is_empty, is_empty_arr
-import configs.ConfigConstant as Cc
+from utils.Utils import cfg_snapshot, current_time_in_millis, time_taken, is_empty, is_empty_arr
 import utils.Constants as Sc
 from ioservice.HostConfig import HostConfig
 from auditlogging.Auditor import audit_params
@@ -18,7 +17,7 @@ class RemoteUploader(Uploader):
 
     """
 
-    def __init__(self, files: list):
+    def __init__(self, files: list, job_name: str = None):
         """
         Accepts a list of files for upload operation and transfers to remote destination.
         Connection details retrieved from configurations.
@@ -34,15 +33,18 @@ class RemoteUploader(Uploader):
         Parameters
         ----------
         files : a list of files to be uploaded
+        job_name : str
+                   name of a job in ``JOBS`` of configurations whose overrides apply, default None
 
         """
         self._files = files
-        self._srcDir = cfg(Cc.OUTPUT_DIRECTORY)
-        self._sftpHost = cfg(Cc.SOURCE_HOST)
-        self._sftpPort = cfg(Cc.SOURCE_PORT)
-        self._sftpUsername = cfg(Cc.SOURCE_USERNAME)
-        self._sftpSecret = cfg(Cc.SOURCE_SECRET)
-        self._destDir = cfg(Cc.ARCHIVE_DIRECTORY)
+        snapshot = cfg_snapshot().job(job_name)
+        self._srcDir = snapshot.output_directory
+        self._sftpHost = snapshot.source_host
+        self._sftpPort = snapshot.source_port
+        self._sftpUsername = snapshot.source_username
+        self._sftpSecret = snapshot.source_secret
+        self._destDir = snapshot.archive_directory
 
     def change_dir(self, src: str = None, dest: str = None):
         """
@@ -13,7 +13,10 @@ class Job(metaclass=ABCMeta):
     @abstractmethod
     def goal(self):
         """
-        A subclass must provide implementation for this methods
+        A subclass must provide implementation for this methods.
+        Jobs scheduled on ``AsyncScheduler`` may implement it as a coroutine function (``async def goal(self)``).
+        On ``Scheduler``, a goal may accept optional keyword arguments, ``cancel_token`` (``CancellationToken``)
+        cancelled once the run exceeds its timeout and ``lease`` (``Lease``) when runs are coordinated by a lease store.
 
         """
         raise NotImplementedError
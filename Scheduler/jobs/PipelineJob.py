@@ -0,0 +1,241 @@
+"""
+A job composed of steps with dependencies (a directed acyclic graph), e.g. download, process, upload,
+clean up and notify.
+
+A step starts as soon as all steps it depends on completed, therefore independent branches run in parallel
+on a worker pool and a run takes as long as its critical path (the slowest chain
+of dependent steps) instead of the sum of all steps. A step receives the results of the steps it depends on
+as positional arguments, in the order of ``depends_on``, results are passed in memory. The worker pool
+is created for a run and shut down once the run ends, an idle pipeline holds no threads.
+
+A failed step is retried up to its ``retries``, steps depending on a failed step are not run, independent
+branches still complete. The run then fails with ``PipelineError``. Results of completed steps are kept,
+therefore the next run of the pipeline (e.g. its next fire time) re-runs only failed and not run steps.
+Once all steps complete, the next run starts from scratch.
+
+Examples
+--------
+1. Download files from two sources in parallel, upload the processed files, then clean up and notify.
+
+    | ``pipe = PipelineJob('daily-transfer')``
+    | ``pipe.add_step('sftp', lambda: IOService.download(sftp_downloader))``
+    | ``pipe.add_step('local', lambda: IOService.download(local_downloader))``
+    | ``pipe.add_step('process', lambda a, b: process(a + b), depends_on=('sftp', 'local'))``
+    | ``pipe.add_step('upload', lambda files: IOService.upload(uploader), depends_on=('process',), retries=2)``
+    | ``pipe.add_step('cleanup', lambda files: IOService.cleanup(cleaner), depends_on=('upload',))``
+    | ``pipe.add_step('notify', lambda files: NotificationService.notify(notifier), depends_on=('upload',))``
+    | ``sche.schedule_job(job=pipe, run_continuous=True)``
+
+"""
+
+import queue
+import threading
+
+import utils.Constants as Sc
+from jobs.Job import Job
+from scheduling.CancellationToken import CancellationToken
+from scheduling.WorkerPool import WorkerPool
+from auditlogging.Auditor import audit_params
+from utils.Utils import isnone
+
+
+class PipelineError(Exception):
+    """
+    Raised for a pipeline run in which at least one step failed.
+
+    """
+
+    def __init__(self, job_name: str, failed: dict, not_run: list):
+        super().__init__(Sc.MSG_EX_PIPELINE_FAILED.format(job_name, ', '.join(failed), ', '.join(not_run)))
+        self.failed = failed
+        self.not_run = not_run
+
+
+class _Step:
+
+    __slots__ = ('name', 'fn', 'depends_on', 'retries', 'dependents')
+
+    def __init__(self, name: str, fn, depends_on: tuple, retries: int):
+        self.name = name
+        self.fn = fn
+        self.depends_on = depends_on
+        self.retries = retries
+        self.dependents = []
+
+
+class PipelineJob(Job):
+
+    def __init__(self, job_name: str, max_workers: int = Sc.DEFAULT_MAX_WORKERS):
+        """
+        Creates a pipeline without steps.
+
+        Parameters
+        ----------
+        job_name : str
+                   name of the job
+        max_workers : int
+                      maximum number of steps running at the same time. Default 10
+
+        """
+        if max_workers < 1:
+            raise ValueError(Sc.MSG_EX_ILLEGAL_POOL_SIZE)
+        self._job_name = job_name
+        self._max_workers = max_workers
+        self._steps = {}
+        self._results = {}
+        self._lock = threading.Lock()
+
+    def add_step(self, name: str, fn, depends_on: tuple = (), retries: int = 0):
+        """
+        Adds a step, steps it depends on must be added before.
+
+        Parameters
+        ----------
+        name : str
+               a step identifier, unique within the pipeline
+        fn : callable
+             executed with the results of the steps it depends on, its return value is the result of the step
+        depends_on : tuple
+                     names of the steps which must complete before this step starts
+        retries : int
+                  number of times the step is retried after a failure within one run. Default 0
+
+        Returns
+        --------
+        PipelineJob
+            this pipeline, to chain ``add_step`` calls
+
+        Raises
+        ------
+        ValueError
+            if the name is already taken, a dependency is unknown or retries is negative
+
+        """
+        if name in self._steps:
+            raise ValueError(Sc.MSG_EX_DUPLICATE_STEP.format(name))
+        depends_on = tuple(depends_on)
+        for dependency in depends_on:
+            if dependency not in self._steps:
+                raise ValueError(Sc.MSG_EX_UNKNOWN_STEP.format(dependency, name))
+        if retries < 0:
+            raise ValueError(Sc.MSG_EX_ILLEGAL_RETRIES.format(retries))
+
+        step = _Step(name, fn, depends_on, retries)
+        for dependency in set(depends_on):
+            self._steps[dependency].dependents.append(step)
+        self._steps[name] = step
+        return self
+
+    def goal(self, cancel_token: CancellationToken = None):
+        """
+        Runs all steps which did not complete in a previous run, independent steps in parallel.
+        Once the token is cancelled no more steps are started.
+
+        Raises
+        ------
+        PipelineError
+            if a step failed after its retries, or was not run due to cancellation
+
+        """
+        with self._lock:
+            results, failed = self._run(cancel_token)
+            self._results = results
+            if len(results) < len(self._steps):
+                not_run = [name for name in self._steps if name not in results and name not in failed]
+                raise PipelineError(self._job_name, failed, not_run)
+
+    def name(self) -> str:
+        return self._job_name
+
+    def results(self) -> dict:
+        """
+        Returns
+        --------
+        dict
+            results of the completed steps of the last run, by step name
+
+        """
+        return dict(self._results)
+
+    def reset(self):
+        """
+        Discards results of the last run, the next run runs all steps.
+
+        """
+        with self._lock:
+            self._results = {}
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['_lock'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _run(self, cancel_token: CancellationToken) -> tuple:
+        """
+        Dispatches ready steps to a pool created for this run and collects their outcomes on this thread,
+        a step becomes ready once its last pending dependency completed. The pool is shut down when the run ends,
+        also if a cancelled token stopped it early.
+
+        Returns
+        --------
+        tuple
+            results of completed steps and errors of failed steps, by step name
+
+        """
+        results = {} if len(self._results) == len(self._steps) else dict(self._results)
+        failed = {}
+        pending = {name: sum(1 for d in step.depends_on if d not in results)
+                   for name, step in self._steps.items() if name not in results}
+        if not pending:
+            return results, failed
+
+        pool = WorkerPool(max_workers=self._max_workers, queue_depth=max(len(self._steps), 1),
+                          name=self._job_name + '-Step')
+        try:
+            return self._dispatch(pool, results, failed, pending, cancel_token)
+        finally:
+            pool.shutdown()
+
+    def _dispatch(self, pool: WorkerPool, results: dict, failed: dict, pending: dict,
+                  cancel_token: CancellationToken) -> tuple:
+        outcomes = queue.Queue()
+        attempts = {}
+        in_flight = 0
+
+        def start(step: _Step):
+            nonlocal in_flight
+            attempts[step.name] = attempts.get(step.name, 0) + 1
+            future = pool.submit(step.fn, *(results[d] for d in step.depends_on))
+            future.add_done_callback(lambda f: outcomes.put((step, f)))
+            in_flight += 1
+
+        for name, count in pending.items():
+            if count == 0:
+                start(self._steps[name])
+
+        while in_flight:
+            step, future = outcomes.get()
+            in_flight -= 1
+            cancelled = not isnone(cancel_token) and cancel_token.is_cancelled()
+
+            error = future.exception()
+            if isnone(error):
+                results[step.name] = future.result()
+                for dependent in step.dependents:
+                    pending[dependent.name] -= 1
+                    if pending[dependent.name] == 0 and not cancelled:
+                        start(dependent)
+            elif attempts[step.name] <= step.retries and not cancelled:
+                audit_params(Sc.OPERATION_JOB_RUN, Sc.STATUS_RETRYING, '{}.{} attempt {} failed, retrying: {!r}'
+                             .format(self._job_name, step.name, attempts[step.name], error))
+                start(step)
+            else:
+                failed[step.name] = error
+                audit_params(Sc.OPERATION_JOB_RUN, Sc.STATUS_FAILED,
+                             '{}.{} failed: {!r}'.format(self._job_name, step.name, error))
+
+        return results, failed
@@ -0,0 +1,98 @@
+"""
+A histogram of observed values, e.g. run durations in seconds, in fixed buckets.
+
+Recording a value costs a binary search over the bucket bounds and a few additions, memory does not grow with
+the number of values. Percentiles are estimated by linear interpolation within the bucket they fall into,
+therefore their precision is bound by the width of the bucket.
+
+"""
+
+import bisect
+import threading
+
+import utils.Constants as Sc
+
+
+class Histogram:
+
+    __slots__ = ('_bounds', '_counts', '_count', '_sum', '_min', '_max', '_lock')
+
+    def __init__(self, bounds: tuple = Sc.DEFAULT_METRICS_BUCKETS):
+        """
+        Creates an empty histogram.
+
+        Parameters
+        ----------
+        bounds : tuple
+                 ascending upper bounds (inclusive) of the buckets, values above the last bound are counted
+                 in an additional bucket. Default 1 ms to 1 hour
+
+        """
+        self._bounds = tuple(bounds)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._min = None
+        self._max = None
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        """
+        Records a value.
+
+        """
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            if self._min is None or value < self._min:
+                self._min = value
+            if self._max is None or value > self._max:
+                self._max = value
+
+    def snapshot(self) -> dict:
+        """
+        Retrieves a consistent copy of the histogram.
+
+        Returns
+        --------
+        dict
+            ``count``, ``sum``, ``min``, ``max`` and ``mean`` of the values, estimated ``p50``, ``p90`` and ``p99``
+            and ``buckets``, a list of upper bound and cumulative count pairs ending with ``inf``.
+            Statistics are ``None`` without values
+
+        """
+        with self._lock:
+            counts = list(self._counts)
+            count, total, smallest, largest = self._count, self._sum, self._min, self._max
+
+        cumulative, buckets = 0, []
+        for bound, bucket in zip(self._bounds + (float('inf'),), counts):
+            cumulative += bucket
+            buckets.append((bound, cumulative))
+        return {'count': count,
+                'sum': total,
+                'min': smallest,
+                'max': largest,
+                'mean': total / count if count else None,
+                'p50': self._percentile(buckets, count, smallest, largest, 0.5),
+                'p90': self._percentile(buckets, count, smallest, largest, 0.9),
+                'p99': self._percentile(buckets, count, smallest, largest, 0.99),
+                'buckets': buckets}
+
+    @staticmethod
+    def _percentile(buckets: list, count: int, smallest: float, largest: float, quantile: float):
+        if not count:
+            return None
+        rank = quantile * count
+        lower, below = smallest, 0
+        for bound, cumulative in buckets:
+            if cumulative >= rank:
+                upper = min(bound, largest)
+                lower = max(lower, smallest)
+                if cumulative == below or upper <= lower:
+                    return upper
+                return lower + (upper - lower) * (rank - below) / (cumulative - below)
+            lower, below = bound, cumulative
+        return largest
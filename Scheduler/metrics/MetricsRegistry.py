@@ -0,0 +1,132 @@
+"""
+Collects run metrics per job name in memory, please see ``Scheduler.metrics``.
+
+* ``lateness`` - seconds between the fire time and the start of the job goal
+* ``queue_wait`` - seconds between dispatching the job and the start of the job goal, e.g. waiting for a worker
+* ``duration`` - seconds the job goal ran
+* ``outcomes`` - number of runs by outcome, e.g. ``Complete``, ``Failed``, ``Timed-Out``, ``Skipped``
+
+"""
+
+import threading
+import time
+
+import utils.Constants as Sc
+from metrics.Histogram import Histogram
+
+
+class _JobMetrics:
+
+    __slots__ = ('lateness', 'queue_wait', 'duration', 'outcomes')
+
+    def __init__(self, bounds: tuple):
+        self.lateness = Histogram(bounds)
+        self.queue_wait = Histogram(bounds)
+        self.duration = Histogram(bounds)
+        self.outcomes = {}
+
+
+class RunTimer:
+    """
+    Measures one run of a job, ``start`` is called once the goal starts and ``stop`` once it returned.
+
+    """
+
+    __slots__ = ('_metrics', '_fire_time', '_dispatched', '_started')
+
+    def __init__(self, metrics: _JobMetrics, fire_time: float):
+        self._metrics = metrics
+        self._fire_time = fire_time
+        self._dispatched = time.time()
+        self._started = None
+
+    def start(self):
+        self._started = time.time()
+        self._metrics.lateness.observe(max(0.0, self._started - self._fire_time))
+        self._metrics.queue_wait.observe(max(0.0, self._started - self._dispatched))
+
+    def stop(self):
+        if self._started is not None:
+            self._metrics.duration.observe(time.time() - self._started)
+
+    def wrap(self, fn):
+        """
+        Returns
+        --------
+        callable
+            calls the function between ``start`` and ``stop``
+
+        """
+        def timed(*args, **kwargs):
+            self.start()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.stop()
+
+        return timed
+
+
+class MetricsRegistry:
+
+    def __init__(self, bounds: tuple = Sc.DEFAULT_METRICS_BUCKETS):
+        """
+        Creates an empty registry.
+
+        Parameters
+        ----------
+        bounds : tuple
+                 upper bounds in seconds of the histogram buckets, please see ``Histogram``
+
+        """
+        self._bounds = bounds
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def timer(self, job_name: str, fire_time: float) -> RunTimer:
+        """
+        Creates a timer of a run being dispatched now.
+
+        Parameters
+        ----------
+        job_name : str
+                   name of the job
+        fire_time : float
+                    fire time of the run in seconds since epoch
+
+        """
+        return RunTimer(self._job(job_name), fire_time)
+
+    def count(self, job_name: str, outcome: str):
+        """
+        Counts a run by its outcome, e.g. ``Complete`` or ``Failed``.
+
+        """
+        metrics = self._job(job_name)
+        with self._lock:
+            metrics.outcomes[outcome] = metrics.outcomes.get(outcome, 0) + 1
+
+    def snapshot(self) -> dict:
+        """
+        Returns
+        --------
+        dict
+            job name to ``lateness``, ``queue_wait`` and ``duration`` histograms (please see ``Histogram.snapshot``)
+            and number of runs by outcome in ``outcomes``
+
+        """
+        with self._lock:
+            jobs = list(self._jobs.items())
+            outcomes = {name: dict(metrics.outcomes) for name, metrics in jobs}
+        return {name: {'lateness': metrics.lateness.snapshot(),
+                       'queue_wait': metrics.queue_wait.snapshot(),
+                       'duration': metrics.duration.snapshot(),
+                       'outcomes': outcomes[name]}
+                for name, metrics in jobs}
+
+    def _job(self, job_name: str) -> _JobMetrics:
+        metrics = self._jobs.get(job_name)
+        if metrics is None:
+            with self._lock:
+                metrics = self._jobs.setdefault(job_name, _JobMetrics(self._bounds))
+        return metrics
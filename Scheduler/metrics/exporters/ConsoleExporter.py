@@ -0,0 +1,59 @@
+import threading
+
+import utils.Constants as Sc
+from metrics.exporters.MetricsExporter import MetricsExporter
+
+
+class ConsoleExporter(MetricsExporter):
+    """
+    Prints a line per job with its outcomes and lateness, queue wait and duration percentiles on console,
+    every ``interval`` seconds and once more on stop.
+
+    """
+
+    def __init__(self, interval: float = Sc.DEFAULT_METRICS_INTERVAL):
+        """
+        Parameters
+        ----------
+        interval : float
+                   seconds between two prints. Default 60
+
+        """
+        if interval <= 0:
+            raise ValueError(Sc.MSG_EX_ILLEGAL_METRICS_INTERVAL.format(interval))
+        self._interval = interval
+        self._scheduler = None
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self, scheduler):
+        self._scheduler = scheduler
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name='Metrics-Console', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        self.print()
+
+    def print(self):
+        for name, metrics in sorted(self._scheduler.metrics().items()):
+            outcomes = ', '.join('{}={}'.format(outcome, count)
+                                 for outcome, count in sorted(metrics['outcomes'].items()))
+            print(Sc.MSG_METRICS_JOB.format(name, outcomes, ConsoleExporter._format(metrics['lateness']),
+                                            ConsoleExporter._format(metrics['queue_wait']),
+                                            ConsoleExporter._format(metrics['duration'])))
+
+    def _run(self):
+        while not self._stopped.wait(self._interval):
+            self.print()
+
+    @staticmethod
+    def _format(histogram: dict) -> str:
+        if not histogram['count']:
+            return '-'
+        return 'p50={:.3f}s p99={:.3f}s max={:.3f}s'.format(histogram['p50'], histogram['p99'], histogram['max'])
@@ -0,0 +1,30 @@
+from abc import ABCMeta, abstractmethod
+
+
+class MetricsExporter(metaclass=ABCMeta):
+    """
+    Provides a template to a subclass to publish run metrics of a scheduler, e.g. print them periodically
+    or serve them to a monitoring system
+
+    """
+
+    @abstractmethod
+    def start(self, scheduler):
+        """
+        A subclass must provide implementation to start publishing metrics.
+
+        Parameters
+        ----------
+        scheduler : Scheduler
+                    the started scheduler, e.g. its ``metrics``, ``run_stats`` and ``pool_stats``
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def stop(self):
+        """
+        A subclass must provide implementation to stop publishing metrics, it is called on scheduler shutdown.
+
+        """
+        raise NotImplementedError
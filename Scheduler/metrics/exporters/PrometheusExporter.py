@@ -0,0 +1,226 @@
+"""
+Serves metrics of a scheduler in the Prometheus text format, e.g. ``http://localhost:9100/metrics``.
+
+Requests are served by an HTTP server on background threads, a scrape reads a snapshot of the scheduler state
+and never blocks the dispatch loop.
+
++-------------------------------------------------+-------------+----------------------------------------------+
+|  Metric                                         |  Type       |  Description                                 |
++=================================================+=============+==============================================+
+|  scheduler_jobs                                 |  gauge      |  number of scheduled jobs                    |
++-------------------------------------------------+-------------+----------------------------------------------+
+|  scheduler_job_next_run_timestamp_seconds       |  gauge      |  next fire time per job                      |
++-------------------------------------------------+-------------+----------------------------------------------+
+|  scheduler_job_runs_total                       |  counter    |  runs per job and outcome                    |
++-------------------------------------------------+-------------+----------------------------------------------+
+|  scheduler_job_duration_seconds                 |  histogram  |  run duration per job                        |
++-------------------------------------------------+-------------+----------------------------------------------+
+|  scheduler_job_lateness_seconds                 |  histogram  |  fire time to start of the goal per job      |
++-------------------------------------------------+-------------+----------------------------------------------+
+|  scheduler_pool_workers                         |  gauge      |  maximum workers per execution mode          |
++-------------------------------------------------+-------------+----------------------------------------------+
+|  scheduler_pool_active_workers                  |  gauge      |  workers running a job per execution mode    |
++-------------------------------------------------+-------------+----------------------------------------------+
+|  scheduler_pool_utilisation_ratio               |  gauge      |  active workers / maximum workers            |
++-------------------------------------------------+-------------+----------------------------------------------+
+|  scheduler_pool_queued                          |  gauge      |  firings waiting for a worker                |
++-------------------------------------------------+-------------+----------------------------------------------+
+|  scheduler_audit_queue_depth                    |  gauge      |  audit trails not yet captured by all agents |
++-------------------------------------------------+-------------+----------------------------------------------+
+|  scheduler_audit_trails_total                   |  counter    |  trails per outcome in asynchronous mode     |
++-------------------------------------------------+-------------+----------------------------------------------+
+|  scheduler_io_transferred_bytes_total           |  counter    |  bytes downloaded and uploaded by IOService  |
++-------------------------------------------------+-------------+----------------------------------------------+
+|  scheduler_io_transfer_seconds_total            |  counter    |  seconds spent downloading and uploading     |
++-------------------------------------------------+-------------+----------------------------------------------+
+|  scheduler_io_bytes_per_second                  |  gauge      |  throughput of the last download and upload  |
++-------------------------------------------------+-------------+----------------------------------------------+
+
+All metrics are labelled with the ``scheduler`` instance id.
+
+Example
+--------
+1.  sche.start(metrics_port=9100)
+2.  sche = Scheduler(metrics_exporter=PrometheusExporter(port=9100, host='0.0.0.0'))
+
+"""
+
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import utils.Constants as Sc
+import ioservice.IOService as IOService
+from auditlogging import Auditor
+from metrics.exporters.MetricsExporter import MetricsExporter
+
+_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value) -> str:
+    if value is None:
+        return 'NaN'
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Rendering:
+    """
+    Builds the text of one scrape, samples of a metric follow its help and type.
+
+    """
+
+    def __init__(self, scheduler_id: str):
+        self._scheduler_id = scheduler_id
+        self._lines = []
+
+    def family(self, name: str, kind: str, help_text: str):
+        self._lines.append('# HELP {} {}'.format(name, help_text))
+        self._lines.append('# TYPE {} {}'.format(name, kind))
+
+    def sample(self, name: str, value, **labels):
+        labels = dict(scheduler=self._scheduler_id, **labels)
+        self._lines.append('{}{{{}}} {}'.format(name, ','.join('{}="{}"'.format(key, _escape(label))
+                                                                for key, label in labels.items()), _number(value)))
+
+    def histogram(self, name: str, snapshot: dict, **labels):
+        for bound, cumulative in snapshot['buckets']:
+            self.sample(name + '_bucket', cumulative, le=_number(bound), **labels)
+        self.sample(name + '_sum', snapshot['sum'], **labels)
+        self.sample(name + '_count', snapshot['count'], **labels)
+
+    def text(self) -> str:
+        return '\n'.join(self._lines) + '\n'
+
+
+class PrometheusExporter(MetricsExporter):
+
+    def __init__(self, port: int = Sc.DEFAULT_METRICS_PORT, host: str = Sc.DEFAULT_METRICS_HOST):
+        """
+        Parameters
+        ----------
+        port : int
+               port to listen on, ``0`` picks a free port (please see ``address``). Default 9100
+        host : str
+               address to listen on. Default ``127.0.0.1``, i.e. scrapes from localhost only
+
+        """
+        self._address = (host, port)
+        self._scheduler = None
+        self._server = None
+        self._thread = None
+
+    def start(self, scheduler):
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', _CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, message_format, *args):
+                pass
+
+        self._scheduler = scheduler
+        self._server = ThreadingHTTPServer(self._address, Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name='Metrics-Prometheus', daemon=True)
+        self._thread.start()
+        print(Sc.MSG_METRICS_SERVING.format(*self.address()))
+
+    def stop(self):
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def address(self) -> tuple:
+        """
+        Returns
+        --------
+        tuple
+            host and port the server listens on, ``None`` if not started
+
+        """
+        return None if self._server is None else self._server.server_address[:2]
+
+    def render(self) -> str:
+        """
+        Renders current metrics of the scheduler in the Prometheus text format.
+
+        """
+        scheduler = self._scheduler
+        out = _Rendering(scheduler.instance_id())
+        stats = scheduler.run_stats()
+        metrics = scheduler.metrics()
+
+        out.family('scheduler_jobs', 'gauge', 'Number of scheduled jobs.')
+        out.sample('scheduler_jobs', len(stats))
+
+        out.family('scheduler_job_next_run_timestamp_seconds', 'gauge', 'Next fire time of the job.')
+        for name, job in sorted(stats.items()):
+            if job['next_run'] is not None:
+                out.sample('scheduler_job_next_run_timestamp_seconds', job['next_run'], job=name)
+
+        out.family('scheduler_job_runs_total', 'counter', 'Runs of the job by outcome.')
+        for name, job in sorted(metrics.items()):
+            for outcome, count in sorted(job['outcomes'].items()):
+                out.sample('scheduler_job_runs_total', count, job=name, outcome=outcome)
+
+        for histogram, help_text in (('duration', 'Run duration of the job.'),
+                                     ('lateness', 'Seconds between fire time and start of the job goal.')):
+            family = 'scheduler_job_{}_seconds'.format(histogram)
+            out.family(family, 'histogram', help_text)
+            for name, job in sorted(metrics.items()):
+                out.histogram(family, job[histogram], job=name)
+
+        pools = [(execution, scheduler.pool_stats(execution)) for execution in (Sc.EXECUTION_THREAD,
+                                                                                 Sc.EXECUTION_PROCESS)]
+        pools = [(execution, pool) for execution, pool in pools if pool]
+        for family, kind, help_text in (('scheduler_pool_workers', 'gauge', 'Maximum number of workers.'),
+                                        ('scheduler_pool_active_workers', 'gauge', 'Workers running a job.'),
+                                        ('scheduler_pool_utilisation_ratio', 'gauge',
+                                         'Active workers per maximum number of workers.'),
+                                        ('scheduler_pool_queued', 'gauge', 'Firings waiting for a free worker.')):
+            out.family(family, kind, help_text)
+            for execution, pool in pools:
+                value = {'scheduler_pool_workers': pool['max_workers'],
+                         'scheduler_pool_active_workers': pool['active'],
+                         'scheduler_pool_utilisation_ratio': pool['active'] / pool['max_workers'],
+                         'scheduler_pool_queued': pool['queued']}[family]
+                out.sample(family, value, execution=execution)
+
+        out.family('scheduler_audit_queue_depth', 'gauge', 'Audit trails not yet captured by all agents.')
+        out.sample('scheduler_audit_queue_depth', Auditor.queue_depth())
+        audit = Auditor.queue_stats()
+        out.family('scheduler_audit_trails_total', 'counter', 'Audit trails captured, dropped or failed to capture.')
+        for outcome in ('captured', 'dropped', 'failed') if audit else ():
+            out.sample('scheduler_audit_trails_total', audit[outcome], outcome=outcome)
+
+        transfers = sorted(IOService.transfer_stats().items())
+        for family, kind, key, help_text in (
+                ('scheduler_io_transferred_bytes_total', 'counter', 'bytes', 'Bytes transferred by IOService.'),
+                ('scheduler_io_transfer_seconds_total', 'counter', 'seconds', 'Seconds spent transferring files.'),
+                ('scheduler_io_bytes_per_second', 'gauge', 'bytes_per_second', 'Throughput of the last transfer.')):
+            out.family(family, kind, help_text)
+            for operation, transfer in transfers:
+                if transfer[key] is not None:
+                    out.sample(family, transfer[key], operation=operation.lower())
+
+        return out.text()
@@ -6,7 +6,7 @@ from email.mime.text import MIMEText
 from email.utils import COMMASPACE, formatdate
 
 from notification.notifiers.Notifier import Notifier
-from utils.Utils import cfg
+from utils.Utils import cfg_snapshot
 import configs.ConfigConstant as Cc
 import utils.Constants as Sc
 
@@ -18,7 +18,7 @@ class EmailNotifier(Notifier):
 
     """
 
-    def __init__(self, attachments=None):
+    def __init__(self, attachments=None, job_name: str = None):
         """
         The details required to send an email are retrieved from configurations. Optionally caller can provide
         attachments for the email notification
@@ -34,9 +34,11 @@ class EmailNotifier(Notifier):
         ----------
         attachments : object
                      a list of file paths to be attached to a message, default None
+        job_name : str
+                   name of a job in ``JOBS`` of configurations whose overrides apply, default None
 
         """
-        email_stuff = cfg(Cc.NOTIFICATIONS)[0]
+        email_stuff = cfg_snapshot().job(job_name).notifications[0]
 
         self._host = email_stuff.get(Cc.SMTP_HOST)
         self._port = email_stuff.get(Cc.SMTP_PORT)
@@ -0,0 +1,284 @@
+"""
+This module provides an ``asyncio`` based scheduler for I/O bound jobs.
+
+``AsyncScheduler`` runs on an event loop instead of threads. A job whose ``goal`` is a coroutine function
+(``async def goal(self)``) is awaited on the loop, every other job is executed in an executor.
+Therefore thousands of jobs waiting on I/O run concurrently without one thread each.
+Schedules follow the same ``ScheduleConfig`` semantics (every, at, time unit or cron) as ``Scheduler``.
+
+Examples
+--------
+1. Schedule a coroutine job which runs every 10 seconds.
+
+    | ``sche = AsyncScheduler()``
+    | ``sche.schedule_job(job=PollJob(), schedule_config=ScheduleConfig(every=10, time_unit=Sc.SECONDS),``
+    |                     ``run_continuous=True)``
+    | ``sche.start()``
+
+2. Run the scheduler inside an already running event loop.
+
+    | ``await sche.run()``
+
+"""
+
+import asyncio
+import datetime
+import heapq
+import itertools
+import time
+
+import utils.Constants as Sc
+from scheduling.ScheduleConfig import ScheduleConfig
+from scheduling.ScheduledJob import ScheduledJob
+from scheduling.Trigger import compile_schedule
+from utils.Utils import cfg_snapshot, is_valid_implementation, isnone
+from jobs.Job import Job
+import auditlogging.Auditor as Auditor
+from auditlogging.Auditor import audit_params
+
+
+class AsyncScheduler:
+
+    def __init__(self, executor=None, max_concurrency: int = None):
+        """
+        Initiates a scheduler with its own job list. Scheduler interval and time unit retrieved from configurations.
+
+        Parameters
+        ----------
+        executor : concurrent.futures.Executor
+                    executor used to run jobs having a regular (non coroutine) ``goal``.
+                    Default event loop executor
+        max_concurrency : int
+                          maximum number of jobs running at the same time. Default unlimited
+
+        """
+        snapshot = cfg_snapshot()
+        self._every = snapshot.every
+        self._unit = snapshot.time_unit
+        self._at_time = snapshot.at
+        self._cron = snapshot.cron
+        self._heap = []
+        self._counter = itertools.count()
+        self._executor = executor
+        self._max_concurrency = max_concurrency
+        self._semaphore = None
+        self._run_continuous = False
+        self._loop = None
+        self._wakeup = None
+        self._tasks = set()
+        self._shutdown_requested = False
+        self._force = False
+
+    def schedule_job(self, job: Job, schedule_config: ScheduleConfig = None, run_continuous: bool = False,
+                     max_instances: int = None, overlap_policy: str = None,
+                     misfire_grace_time: float = Sc.DEFAULT_MISFIRE_GRACE_TIME, catch_up: str = Sc.DEFAULT_CATCH_UP,
+                     last_run: float = None):
+        """
+        Schedules a job. The job ``goal`` may be a coroutine function or a regular function.
+
+        Parameters
+        ----------
+        job : Job
+              an instance of custom implementation of the ``Job`` module
+        schedule_config : ScheduleConfig
+                        overrides ``every`` or ``at`` and ``time_unit`` of the configurations for this job
+        run_continuous : bool
+                        if ``True`` the scheduler will continuously run jobs as per schedule,
+                        run jobs once otherwise
+        max_instances : int
+                        maximum number of runs of the job at the same time, please see ``Scheduler.schedule_job``
+        overlap_policy : str
+                         ``skip-if-running`` or ``coalesce``, please see ``Scheduler.schedule_job``
+        misfire_grace_time : float
+                             please see ``Scheduler.schedule_job``
+        catch_up : str
+                   ``once``, ``all`` or ``skip``, please see ``Scheduler.schedule_job``
+        last_run : float
+                   please see ``Scheduler.schedule_job``
+
+        Raises
+        ------
+        ValueError
+            If values for every and at are provided (both), the overlap limits or misfire handling are invalid,
+            then this rejects scheduling the job
+
+        """
+        if not is_valid_implementation(job, Job):
+            raise Exception(Sc.MSG_EX_ILLEGAL_JOB)
+
+        if isnone(schedule_config):
+            trigger = compile_schedule(self._every, self._unit, self._at_time, self._cron)
+        elif not schedule_config.is_valid():
+            raise ValueError(Sc.MSG_EX_INVALID_SCHEDULE_CONFIG)
+        else:
+            trigger = schedule_config.trigger()
+
+        scheduled = ScheduledJob(job, trigger, Sc.EXECUTION_ASYNC, trigger.next_fire(time.time()),
+                                 max_instances, overlap_policy, misfire_grace_time, catch_up, last_run)
+        self._run_continuous = run_continuous
+
+        audit_params(Sc.OPERATION_SCHEDULE, Sc.STATUS_SCHEDULING, 'Scheduling an async job')
+
+        heapq.heappush(self._heap, (scheduled.deadline, next(self._counter), scheduled))
+
+        audit_params(Sc.OPERATION_SCHEDULE, Sc.STATUS_SCHEDULED,
+                     'An async job scheduled. Summary (Trigger={!r}, MaxInstances={}, OverlapPolicy={}, '
+                     'RunningContinuously={})'
+                     .format(trigger, scheduled.max_instances, scheduled.overlap_policy, run_continuous))
+
+        self._wake()
+
+    def cancel_job(self, job_name: str):
+        """
+        Cancels a job from scheduler. Calling this methods has no effect, if scheduler shutdown is requested.
+
+        Parameters
+        ----------
+        job_name : str
+                   a job identifier set during a job schedule
+
+        """
+        if not isnone(job_name) and not self._shutdown_requested:
+            for _, _, scheduled in self._heap:
+                if scheduled.name == job_name:
+                    scheduled.cancelled = True
+            self._wake()
+
+    def what_is_next_run(self):
+        """
+        Retrieves next job run schedule
+
+        Returns
+        --------
+        datetime
+            next run schedule, ``None`` if no job is scheduled
+
+        """
+        scheduled = self._peek()
+        return None if isnone(scheduled) else datetime.datetime.fromtimestamp(scheduled.deadline)
+
+    def running(self) -> int:
+        """
+        Returns
+        -------
+        int
+            number of jobs running at the moment
+
+        """
+        return len(self._tasks)
+
+    def start(self):
+        """
+        Starts a new event loop and blocks until the scheduler is shutdown.
+        Please use ``await run()`` if an event loop is already running.
+
+        """
+        asyncio.run(self.run())
+
+    async def run(self):
+        """
+        Runs the scheduler on the current event loop until ``shutdown`` is requested.
+        If ``run_continuous`` is false, all jobs run once. Queued audit trails are flushed before it returns.
+
+        """
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        if not isnone(self._max_concurrency):
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        audit_params(Sc.OPERATION_START_JOBS, Sc.STATUS_STARTED, 'Async scheduled jobs started')
+
+        if not self._run_continuous:
+            for _, _, scheduled in self._heap:
+                if not scheduled.cancelled:
+                    self._launch(scheduled)
+        else:
+            while not self._shutdown_requested:
+                self._wakeup.clear()
+                scheduled = self._peek()
+                idle = None if isnone(scheduled) else scheduled.deadline - time.time()
+                if isnone(idle):
+                    await self._wakeup.wait()
+                elif idle > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), idle)
+                    except asyncio.TimeoutError:
+                        pass
+                else:
+                    heapq.heappop(self._heap)
+                    if scheduled.begin(time.time()):
+                        self._launch(scheduled)
+                    else:
+                        audit_params(Sc.OPERATION_JOB_RUN, Sc.STATUS_MISFIRED,
+                                     '{} missed its fire time by {:.3f} seconds, catch up policy {}'
+                                     .format(scheduled.name, -idle, scheduled.catch_up))
+                    if scheduled.advance(time.time()) != float('inf'):
+                        heapq.heappush(self._heap, (scheduled.deadline, next(self._counter), scheduled))
+
+        if self._force:
+            for task in self._tasks:
+                task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        self._heap.clear()
+        audit_params(Sc.OPERATION_SHUTDOWN, Sc.STATUS_COMPLETE, Sc.MSG_SCHEDULER_SHUTDOWN_COMPLETE)
+        await self._loop.run_in_executor(None, Auditor.flush)
+
+    def shutdown(self, force: bool = False):
+        """
+        Requests the scheduler to shutdown. This method is thread safe.
+
+        Parameters
+        ----------
+        force : bool
+                if ``True`` running coroutine jobs are cancelled, otherwise ``run`` returns once they complete
+
+        """
+        audit_params(Sc.OPERATION_SHUTDOWN, Sc.STATUS_STARTING, Sc.MSG_SHUTTING_DOWN_SCHEDULER + ' Force=' + str(force))
+        self._force = force
+        self._shutdown_requested = True
+        self._wake()
+
+    def _peek(self):
+        while self._heap and self._heap[0][2].cancelled:
+            heapq.heappop(self._heap)
+        return self._heap[0][2] if self._heap else None
+
+    def _wake(self):
+        if not isnone(self._loop) and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def _launch(self, scheduled: ScheduledJob):
+        if not scheduled.acquire():
+            audit_params(Sc.OPERATION_JOB_RUN, Sc.STATUS_SKIPPED,
+                         '{} skipped, {} run(s) in progress, overlap policy {}'
+                         .format(scheduled.name, scheduled.running, scheduled.overlap_policy))
+            return
+
+        task = self._loop.create_task(self._execute(scheduled.job))
+        self._tasks.add(task)
+        task.add_done_callback(lambda t: self._complete(t, scheduled))
+
+    def _complete(self, task, scheduled: ScheduledJob):
+        self._tasks.discard(task)
+        if scheduled.release() and not self._shutdown_requested:
+            self._launch(scheduled)
+
+    async def _execute(self, job: Job):
+        if isnone(self._semaphore):
+            await self._execute_goal(job)
+        else:
+            async with self._semaphore:
+                await self._execute_goal(job)
+
+    async def _execute_goal(self, job: Job):
+        try:
+            if asyncio.iscoroutinefunction(job.goal):
+                await job.goal()
+            else:
+                await self._loop.run_in_executor(self._executor, job.goal)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            audit_params(Sc.OPERATION_JOB_RUN, Sc.STATUS_FAILED, job.name() + ' failed: ' + repr(e))
@@ -0,0 +1,88 @@
+import threading
+
+import utils.Constants as Sc
+
+
+class JobTimeoutError(TimeoutError):
+    """
+    Raised for a job run which did not complete within its timeout.
+
+    """
+
+    def __init__(self, timeout: float):
+        super().__init__(Sc.MSG_EX_JOB_TIMED_OUT.format(timeout))
+        self.timeout = timeout
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation of a job run. A job goal accepting a ``cancel_token`` keyword argument
+    receives a token, which is cancelled once the run exceeds its timeout. A long running goal should check
+    the token between steps, or wait on it instead of sleeping, and return early when cancelled.
+
+    Example
+    --------
+    1.  def goal(self, cancel_token=None):
+            for file in files:
+                if cancel_token is not None and cancel_token.is_cancelled():
+                    return
+                download(file)
+
+    """
+
+    __slots__ = ('_event',)
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        """
+        Requests cancellation, calling this method more than once has no effect.
+
+        """
+        self._event.set()
+
+    def is_cancelled(self) -> bool:
+        """
+        Returns
+        --------
+        bool
+            ``True`` if cancellation has been requested
+
+        """
+        return self._event.is_set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Blocks until cancellation is requested or the timeout elapses, a cancellable replacement of ``time.sleep``.
+
+        Parameters
+        ----------
+        timeout : float
+                  seconds to wait, ``None`` waits until cancelled
+
+        Returns
+        --------
+        bool
+            ``True`` if cancellation has been requested
+
+        """
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self):
+        """
+        Raises
+        ------
+        CancelledError
+                if cancellation has been requested
+
+        """
+        if self._event.is_set():
+            raise CancelledError(Sc.MSG_EX_JOB_CANCELLED)
+
+
+class CancelledError(Exception):
+    """
+    Raised by a job goal which stopped as its run has been cancelled.
+
+    """
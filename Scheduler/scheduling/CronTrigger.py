@@ -0,0 +1,259 @@
+"""
+A cron expression trigger.
+
+The expression is parsed once into bitsets, one integer per field where bit ``n`` is set if value ``n`` matches.
+The next fire time is found by jumping to the next set bit of the month, day, hour and minute fields
+instead of scanning minute by minute, therefore it costs a handful of integer operations.
+
+Syntax
+------
+``minute hour day-of-month month day-of-week``
+
++----------------+-----------+-------------------------------------------+
+|  Field         |  Values   |  Special                                  |
++================+===========+===========================================+
+|  minute        |  0-59     |  ``*`` ``,`` ``-`` ``/``                  |
++----------------+-----------+-------------------------------------------+
+|  hour          |  0-23     |  ``*`` ``,`` ``-`` ``/``                  |
++----------------+-----------+-------------------------------------------+
+|  day-of-month  |  1-31     |  ``*`` ``?`` ``,`` ``-`` ``/`` ``L`` ``LW``|
++----------------+-----------+-------------------------------------------+
+|  month         |  1-12     |  ``*`` ``,`` ``-`` ``/`` JAN-DEC          |
++----------------+-----------+-------------------------------------------+
+|  day-of-week   |  0-7      |  ``*`` ``?`` ``,`` ``-`` ``/`` SUN-SAT    |
++----------------+-----------+-------------------------------------------+
+
+* ``L`` is the last day of the month, ``LW`` the last business day (Monday to Friday) of the month.
+* Sunday is either 0 or 7.
+* As in standard cron, if both day-of-month and day-of-week are restricted, a day matching either fires.
+* Macros ``@yearly``, ``@annually``, ``@monthly``, ``@weekly``, ``@daily``, ``@midnight`` and ``@hourly``.
+
+Examples
+--------
+| 1. ``*/15 8-17 * * MON-FRI`` every 15 minutes from 08:00 to 17:45 on weekdays
+| 2. ``0 18 LW * *`` at 18:00 on the last business day of the month
+| 3. ``30 6 1,15 * *`` at 06:30 on the 1st and the 15th of every month
+
+"""
+
+import calendar
+import datetime
+
+import utils.Constants as Sc
+from scheduling.Trigger import Trigger
+
+_MACROS = {'@yearly': '0 0 1 1 *',
+           '@annually': '0 0 1 1 *',
+           '@monthly': '0 0 1 * *',
+           '@weekly': '0 0 * * 0',
+           '@daily': '0 0 * * *',
+           '@midnight': '0 0 * * *',
+           '@hourly': '0 * * * *'}
+
+_MONTHS = {name.upper(): number for number, name in enumerate(calendar.month_abbr) if name}
+_WEEKDAYS = {'SUN': 0, 'MON': 1, 'TUE': 2, 'WED': 3, 'THU': 4, 'FRI': 5, 'SAT': 6}
+
+# a fire time is searched within this number of years, an expression like '0 0 30 2 *' never fires
+_SEARCH_YEARS = 8
+
+
+def _next_bit(mask: int, start: int):
+    """
+    Returns the lowest set bit of mask which is greater than or equal to start, ``None`` otherwise.
+
+    """
+    remaining = mask >> start
+    if remaining == 0:
+        return None
+    return start + (remaining & -remaining).bit_length() - 1
+
+
+class CronTrigger(Trigger):
+    """
+    Fires as per a cron expression, please see module documentation for the syntax.
+
+    """
+
+    __slots__ = ('_expression', '_minutes', '_hours', '_days', '_months', '_weekdays',
+                 '_last_day', '_last_business_day', '_day_or', '_weekday_masks')
+
+    def __init__(self, expression: str):
+        """
+        Parses and compiles the expression.
+
+        Parameters
+        ----------
+        expression : str
+                     a cron expression having 5 fields or a macro
+
+        Raises
+        ------
+        ValueError
+                if the expression is invalid or never fires
+
+        """
+        expression = ' '.join(str(expression).split())
+        fields = _MACROS.get(expression.lower(), expression).split(' ')
+        if len(fields) != 5:
+            raise ValueError(Sc.MSG_EX_ILLEGAL_CRON.format(expression))
+
+        minute, hour, day, month, weekday = fields
+        day = day.upper()
+        last_day = day == 'L'
+        last_business_day = day == 'LW'
+        weekdays = _parse(weekday, 0, 7, _WEEKDAYS, expression)
+        if weekdays >> 7 & 1:
+            weekdays = (weekdays | 1) & 0x7f
+
+        self._set('_expression', expression)
+        self._set('_minutes', _parse(minute, 0, 59, {}, expression))
+        self._set('_hours', _parse(hour, 0, 23, {}, expression))
+        self._set('_days', 0 if last_day or last_business_day else _parse(day, 1, 31, {}, expression))
+        self._set('_months', _parse(month, 1, 12, _MONTHS, expression))
+        self._set('_weekdays', weekdays)
+        self._set('_last_day', last_day)
+        self._set('_last_business_day', last_business_day)
+        self._set('_day_or', not _is_any(day) and not _is_any(weekday))
+        self._set('_weekday_masks', self._weekday_day_masks())
+
+        if self._find(datetime.datetime(2000, 1, 1)) is None:
+            raise ValueError(Sc.MSG_EX_CRON_NEVER_FIRES.format(expression))
+
+    def next_fire(self, after: float) -> float:
+        moment = datetime.datetime.fromtimestamp(after).replace(second=0, microsecond=0)
+        found = self._find(moment + datetime.timedelta(minutes=1))
+        return float('inf') if found is None else found.timestamp()
+
+    def period(self) -> float:
+        first = self._find(datetime.datetime(2001, 1, 1))
+        second = self._find(first + datetime.timedelta(minutes=1))
+        return (second - first).total_seconds()
+
+    def expression(self) -> str:
+        return self._expression
+
+    def _key(self) -> tuple:
+        return self._expression,
+
+    def _set(self, name, value):
+        object.__setattr__(self, name, value)
+
+    def _weekday_day_masks(self) -> tuple:
+        """
+        Precomputes, for every weekday of the 1st of a month (Monday = 0), a bitset of the days of month
+        which match the day-of-week field.
+
+        """
+        masks = []
+        for first_weekday in range(7):
+            mask = 0
+            for day in range(1, 32):
+                cron_weekday = (first_weekday + day) % 7
+                if self._weekdays >> cron_weekday & 1:
+                    mask |= 1 << day
+            masks.append(mask)
+        return tuple(masks)
+
+    def _day_mask(self, year: int, month: int) -> int:
+        """
+        Bitset of the matching days of the month, bit ``n`` for day ``n``.
+
+        """
+        first_weekday, last = calendar.monthrange(year, month)
+        valid = (1 << (last + 1)) - 2
+
+        days = self._days
+        if self._last_day:
+            days = 1 << last
+        elif self._last_business_day:
+            last_weekday = (first_weekday + last - 1) % 7
+            days = 1 << (last - max(0, last_weekday - 4))
+
+        weekdays = self._weekday_masks[first_weekday]
+        if self._day_or:
+            return (days | weekdays) & valid
+        return days & weekdays & valid
+
+    def _find(self, moment: datetime.datetime):
+        """
+        Finds the first matching minute at or after the moment by jumping over non matching
+        months, days, hours and minutes.
+
+        """
+        year, month, day, hour, minute = moment.year, moment.month, moment.day, moment.hour, moment.minute
+        end_year = min(year + _SEARCH_YEARS, datetime.MAXYEAR)
+
+        while year <= end_year:
+            next_month = _next_bit(self._months, month)
+            if next_month is None:
+                year, month, day, hour, minute = year + 1, 1, 1, 0, 0
+                continue
+            if next_month != month:
+                month, day, hour, minute = next_month, 1, 0, 0
+
+            next_day = _next_bit(self._day_mask(year, month), day)
+            if next_day is None:
+                year, month, day, hour, minute = (year, month + 1, 1, 0, 0) if month < 12 else (year + 1, 1, 1, 0, 0)
+                continue
+            if next_day != day:
+                day, hour, minute = next_day, 0, 0
+
+            next_hour = _next_bit(self._hours, hour)
+            if next_hour is None:
+                hour, minute = 24, 0
+            elif next_hour != hour:
+                hour, minute = next_hour, 0
+
+            next_minute = None if hour == 24 else _next_bit(self._minutes, minute)
+            if next_minute is None:
+                following = datetime.datetime(year, month, day) + datetime.timedelta(hours=min(hour, 23) + 1)
+                year, month, day, hour, minute = \
+                    following.year, following.month, following.day, following.hour, 0
+                continue
+
+            return datetime.datetime(year, month, day, hour, next_minute)
+
+        return None
+
+
+def _is_any(field: str) -> bool:
+    return field in ('*', '?')
+
+
+def _parse(field: str, low: int, high: int, names: dict, expression: str) -> int:
+    """
+    Parses one cron field into a bitset.
+
+    """
+    mask = 0
+    for part in field.upper().split(','):
+        step = 1
+        if '/' in part:
+            part, step = part.split('/', 1)
+            step = _value(step, {}, expression)
+            if step < 1:
+                raise ValueError(Sc.MSG_EX_ILLEGAL_CRON.format(expression))
+
+        if part in ('*', '?'):
+            start, end = low, high
+        elif '-' in part:
+            start, end = (_value(v, names, expression) for v in part.split('-', 1))
+        else:
+            start = _value(part, names, expression)
+            end = high if step > 1 else start
+
+        if start < low or end > high or start > end:
+            raise ValueError(Sc.MSG_EX_ILLEGAL_CRON.format(expression))
+
+        for value in range(start, end + 1, step):
+            mask |= 1 << value
+
+    return mask
+
+
+def _value(value: str, names: dict, expression: str) -> int:
+    if value in names:
+        return names[value]
+    if not value.isdigit():
+        raise ValueError(Sc.MSG_EX_ILLEGAL_CRON.format(expression))
+    return int(value)
@@ -0,0 +1,362 @@
+"""
+An event driven dispatch engine for scheduled jobs.
+
+Every scheduled job is kept in an index ordered by its next fire time, jobs due at the same time are
+ordered by priority, therefore a burst of low priority jobs does not delay a high priority one.
+The dispatch loop sleeps exactly until the earliest deadline and wakes early on a ``threading.Condition``
+whenever a job is added or cancelled, therefore jobs fire on time and an idle scheduler does not wake up at all.
+
+The default index is a min-heap, insert and expiry cost O(log n). For very large numbers of jobs
+a ``TimingWheel`` index costs O(1) instead.
+
+"""
+
+import datetime
+import heapq
+import itertools
+import threading
+import time
+
+from scheduling.ScheduledJob import ScheduledJob
+
+# a trigger returns this as next fire time when it never fires again
+_NEVER = float('inf')
+
+
+class _HeapIndex:
+    """
+    The default index, a min-heap of next fire times and priorities. Cancelled jobs are lazily discarded
+    when they reach the top of the heap.
+
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, entry: ScheduledJob):
+        heapq.heappush(self._heap, (entry.deadline, entry.priority, next(self._counter), entry))
+
+    def push_all(self, entries):
+        self._heap.extend((entry.deadline, entry.priority, next(self._counter), entry) for entry in entries)
+        heapq.heapify(self._heap)
+
+    def discard(self, entry: ScheduledJob):
+        pass
+
+    def discard_all(self, entries: list):
+        """
+        Removes active jobs at once, e.g. before their deadline moves. The heap is rebuilt in linear time.
+
+        """
+        entries = set(entries)
+        self._heap = [item for item in self._heap if item[3] not in entries]
+        heapq.heapify(self._heap)
+
+    def remove(self, entry: ScheduledJob):
+        heapq.heappop(self._heap)
+
+    def peek(self, now: float):
+        while self._heap and self._heap[0][3].cancelled:
+            heapq.heappop(self._heap)
+        return self._heap[0][3] if self._heap else None
+
+    def entries(self) -> list:
+        return [entry for _, _, _, entry in self._heap]
+
+    def clear(self):
+        self._heap.clear()
+
+
+class Dispatcher:
+    """
+    Keeps scheduled jobs in an index of next fire times and priorities and fires them when they are due.
+    Cancelled jobs are marked and discarded from the index.
+
+    Example
+    --------
+    1.  dispatcher = Dispatcher(fire=lambda scheduled: scheduled.job.goal() or True)
+        dispatcher.add(ScheduledJob(job, IntervalTrigger(5), 'inline', time.time() + 5))
+        dispatcher.run()
+
+    """
+
+    def __init__(self, fire, on_next_run=None, on_misfire=None, on_reschedule=None, index=None):
+        """
+        Creates an empty dispatcher.
+
+        Parameters
+        ----------
+        fire : callable
+                invoked with a ``ScheduledJob`` when it is due. It must return ``True`` to keep the job
+                scheduled for its next run, ``False`` to discard it
+        on_next_run : callable
+                        optional, invoked with the next run ``datetime`` and idle seconds every time the
+                        earliest deadline changes
+        on_misfire : callable
+                     optional, invoked with a ``ScheduledJob`` and its lateness in seconds instead of ``fire``,
+                     when its fire time is missed and skipped as per its catch up policy
+        on_reschedule : callable
+                        optional, invoked with a ``ScheduledJob`` after its deadline moved to the next fire time
+        index : TimingWheel
+                optional, an index of jobs by next fire time, e.g. ``TimingWheel``. Default a min-heap
+
+        """
+        self._fire = fire
+        self._on_next_run = on_next_run
+        self._on_misfire = on_misfire
+        self._on_reschedule = on_reschedule
+        self._index = _HeapIndex() if index is None else index
+        self._named = {}
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._reported = None
+        self._firing = None
+
+    def add(self, scheduled: ScheduledJob):
+        """
+        Adds a scheduled job to the index and wakes the dispatch loop.
+
+        Parameters
+        ----------
+        scheduled : ScheduledJob
+                    a scheduled job having its first deadline set
+
+        """
+        with self._condition:
+            self._push(scheduled)
+            self._condition.notify_all()
+
+    def add_all(self, scheduled_jobs: list):
+        """
+        Adds many scheduled jobs at once. A heap index is rebuilt once in linear time
+        instead of pushing every job, and the dispatch loop is woken up once.
+
+        Parameters
+        ----------
+        scheduled_jobs : list
+                         a list of ``ScheduledJob`` having their first deadline set
+
+        """
+        with self._condition:
+            self._index.push_all(scheduled_jobs)
+            for scheduled in scheduled_jobs:
+                self._named.setdefault(scheduled.name, set()).add(scheduled)
+            self._condition.notify_all()
+
+    def cancel(self, name: str) -> int:
+        """
+        Cancels all jobs having the name and wakes the dispatch loop.
+
+        Parameters
+        ----------
+        name : str
+               a job identifier
+
+        Returns
+        --------
+        int
+            number of cancelled jobs
+
+        """
+        cancelled = 0
+        with self._condition:
+            entries = list(self._named.pop(name, ()))
+            if self._firing is not None and self._firing.name == name:
+                entries.append(self._firing)
+            for entry in entries:
+                if not entry.cancelled:
+                    entry.cancelled = True
+                    self._index.discard(entry)
+                    cancelled += 1
+            if cancelled > 0:
+                self._condition.notify_all()
+        return cancelled
+
+    def reschedule(self, triggers: dict, now: float) -> list:
+        """
+        Replaces the triggers of jobs in place and moves their deadline to the next fire time of the new trigger.
+        A job is kept along with its runs in progress and statistics, a job being fired keeps its deadline
+        and continues with the new trigger once fired. Jobs having an equal trigger are not changed.
+
+        Parameters
+        ----------
+        triggers : dict
+                   job name to its new ``Trigger``
+        now : float
+              current time in seconds since epoch, new deadlines follow it
+
+        Returns
+        --------
+        list
+            a list of ``ScheduledJob`` whose trigger changed
+
+        """
+        with self._condition:
+            moved, changed = [], []
+            for name, trigger in triggers.items():
+                for entry in self._named.get(name, ()):
+                    if not entry.cancelled and entry.trigger != trigger:
+                        moved.append(entry)
+                firing = self._firing
+                if firing is not None and firing.name == name and not firing.cancelled and firing.trigger != trigger:
+                    firing.trigger = trigger
+                    changed.append(firing)
+            if moved:
+                self._index.discard_all(moved)
+                for entry in moved:
+                    entry.trigger = triggers[entry.name]
+                    entry.deadline = entry.trigger.next_fire(now)
+                    self._index.push(entry)
+                self._condition.notify_all()
+        return moved + changed
+
+    def clear(self):
+        """
+        Removes all jobs from the index, they are marked as cancelled.
+
+        """
+        with self._condition:
+            for entry in self._index.entries():
+                entry.cancelled = True
+            if self._firing is not None:
+                self._firing.cancelled = True
+            self._index.clear()
+            self._named.clear()
+            self._condition.notify_all()
+
+    def jobs(self) -> list:
+        """
+        Retrieves all active scheduled jobs, earliest deadline first.
+
+        Returns
+        --------
+        list
+            a list of ``ScheduledJob``
+
+        """
+        with self._condition:
+            entries = [entry for entry in self._index.entries() if not entry.cancelled]
+            if self._firing is not None and not self._firing.cancelled:
+                entries.append(self._firing)
+            return sorted(entries, key=lambda entry: entry.deadline)
+
+    def next_run(self):
+        """
+        Retrieves the next run time of the earliest job.
+
+        Returns
+        --------
+        datetime
+            next run time, ``None`` if there is no job
+
+        """
+        with self._condition:
+            entry = self._peek()
+            return None if entry is None else datetime.datetime.fromtimestamp(entry.deadline)
+
+    def idle_seconds(self):
+        """
+        Retrieves seconds remaining until the earliest job is due.
+
+        Returns
+        --------
+        float
+            seconds until next run (negative if overdue), ``None`` if there is no job
+
+        """
+        with self._condition:
+            entry = self._peek()
+            return None if entry is None else entry.deadline - time.time()
+
+    def stop(self):
+        """
+        Requests the dispatch loop to return. Jobs remain in the index.
+
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+    def is_stopped(self) -> bool:
+        return self._stopped
+
+    def run(self):
+        """
+        Dispatch loop, blocks the calling thread until ``stop`` is requested.
+        It sleeps until the earliest deadline, fires the due job and pushes it back with its next deadline.
+        Fire times missed by more than the misfire grace time of the job are run once, run all or skipped
+        as per its catch up policy, please see ``ScheduledJob``.
+
+        """
+        with self._condition:
+            while not self._stopped:
+                entry = self._peek()
+                self._report(entry)
+
+                if entry is None:
+                    self._condition.wait()
+                    continue
+
+                delay = entry.deadline - time.time()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+
+                self._index.remove(entry)
+                self._forget(entry)
+                self._firing = entry
+                self._condition.release()
+                try:
+                    now = time.time()
+                    if entry.begin(now):
+                        keep = self._fire(entry)
+                    else:
+                        keep = self._misfire(entry, now - entry.deadline)
+                finally:
+                    self._condition.acquire()
+                    self._firing = None
+
+                if keep and not entry.cancelled:
+                    if entry.advance(time.time()) != _NEVER:
+                        self._push(entry)
+                    if self._on_reschedule is not None:
+                        self._on_reschedule(entry)
+
+    def _misfire(self, entry: ScheduledJob, lateness: float) -> bool:
+        if self._on_misfire is not None:
+            self._on_misfire(entry, lateness)
+        return True
+
+    def _push(self, entry: ScheduledJob):
+        self._index.push(entry)
+        self._named.setdefault(entry.name, set()).add(entry)
+
+    def _forget(self, entry: ScheduledJob):
+        entries = self._named.get(entry.name)
+        if entries is not None:
+            entries.discard(entry)
+            if not entries:
+                del self._named[entry.name]
+
+    def _peek(self):
+        """
+        Returns the earliest active entry, cancelled entries are discarded.
+
+        """
+        return self._index.peek(time.time())
+
+    def _report(self, entry):
+        if self._on_next_run is None:
+            return
+
+        deadline = None if entry is None else entry.deadline
+        if deadline != self._reported:
+            self._reported = deadline
+            if deadline is None:
+                self._on_next_run(None, None)
+            else:
+                self._on_next_run(datetime.datetime.fromtimestamp(deadline), deadline - time.time())
@@ -0,0 +1,282 @@
+"""
+A persistent pool of worker processes used by ``Scheduler`` to execute CPU bound jobs outside of the GIL.
+
+Job instances are pickled and sent to an idle worker process which calls ``goal()`` and sends
+the result or the exception back. Worker processes are started up-front (warm start) and
+replaced after ``max_tasks_per_worker`` jobs to release any memory a job may have leaked.
+A worker process running a job longer than its timeout is killed and replaced. A shutdown without waiting
+terminates all worker processes, also those running a job.
+
+Note
+----
+A job and its result must be picklable. Worker processes are created with the default
+``multiprocessing`` start method of the platform unless ``start_method`` is provided.
+
+"""
+
+import multiprocessing
+import os
+import queue
+import threading
+import traceback
+
+import utils.Constants as Sc
+from scheduling.CancellationToken import JobTimeoutError
+from scheduling.WorkerPool import WorkerPool
+
+_READY = 'ready'
+
+
+class RemoteJobError(Exception):
+    """
+    Raised in the scheduler process when a job failed inside a worker process.
+    The original exception is chained as ``__cause__`` and the worker traceback is preserved.
+
+    """
+
+    def __init__(self, cause: BaseException, remote_traceback: str):
+        super().__init__('{!r}\n\nWorker process traceback:\n{}'.format(cause, remote_traceback))
+        self.remote_traceback = remote_traceback
+        self.__cause__ = cause
+
+
+def _worker_main(conn):
+    """
+    Entry point of a worker process. Receives job instances and goal keyword arguments
+    until ``None`` or the pipe is closed.
+
+    """
+    conn.send(_READY)
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+
+        job, kwargs = message
+        try:
+            result = job.goal(**kwargs)
+            conn.send((True, result, None))
+        except BaseException as e:
+            tb = traceback.format_exc()
+            try:
+                conn.send((False, e, tb))
+            except Exception:
+                conn.send((False, RuntimeError(repr(e)), tb))
+
+
+class _WorkerProcess:
+    """
+    A worker process with its pipe and number of tasks executed so far.
+
+    """
+
+    def __init__(self, context):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.tasks = 0
+        self._ready = False
+
+    def run(self, job, kwargs: dict, timeout: float = None):
+        if not self._ready:
+            self.conn.recv()
+            self._ready = True
+
+        self.conn.send((job, kwargs))
+        self.tasks += 1
+        if timeout is not None and not self.conn.poll(timeout):
+            raise JobTimeoutError(timeout)
+        return self.conn.recv()
+
+    def terminate(self):
+        self.process.terminate()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(1)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.conn.close()
+
+
+class ProcessPool:
+
+    def __init__(self, max_workers: int = None, max_tasks_per_worker: int = Sc.DEFAULT_MAX_TASKS_PER_PROCESS,
+                 queue_depth: int = Sc.DEFAULT_QUEUE_DEPTH, overflow_policy: str = Sc.DEFAULT_OVERFLOW_POLICY,
+                 start_method: str = None):
+        """
+        Creates a pool and starts all worker processes (warm start).
+
+        Parameters
+        ----------
+        max_workers : int
+                      number of worker processes. Default number of CPUs
+        max_tasks_per_worker : int
+                                a worker process is replaced after executing this number of jobs
+        queue_depth : int
+                      maximum number of firings waiting for a free worker process
+        overflow_policy : str
+                          one of ``reject``, ``queue`` or ``drop-oldest``, please see ``WorkerPool``
+        start_method : str
+                        ``multiprocessing`` start method, ``fork``, ``spawn`` or ``forkserver``.
+                        Default platform default
+
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        self._context = multiprocessing.get_context(start_method)
+        self._max_tasks_per_worker = max(1, max_tasks_per_worker)
+        self._recycled = 0
+        self._killed = 0
+        self._terminated = False
+        self._lock = threading.Lock()
+        self._pool = WorkerPool(max_workers=max_workers, queue_depth=queue_depth,
+                                overflow_policy=overflow_policy, name='ProcessWorker')
+        self._workers = set()
+        self._idle = queue.Queue()
+        for _ in range(max_workers):
+            worker = _WorkerProcess(self._context)
+            self._workers.add(worker)
+            self._idle.put(worker)
+
+    def submit(self, job, timeout: float = None, priority: int = Sc.DEFAULT_PRIORITY,
+               weight: float = Sc.DEFAULT_WEIGHT, on_start=None, block: bool = True, **kwargs):
+        """
+        Submits a job instance to be executed by a worker process.
+
+        Parameters
+        ----------
+        job : Job
+              a picklable job instance
+        timeout : float
+                  seconds the job may run, afterwards the worker process is killed and replaced
+                  and the future fails with ``JobTimeoutError``. Default ``None``, no timeout
+        priority : int
+                   please see ``WorkerPool.enqueue``
+        weight : float
+                 please see ``WorkerPool.enqueue``, the job name identifies the flow
+        on_start : callable
+                   invoked without arguments once the job is sent to a worker process. Default ``None``
+        block : bool
+                please see ``WorkerPool.enqueue``
+        kwargs
+              picklable keyword arguments passed to ``goal``
+
+        Returns
+        --------
+        Future
+            a future holding the result of ``goal()``, ``None`` if the firing has been rejected
+
+        """
+        return self._pool.enqueue(self._execute, (job, kwargs, timeout, on_start), priority=priority, weight=weight,
+                                  flow=job.name(), block=block)
+
+    def stats(self) -> dict:
+        """
+        Retrieves current statistics of this pool, please see ``WorkerPool.stats``.
+
+        Returns
+        --------
+        dict
+            pool statistics including number of ``recycled`` and ``killed`` (timed out) worker processes
+
+        """
+        stats = self._pool.stats()
+        with self._lock:
+            stats['recycled'] = self._recycled
+            stats['killed'] = self._killed
+        return stats
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False):
+        """
+        Stops accepting new firings and stops all worker processes.
+
+        Parameters
+        ----------
+        wait : bool
+               if ``True`` waits for running jobs to complete, otherwise all worker processes are terminated,
+               also those running a job, whose futures fail, and queued firings fail without being executed
+        cancel_pending : bool
+                         if ``True`` queued firings are cancelled instead of executed
+
+        """
+        if not wait:
+            with self._lock:
+                self._terminated = True
+                workers = list(self._workers)
+                self._workers.clear()
+            for worker in workers:
+                worker.terminate()
+
+        self._pool.shutdown(wait=wait, cancel_pending=cancel_pending)
+        while not self._idle.empty():
+            worker = self._idle.get_nowait()
+            if worker is not None:
+                worker.stop()
+        if not wait:
+            self._idle.put(None)
+
+    def _execute(self, job, kwargs: dict, timeout: float, on_start=None):
+        worker = self._idle.get()
+        if worker is None:
+            self._idle.put(None)
+            raise RuntimeError(Sc.MSG_EX_POOL_SHUTDOWN)
+
+        if on_start is not None:
+            on_start()
+        try:
+            ok, result, tb = worker.run(job, kwargs, timeout)
+        except JobTimeoutError:
+            worker.kill()
+            worker = self._replace(worker)
+            with self._lock:
+                self._killed += 1
+            raise
+        except (EOFError, OSError):
+            worker.stop()
+            worker = self._replace(worker)
+            raise RuntimeError(Sc.MSG_EX_WORKER_PROCESS_DIED)
+        finally:
+            if worker is not None and worker.tasks >= self._max_tasks_per_worker:
+                worker.stop()
+                worker = self._replace(worker)
+                with self._lock:
+                    self._recycled += 1
+            if worker is not None and self._terminated:
+                worker.stop()
+            elif worker is not None:
+                self._idle.put(worker)
+
+        if not ok:
+            raise RemoteJobError(result, tb)
+        return result
+
+    def _replace(self, worker: _WorkerProcess):
+        """
+        Replaces a stopped worker process by a new one, unless the pool has been terminated meanwhile.
+
+        Returns
+        --------
+        _WorkerProcess
+            the new worker process, ``None`` if the pool has been terminated
+
+        """
+        with self._lock:
+            self._workers.discard(worker)
+            if self._terminated:
+                return None
+            replacement = _WorkerProcess(self._context)
+            self._workers.add(replacement)
+            return replacement
@@ -1,8 +1,9 @@
+from scheduling.Trigger import Trigger, compile_schedule
 
 
 class ScheduleConfig:
 
-    def __init__(self, every: int = None, time_unit: str = 'hour', at: str = None):
+    def __init__(self, every: int = None, time_unit: str = 'hour', at: str = None, cron: str = None):
         """
         Creates an immutable instance of schedule configurations which will be used to change scheduler behaviour
         at runtime by modifying ``every`` or ``at`` and ``time_unit``.
@@ -32,10 +33,15 @@ class ScheduleConfig:
             a string represents at specified time a job will execute on
             per time unit. If a value provided for `every` then avoid providing a value for this field.
 
+        cron : str
+                a cron expression, e.g. ``*/15 8-17 * * MON-FRI``. If provided, `every` and `at` must not be
+                provided and `time_unit` is ignored. Please see ``CronTrigger`` for the syntax.
+
         """
         self._every = every
         self._time_unit = time_unit
         self._at = at
+        self._cron = cron
 
     def every(self) -> int:
         """
@@ -73,9 +79,40 @@ class ScheduleConfig:
         """
         return self._at
 
+    def cron(self) -> str:
+        """
+        Retrieves the cron expression from current instance
+
+        Returns
+        -------
+        str
+            cron expression, ``None`` if the schedule is defined by every or at and time unit
+
+        """
+        return self._cron
+
+    def trigger(self) -> Trigger:
+        """
+        Compiles this schedule into an immutable trigger which computes next fire times.
+        Equal schedules share the same compiled trigger.
+
+        Returns
+        -------
+        Trigger
+            compiled schedule
+
+        Raises
+        ------
+        ValueError
+            if the combination of every, time unit and at is invalid
+
+        """
+        return compile_schedule(self._every, self._time_unit, self._at, self._cron)
+
     def is_valid(self):
         """
-        Validates value provided only for either `every` or `at` and not to both
+        Validates value provided only for either `every` or `at` and not to both,
+        and that `cron` is not combined with either of them
 
         Returns
         -------
@@ -85,6 +122,9 @@ class ScheduleConfig:
         """
         if not ScheduleConfig._isnone(self.every()) and not ScheduleConfig._is_empty(self.at()):
             return False
+        elif not ScheduleConfig._is_empty(self.cron()) \
+                and (not ScheduleConfig._isnone(self.every()) or not ScheduleConfig._is_empty(self.at())):
+            return False
         else:
             return True
 
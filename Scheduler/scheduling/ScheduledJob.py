@@ -0,0 +1,247 @@
+import inspect
+
+import utils.Constants as Sc
+from jobs.Job import Job
+from scheduling.Trigger import Trigger
+
+
+class ScheduledJob:
+    """
+    A job registered on a scheduler along with its compiled trigger, execution mode, next deadline,
+    overlap limits and misfire handling. Instances are created by ``Scheduler`` and kept in the dispatcher heap.
+
+    A fire time is missed if the job is dispatched later than ``misfire_grace_time`` seconds after it,
+    e.g. when a long ``inline`` job blocks the dispatch loop or the scheduler was not running.
+    Missed fire times are handled as per the catch up policy.
+
+    * ``once`` - all missed fire times are collapsed into one run
+    * ``all`` - the job runs once for every missed fire time
+    * ``skip`` - missed fire times are skipped, the job runs at its next fire time
+
+    """
+
+    __slots__ = ('name', 'job', 'trigger', 'execution', 'deadline', 'cancelled',
+                 'max_instances', 'overlap_policy', 'running', 'pending',
+                 'misfire_grace_time', 'catch_up', 'last_run', 'late',
+                 'runs', 'misfires', 'lateness', 'max_lateness', 'total_lateness', 'goal_parameters', 'timeout',
+                 'priority', 'weight')
+
+    def __init__(self, job: Job, trigger: Trigger, execution: str, deadline: float,
+                 max_instances: int = None, overlap_policy: str = None,
+                 misfire_grace_time: float = Sc.DEFAULT_MISFIRE_GRACE_TIME, catch_up: str = Sc.DEFAULT_CATCH_UP,
+                 last_run: float = None, timeout: float = None, priority: int = Sc.DEFAULT_PRIORITY,
+                 weight: float = Sc.DEFAULT_WEIGHT):
+        """
+        Parameters
+        ----------
+        job : Job
+              the job to be executed
+        trigger : Trigger
+                  compiled schedule of the job
+        execution : str
+                    ``inline``, ``thread`` or ``process``
+        deadline : float
+                    first fire time in seconds since epoch
+        max_instances : int
+                        maximum number of runs of the job at the same time. Default unlimited,
+                        or 1 if an overlap policy is provided
+        overlap_policy : str
+                         ``skip-if-running`` or ``coalesce``, what happens to a firing when ``max_instances``
+                         runs are already in progress. Default ``skip-if-running`` if max instances is provided
+        misfire_grace_time : float
+                             seconds a run may be late before its fire time is considered missed,
+                             ``None`` never considers a fire time missed. Default 1 second
+        catch_up : str
+                   ``once``, ``all`` or ``skip``, how missed fire times are handled. Default ``once``
+        last_run : float
+                   fire time of the last run in seconds since epoch, e.g. persisted before a restart.
+                   If provided, the first deadline is the next fire time after it, instead of ``deadline``
+        timeout : float
+                  seconds a run may take before it is cancelled. Default ``None``, no timeout
+        priority : int
+                   priority class, ``0`` critical, ``1`` high, ``2`` normal or ``3`` low, a lower value is dispatched
+                   and picked up by a worker first. Default 2 (normal)
+        weight : float
+                 share of workers relative to other jobs of the same priority. Default 1
+
+        Raises
+        ------
+        ValueError
+                if max instances is less than 1, the overlap policy or catch up policy is unknown,
+                misfire grace time is negative, timeout or weight is not positive or priority is not a priority class
+
+        """
+        if max_instances is not None and (not isinstance(max_instances, int) or max_instances < 1):
+            raise ValueError(Sc.MSG_EX_ILLEGAL_MAX_INSTANCES.format(max_instances))
+        if overlap_policy is not None and overlap_policy not in Sc.OVERLAP_POLICIES:
+            raise ValueError(Sc.MSG_EX_ILLEGAL_OVERLAP_POLICY)
+        if misfire_grace_time is not None and (not isinstance(misfire_grace_time, (int, float))
+                                               or misfire_grace_time < 0):
+            raise ValueError(Sc.MSG_EX_ILLEGAL_MISFIRE_GRACE_TIME.format(misfire_grace_time))
+        if catch_up not in Sc.CATCH_UP_POLICIES:
+            raise ValueError(Sc.MSG_EX_ILLEGAL_CATCH_UP)
+        if timeout is not None and (not isinstance(timeout, (int, float)) or timeout <= 0):
+            raise ValueError(Sc.MSG_EX_ILLEGAL_TIMEOUT.format(timeout))
+        if not isinstance(priority, int) or priority not in Sc.PRIORITIES:
+            raise ValueError(Sc.MSG_EX_ILLEGAL_PRIORITY.format(priority))
+        if not isinstance(weight, (int, float)) or weight <= 0:
+            raise ValueError(Sc.MSG_EX_ILLEGAL_WEIGHT.format(weight))
+
+        if overlap_policy is not None and max_instances is None:
+            max_instances = 1
+        if max_instances is not None and overlap_policy is None:
+            overlap_policy = Sc.OVERLAP_SKIP_IF_RUNNING
+
+        self.name = job.name()
+        self.job = job
+        self.trigger = trigger
+        self.execution = execution
+        self.deadline = deadline if last_run is None else trigger.next_fire(last_run)
+        self.cancelled = False
+        self.max_instances = max_instances
+        self.overlap_policy = overlap_policy
+        self.running = 0
+        self.pending = False
+        self.misfire_grace_time = misfire_grace_time
+        self.catch_up = catch_up
+        self.last_run = last_run
+        self.late = False
+        self.runs = 0
+        self.misfires = 0
+        self.lateness = None
+        self.max_lateness = 0.0
+        self.total_lateness = 0.0
+        self.goal_parameters = _keyword_parameters(job.goal)
+        self.timeout = timeout
+        self.priority = priority
+        self.weight = weight
+
+    def accepts(self, parameter: str) -> bool:
+        """
+        Returns
+        --------
+        bool
+            ``True`` if the job goal accepts the keyword argument, e.g. ``lease``
+
+        """
+        return self.goal_parameters is None or parameter in self.goal_parameters
+
+    def begin(self, now: float) -> bool:
+        """
+        Decides whether the due job runs as per the catch up policy and records its lateness.
+
+        Parameters
+        ----------
+        now : float
+              dispatch time in seconds since epoch
+
+        Returns
+        --------
+        bool
+            ``True`` if the job should run, ``False`` if its fire time is missed and skipped
+
+        """
+        lateness = now - self.deadline
+        self.late = self.misfire_grace_time is not None and lateness > self.misfire_grace_time
+        if self.late and self.catch_up == Sc.CATCH_UP_SKIP:
+            self.misfires += 1
+            return False
+
+        self.last_run = self.deadline
+        self.runs += 1
+        self.lateness = lateness
+        self.max_lateness = max(self.max_lateness, lateness)
+        self.total_lateness += lateness
+        return True
+
+    def advance(self, now: float) -> float:
+        """
+        Moves the deadline to the next fire time. After a missed fire time, the next fire time follows ``now``
+        unless every missed fire time is caught up (``all``). Otherwise it follows the previous deadline,
+        which may still be in the past, to be handled by ``begin`` when dispatched.
+
+        Parameters
+        ----------
+        now : float
+              current time in seconds since epoch
+
+        Returns
+        --------
+        float
+            the new deadline
+
+        """
+        if self.late and self.catch_up != Sc.CATCH_UP_ALL:
+            self.deadline = self.trigger.next_fire(now)
+        else:
+            self.deadline = self.trigger.next_fire(self.deadline)
+        self.late = False
+        return self.deadline
+
+    def stats(self) -> dict:
+        """
+        Returns
+        --------
+        dict
+            ``last_run`` and ``next_run`` fire time (``None`` if it never fires again), number of ``runs``
+            and ``misfires``, ``last``, ``max`` and ``mean`` lateness of runs in seconds
+
+        """
+        return {'last_run': self.last_run,
+                'next_run': None if self.deadline == float('inf') else self.deadline,
+                'runs': self.runs,
+                'misfires': self.misfires,
+                'lateness_last': self.lateness,
+                'lateness_max': self.max_lateness,
+                'lateness_mean': self.total_lateness / self.runs if self.runs else None}
+
+    def acquire(self) -> bool:
+        """
+        Counts a new run of the job if the limit allows. Otherwise a ``coalesce`` job remembers one pending run.
+        The caller must serialise calls of ``acquire`` and ``release``.
+
+        Returns
+        --------
+        bool
+            ``True`` if the job may run now
+
+        """
+        if self.max_instances is None or self.running < self.max_instances:
+            self.running += 1
+            return True
+        if self.overlap_policy == Sc.OVERLAP_COALESCE:
+            self.pending = True
+        return False
+
+    def release(self) -> bool:
+        """
+        Counts a completed run of the job.
+
+        Returns
+        --------
+        bool
+            ``True`` if a coalesced run is pending and should run now
+
+        """
+        self.running -= 1
+        rerun = self.pending and not self.cancelled
+        self.pending = False
+        return rerun
+
+    def __repr__(self):
+        return 'ScheduledJob(name={}, trigger={!r}, execution={})'.format(self.name, self.trigger, self.execution)
+
+
+def _keyword_parameters(goal):
+    """
+    Names of keyword parameters of a goal, ``None`` if it accepts any keyword argument.
+
+    """
+    try:
+        parameters = inspect.signature(goal).parameters.values()
+    except (TypeError, ValueError):
+        return frozenset()
+    if any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters):
+        return None
+    return frozenset(p.name for p in parameters
+                     if p.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY))
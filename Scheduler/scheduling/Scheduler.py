@@ -43,21 +43,55 @@ Tip
 
 Note
 ----
-Since there is no synchronize mechanism between one or more scheduler instances,
+Every ``Scheduler`` instance keeps its own job list, dispatch loop and lock, therefore several
+independent instances can run in one process without interfering with each other's jobs.
+Without a ``lease_store`` there is no synchronize mechanism between one or more scheduler instances,
 running 2 instances for the same job has adverse effects. For an instance,
 if the job is writing data into a database. Failure is bound to occur on the second
 instance of the scheduler due to data redundancy error from database.
-To resolve this issue, please modify configurations or a job for the second instance
-and then run 2 instances.
+To resolve this issue, please create all instances with the same ``lease_store``, e.g. ``SQLiteLeaseStore``
+for processes on one host. An instance then runs a job only after acquiring its lease for the fire time,
+i.e. a job runs at most once per fire time across instances and never overlaps with a run on another
+instance. A job goal accepting a ``lease`` keyword argument receives the lease including its fencing token.
 
 Important
 ---------
 Assuming a job is transferring files from one location to another.
-Assuming the whole process takes 5 minutes in total. Scheduling the job every 2 minutes will
-cause errors due to another same job is already running.
-Therefore while scheduling a job, please analyse the maximum time required to complete a job.
-Then set the maximum interval plus additional buffer time, to avoid race condition.
-You could schedule a job to run once to understand the time required to finish the job.
+Assuming the whole process takes 5 minutes in total. Scheduling the job every 2 minutes in parallel
+will cause errors due to another same job is already running.
+To avoid the race condition, please schedule the job with ``max_instances`` and an ``overlap_policy``.
+The scheduler then limits the number of runs of the job at the same time.
+
+* ``skip-if-running`` - a firing is skipped while ``max_instances`` runs are in progress
+* ``coalesce`` - firings while ``max_instances`` runs are in progress are collapsed into one run,
+  which starts as soon as a run completes
+
+Every skipped firing is audited with status ``Skipped``.
+
+Similarly, a long ``inline`` job blocks the dispatch loop and a stopped scheduler misses fire times.
+A fire time dispatched later than ``misfire_grace_time`` is missed and handled as per ``catch_up``,
+``once`` (default) runs the job once for all missed fire times, ``all`` runs it for every missed fire time
+and ``skip`` waits for the next fire time. Skipped fire times are audited with status ``Misfired``.
+Pass the ``last_run`` of a job (please see ``run_stats``) when scheduling it after a restart
+to catch up fire times missed while the scheduler was not running.
+
+When many jobs are due at the same time, a burst of low value jobs should not delay latency sensitive ones.
+Jobs due at the same time are dispatched by ``priority`` and parallel firings are picked up by workers by
+``priority``, then by ``weight`` among jobs of the same priority. ``pool_stats`` reports queue wait by priority.
+
+Jobs sharing a schedule fire at the same instant, e.g. connecting to the same SFTP host all at once.
+``jitter`` delays every fire time of a job by up to the given seconds and ``spread`` by a stable offset
+within the period, derived from the job name. Both are deterministic and keep the average rate of the job,
+they are configured per job or per scheduler (``JITTER`` and ``SPREAD`` in configurations).
+
+A job scheduled without a ``schedule_config`` follows configurations, i.e. its entry in ``JOBS`` or the schedule
+of the scheduler. ``reload_config`` reads configurations again and reschedules those jobs whose schedule changed,
+in place, which ``watch_config`` does whenever the configurations file changes.
+
+Every run is measured per job name in memory, ``metrics`` reports histograms of lateness (fire time to start of
+the goal), queue wait and duration along with the number of runs by outcome. A ``metrics_exporter``, e.g.
+``ConsoleExporter``, publishes them while the scheduler is running. ``start(metrics_port=9100)`` serves
+them along with pool utilisation, next runs, audit queue depth and transfer rates to Prometheus.
 
 Examples
 --------
@@ -121,26 +155,54 @@ Examples
     | ``sche.schedule_job(job=job1)``
     | ``sche.start()``
 
+7. Schedule a job which runs every 2 minutes in parallel, but never overlaps with itself.
+
+    | ``EVERY = 2, TIME_UNIT = minutes``
+    | ``sche = Scheduler()``
+    | ``job1 = TestJob()``
+    | ``sche.schedule_job(job=job1, run_continuous=True, execute_parallel=True,``
+    |                     ``max_instances=1, overlap_policy='coalesce')``
+    | ``sche.start()``
+
 """
 
 import configs.ConfigConstant as Cc
+import configs.ConfigLoader as ConfigLoader
 import utils.Constants as Sc
+from configs.ConfigWatcher import ConfigWatcher
 from scheduling.ScheduleConfig import ScheduleConfig
-from utils.Utils import cfg, is_valid_implementation, isnone, is_empty
+from utils.Utils import cfg_snapshot, is_valid_implementation, isnone, is_empty
+from scheduling.Dispatcher import Dispatcher
+from scheduling.ScheduledJob import ScheduledJob
+from scheduling.Trigger import Trigger, compile_schedule, spread_schedule
+from scheduling.TimingWheel import TimingWheel
+from scheduling.WorkerPool import WorkerPool
+from scheduling.Watchdog import Watchdog
+from scheduling.CancellationToken import CancellationToken, JobTimeoutError
+from scheduling.ProcessPool import ProcessPool
+from scheduling.stores.JobStore import JobStore
+from scheduling.stores.LeaseStore import Lease, LeaseStore
+from metrics.MetricsRegistry import MetricsRegistry, RunTimer
+from metrics.exporters.MetricsExporter import MetricsExporter
+from metrics.exporters.PrometheusExporter import PrometheusExporter
 from jobs.Job import Job
+import auditlogging.Auditor as Auditor
 from auditlogging.Auditor import audit_params
 from utils.StringBuilder import StringBuilder
 
-import schedule
-import time
 import threading
-import inspect
+import os
+from collections.abc import Mapping
+import socket
+import pickle
+import time
 
 
 class Scheduler:
 
     __counter = int(0)
     __instances = {}
+    __instances_lock = threading.Lock()
 
     @staticmethod
     def all_instances() -> dict:
@@ -154,7 +216,8 @@ class Scheduler:
             a map of scheduler instances
 
         """
-        return Scheduler.__instances
+        with Scheduler.__instances_lock:
+            return dict(Scheduler.__instances)
 
     @staticmethod
     def find_instance(instance_id: str = None):
@@ -191,7 +254,12 @@ class Scheduler:
 
         return Scheduler.all_instances().get(instance_id)
 
-    def __init__(self, separate_thread: bool = False):
+    def __init__(self, separate_thread: bool = False, max_workers: int = Sc.DEFAULT_MAX_WORKERS,
+                 queue_depth: int = Sc.DEFAULT_QUEUE_DEPTH, overflow_policy: str = Sc.DEFAULT_OVERFLOW_POLICY,
+                 process_workers: int = None, max_tasks_per_process: int = Sc.DEFAULT_MAX_TASKS_PER_PROCESS,
+                 job_store: JobStore = None, lease_store: LeaseStore = None, lease_ttl: float = Sc.DEFAULT_LEASE_TTL,
+                 timing_wheel: bool = False, metrics_exporter: MetricsExporter = None, jitter: float = None,
+                 spread: bool = None, watch_config: bool = None):
         """
         Initiates default properties for scheduler which a user can set dynamically by changing its behaviour.
         Scheduler interval and time unit retrieved from configurations.
@@ -201,24 +269,95 @@ class Scheduler:
         separate_thread : bool
                           indicates whether to run scheduler jobs in a separate thread
                           or in the ``main`` thread. Default False = ``main`` thread.
+        max_workers : int
+                      maximum number of threads executing ``execute_parallel`` jobs at the same time. Default 10
+        queue_depth : int
+                      maximum number of parallel job firings waiting for a free worker. Default 100
+        overflow_policy : str
+                          what happens to a firing when the queue is full.
+                          ``reject``, ``queue`` (wait for a free slot) or ``drop-oldest``. Default ``queue``
+        process_workers : int
+                          number of worker processes for jobs scheduled with ``execution='process'``.
+                          Default number of CPUs. Processes are started when the first such job is scheduled
+        max_tasks_per_process : int
+                                a worker process is replaced after executing this number of jobs. Default 100
+        job_store : JobStore
+                    persists jobs along with their last and next run and outcome, e.g. ``SQLiteJobStore``.
+                    Stored jobs are loaded once, a job scheduled again by name continues from its stored state,
+                    the remaining stored jobs are scheduled on ``start``. Jobs must be picklable and have
+                    unique names. Default ``None``, jobs are kept in memory only
+        lease_store : LeaseStore
+                      coordinates runs of jobs with other instances sharing the store, e.g. ``SQLiteLeaseStore``.
+                      Jobs are identified by their name across instances. Default ``None``, no coordination
+        lease_ttl : float
+                    seconds a lease is held if not released, e.g. by a crashed instance. It should exceed
+                    the longest run of a job. Default 300
+        timing_wheel : bool
+                       if ``True`` jobs are indexed by next fire time in a hierarchical ``TimingWheel``,
+                       insert, cancel and expiry cost O(1) instead of O(log n) of the default heap and
+                       cancelled jobs are removed at once. Please see ``benchmarks.timing_wheel``,
+                       the heap is implemented in C and remains faster up to about a million jobs. Default False
+        metrics_exporter : MetricsExporter
+                           publishes run metrics (please see ``metrics``) from start until shutdown,
+                           e.g. ``ConsoleExporter``. Default ``None``
+        jitter : float
+                 default maximum seconds the fire times of jobs are delayed at random, please see ``schedule_job``.
+                 Default ``JITTER`` from configurations, no jitter if not configured
+        spread : bool
+                 default of spreading fire times of jobs across their period, please see ``schedule_job``.
+                 Default ``SPREAD`` from configurations, ``False`` if not configured
+        watch_config : bool
+                       if ``True`` the configurations file is watched from start until shutdown and jobs are
+                       rescheduled once their schedule changed, please see ``reload_config``.
+                       Default ``WATCH_CONFIG`` from configurations, ``False`` if not configured
 
         """
-        self._every = cfg(Cc.EVERY)
-        self._unit = cfg(Cc.TIME_UNIT)
-        self._at_time = cfg(Cc.AT)
+        snapshot = cfg_snapshot()
+        self._every = snapshot.every
+        self._unit = snapshot.time_unit
+        self._at_time = snapshot.at
+        self._cron = snapshot.cron
+        self._jitter_override = jitter
+        self._spread_override = spread
+        self._jitter = snapshot.jitter if isnone(jitter) else jitter
+        self._spread = snapshot.spread if isnone(spread) else spread
+        self._watch_config = snapshot.watch_config if isnone(watch_config) else watch_config
+        self._config_watcher = None
+        self._schedule_definition = Scheduler._configured_schedule()
+        self._job_definitions = Scheduler._configured_jobs()
+        self._configured = {}
         self._next_run = None
         self._idle_seconds = None
         self._separate_thread = separate_thread
-        self._stop_event = None
         self._run_continuous = False
         self._pulse = 0
         self._print_etr = True
         self._shutdown_requested = False
         self._started = False
-        self.__wait = False
-        __next_id = str(Scheduler.__counter + 1)
-        self._instance_id = 'Scheduler-' + __next_id
-        Scheduler.__instances[self._instance_id] = self
+        self._drained = threading.Event()
+        self._drained.set()
+        self._pool = WorkerPool(max_workers=max_workers, queue_depth=queue_depth, overflow_policy=overflow_policy)
+        self._process_pool = None
+        self._process_pool_args = {'max_workers': process_workers, 'max_tasks_per_worker': max_tasks_per_process,
+                                   'queue_depth': queue_depth, 'overflow_policy': overflow_policy}
+        self._lock = threading.RLock()
+        self._runs = {}
+        self._runs_done = threading.Condition(self._lock)
+        self._dispatcher = Dispatcher(fire=self._fire, on_next_run=self._on_next_run, on_misfire=self._on_misfire,
+                                      on_reschedule=self._checkpoint,
+                                      index=TimingWheel(now=time.time()) if timing_wheel else None)
+        self._job_store = job_store
+        self._restored = {} if isnone(job_store) else {scheduled.name: scheduled for scheduled in job_store.load()}
+        with Scheduler.__instances_lock:
+            Scheduler.__counter += 1
+            self._instance_id = 'Scheduler-' + str(Scheduler.__counter)
+            Scheduler.__instances[self._instance_id] = self
+        self._lease_store = lease_store
+        self._lease_ttl = lease_ttl
+        self._owner = '{}:{}:{}'.format(socket.gethostname(), os.getpid(), self._instance_id)
+        self._watchdog = Watchdog(name=self._instance_id + '-Watchdog')
+        self._metrics = MetricsRegistry()
+        self._metrics_exporters = [] if isnone(metrics_exporter) else [metrics_exporter]
 
     def instance_id(self):
         """
@@ -232,7 +371,11 @@ class Scheduler:
         return self._instance_id
 
     def schedule_job(self, job: Job, schedule_config: ScheduleConfig = None, run_continuous: bool = False,
-                     execute_parallel: bool = False, pulse_seconds: int = Sc.DEFAULT_PULSE):
+                     execute_parallel: bool = False, pulse_seconds: int = Sc.DEFAULT_PULSE, execution: str = None,
+                     max_instances: int = None, overlap_policy: str = None,
+                     misfire_grace_time: float = Sc.DEFAULT_MISFIRE_GRACE_TIME, catch_up: str = Sc.DEFAULT_CATCH_UP,
+                     last_run: float = None, timeout: float = None, priority: int = Sc.DEFAULT_PRIORITY,
+                     weight: float = Sc.DEFAULT_WEIGHT, jitter: float = None, spread: bool = None):
         """
         Schedules a job with ``name`` and user can specify whether the job should run once or should run continuously.
 
@@ -243,91 +386,599 @@ class Scheduler:
         schedule_config : ScheduleConfig
                         if user wants to change the ``every`` or ``at`` and ``time_unit`` before job schedule,
                         then user can create an instance on ScheduleConfig and specify new values
-                        for schedule
+                        for schedule. Otherwise the job follows configurations, i.e. its entry in ``JOBS``
+                        if present (including ``JITTER`` and ``SPREAD``), or the schedule of the scheduler,
+                        and it is rescheduled by ``reload_config`` once it changed
         run_continuous : bool
                         if ``True`` the scheduler will continuously run jobs as per schedule,
                         run jobs once otherwise
         execute_parallel : bool
-                            if ``True`` the job will be scheduled to execute parallel by spawning a thread,
+                            if ``True`` the job will be scheduled to execute parallel on the worker pool,
                             sequential otherwise
         pulse_seconds : int
-                       seconds to keep checking next schedule. Default 5 seconds.
+                       retained for backward compatibility. Jobs are no longer polled, the scheduler sleeps
+                       until the earliest job is due and wakes up when a job is added or cancelled.
+        execution : str
+                    where the job goal is executed, overrides ``execute_parallel`` when provided.
+
+                    * ``inline`` - sequentially on the scheduler thread
+                    * ``thread`` - in parallel on the worker pool
+                    * ``process`` - in parallel on a worker process, suitable for CPU bound jobs.
+                      The job instance is pickled, result and exception are sent back for auditing
+        max_instances : int
+                        maximum number of runs of the job at the same time. Default unlimited,
+                        or 1 if an overlap policy is provided
+        overlap_policy : str
+                         what happens to a firing when ``max_instances`` runs are in progress.
+                         ``skip-if-running`` or ``coalesce``, default ``skip-if-running``
+        misfire_grace_time : float
+                             seconds a run may be late before its fire time is missed, ``None`` for unlimited.
+                             Default 1 second
+        catch_up : str
+                   ``once``, ``all`` or ``skip``, how missed fire times are handled. Default ``once``
+        last_run : float
+                   fire time of the last run of the job in seconds since epoch, e.g. persisted from ``run_stats``
+                   before a restart. The first run is the next fire time after it
+        timeout : float
+                  seconds a run may take once a worker started it, time waiting in the queue does not count.
+                  Once elapsed, the run is audited as timed out and a ``CancellationToken``
+                  passed to a goal accepting a ``cancel_token`` keyword argument is cancelled.
+                  A ``thread`` run frees its worker slot, a ``process`` run is killed along with its worker process,
+                  an ``inline`` run can only stop cooperatively. Default ``None``, no timeout
+        priority : int
+                   priority class, ``0`` critical, ``1`` high, ``2`` normal (default) or ``3`` low.
+                   Jobs due at the same time are dispatched, and parallel firings are picked up by workers,
+                   in priority order
+        weight : float
+                 share of workers relative to other parallel jobs of the same priority (weighted fair queuing),
+                 e.g. a job having weight 2 is picked up twice as often as a job having weight 1 when both
+                 are queued. Default 1
+        jitter : float
+                 maximum seconds every fire time is delayed, by a pseudo random but deterministic amount
+                 derived from the job name and the fire time. It is limited to the period of the schedule.
+                 Default as per the scheduler
+        spread : bool
+                 if ``True`` every fire time is delayed by a fixed offset derived from the job name, offsets of
+                 jobs sharing a schedule are spread evenly across its period. Default as per the scheduler
 
-                       Examples
-                       --------
-                        1. ``pulse_seconds=10`` will check next scheduler every 10 seconds
-                        2. ``pulse_seconds=30`` will check next scheduler every 30 seconds
+        Raises
+        ------
+        ValueError
+                if the execution mode is unknown, the job is not picklable for ``process`` execution,
+                overlap limits, misfire grace time, catch up policy, timeout, priority, weight or jitter
+                are invalid
 
         """
 
         if not is_valid_implementation(job, Job):
             raise Exception(Sc.MSG_EX_ILLEGAL_JOB)
 
+        execution = self._execution(job, execute_parallel, execution)
+        if not isnone(self._job_store):
+            Scheduler._ensure_picklable(job)
+
+        audit_params(Sc.OPERATION_SCHEDULE, Sc.STATUS_SCHEDULING, 'Scheduling a job')
+
+        with self._lock:
+            trigger = self._job_schedule(job.name(), self._compile(schedule_config), schedule_config, jitter, spread,
+                                         self._job_definitions)
+            self._run_continuous = run_continuous
+            self._pulse = pulse_seconds
+            scheduled = ScheduledJob(job, trigger, execution, trigger.next_fire(time.time()),
+                                     max_instances, overlap_policy, misfire_grace_time, catch_up, last_run, timeout,
+                                     priority, weight)
+            self._persist([scheduled], restore=isnone(last_run))
+            self._dispatcher.add(scheduled)
+
+        audit_params(Sc.OPERATION_SCHEDULE, Sc.STATUS_SCHEDULED, self._summary(scheduled, 1))
+
+        print(Sc.MSG_JOB_SCHEDULED)
+
+    def schedule_jobs(self, jobs: list, schedule_config: ScheduleConfig = None, run_continuous: bool = False,
+                      execute_parallel: bool = False, execution: str = None, max_instances: int = None,
+                      overlap_policy: str = None, misfire_grace_time: float = Sc.DEFAULT_MISFIRE_GRACE_TIME,
+                      catch_up: str = Sc.DEFAULT_CATCH_UP, timeout: float = None,
+                      priority: int = Sc.DEFAULT_PRIORITY, weight: float = Sc.DEFAULT_WEIGHT, jitter: float = None,
+                      spread: bool = None):
+        """
+        Schedules many jobs sharing one schedule at once. The schedule is compiled and validated once,
+        the jobs are added to the dispatcher in one step and one audit trail is captured for all of them.
+        Please use this function to register a large number of jobs at startup.
+
+        Parameters
+        ----------
+        jobs : list
+               a list of ``Job`` instances
+        schedule_config : ScheduleConfig
+                        please see ``schedule_job``
+        run_continuous : bool
+                        please see ``schedule_job``
+        execute_parallel : bool
+                            please see ``schedule_job``
+        execution : str
+                    please see ``schedule_job``
+        max_instances : int
+                        please see ``schedule_job``, the limit applies to every job separately
+        overlap_policy : str
+                         please see ``schedule_job``
+        misfire_grace_time : float
+                             please see ``schedule_job``
+        catch_up : str
+                   please see ``schedule_job``
+        timeout : float
+                  please see ``schedule_job``
+        priority : int
+                   please see ``schedule_job``
+        weight : float
+                 please see ``schedule_job``, the weight applies to every job separately
+        jitter : float
+                 please see ``schedule_job``
+        spread : bool
+                 please see ``schedule_job``, e.g. to spread a large number of jobs evenly across the period
+
+        Raises
+        ------
+        ValueError
+                if the schedule is invalid, the execution mode is unknown, a job is not picklable
+                for ``process`` execution, the overlap limits, misfire handling, priority, weight or jitter
+                are invalid.
+                No job is scheduled in that case
+
+        """
+        for job in jobs:
+            if not is_valid_implementation(job, Job):
+                raise Exception(Sc.MSG_EX_ILLEGAL_JOB)
+
+        if len(jobs) == 0:
+            return
+
+        resolved = execution
+        for job in jobs:
+            resolved = self._execution(job, execute_parallel, execution)
+            if not isnone(self._job_store):
+                Scheduler._ensure_picklable(job)
+        execution = resolved
+
+        audit_params(Sc.OPERATION_SCHEDULE, Sc.STATUS_SCHEDULING, 'Scheduling {} jobs'.format(len(jobs)))
+
+        with self._lock:
+            trigger = self._compile(schedule_config)
+            self._run_continuous = run_continuous
+            now = time.time()
+            scheduled = []
+            for job in jobs:
+                job_trigger = self._job_schedule(job.name(), trigger, schedule_config, jitter, spread,
+                                                 self._job_definitions)
+                scheduled.append(ScheduledJob(job, job_trigger, execution, job_trigger.next_fire(now), max_instances,
+                                              overlap_policy, misfire_grace_time, catch_up, timeout=timeout,
+                                              priority=priority, weight=weight))
+            self._persist(scheduled, restore=True)
+            self._dispatcher.add_all(scheduled)
+
+        audit_params(Sc.OPERATION_SCHEDULE, Sc.STATUS_SCHEDULED, self._summary(scheduled[0], len(jobs)))
+
+    def _job_schedule(self, name: str, trigger: Trigger, schedule_config: ScheduleConfig, jitter: float,
+                      spread: bool, definitions: dict) -> Trigger:
+        """
+        Compiles the schedule of a job. A job scheduled without ``schedule_config`` follows the schedule of its entry
+        in ``JOBS`` of configurations if present, otherwise the shared trigger, and it is remembered for
+        ``reload_config``. An entry overriding only e.g. directories of the job keeps the shared trigger.
+
+        """
         if not isnone(schedule_config):
-            self._override_schedule(schedule_config)
+            self._configured.pop(name, None)
+            return self._spread_schedule(trigger, name, jitter, spread)
+
+        self._configured[name] = (jitter, spread)
+        definition = definitions.get(name)
+        if isinstance(definition, Mapping):
+            if any(key in definition for key in (Cc.EVERY, Cc.TIME_UNIT, Cc.AT, Cc.CRON)):
+                trigger = compile_schedule(definition.get(Cc.EVERY), definition.get(Cc.TIME_UNIT) or Sc.HOUR,
+                                           definition.get(Cc.AT), definition.get(Cc.CRON))
+            jitter = definition.get(Cc.JITTER, jitter)
+            spread = definition.get(Cc.SPREAD, spread)
+        return self._spread_schedule(trigger, name, jitter, spread)
 
-        self._run_continuous = run_continuous
-        self._pulse = pulse_seconds
+    @staticmethod
+    def _configured_schedule() -> tuple:
+        snapshot = cfg_snapshot()
+        return snapshot.every, snapshot.time_unit, snapshot.at, snapshot.cron, snapshot.jitter, snapshot.spread
 
-        audit_params(Sc.OPERATION_SCHEDULE, Sc.STATUS_SCHEDULING, 'Scheduling a job')
+    @staticmethod
+    def _configured_jobs() -> Mapping:
+        return cfg_snapshot().jobs
 
-        if not isnone(self._every):
-            evaluation_str = 'schedule.every(int(self._every)).' + self._unit
-        else:
-            evaluation_str = 'schedule.every().' + self._unit
+    def reload_config(self) -> list:
+        """
+        Reads configurations from file again and compares the schedule of the scheduler and the entries of ``JOBS``
+        with the previously loaded ones. Only jobs following configurations whose schedule changed are rescheduled,
+        in place, i.e. runs in progress, overlap limits and run statistics are kept and other jobs are not touched.
+        A rescheduled job continues at the next fire time of its new schedule. Invalid configurations are
+        audited and ignored. It is called by the configurations watcher, please see ``watch_config``.
 
-        job_name = job.name()
+        Returns
+        --------
+        list
+            names of rescheduled jobs
 
-        evaluation_str += self._at()
-        if execute_parallel:
-            evaluation_str += '.do(self._spawn_thread, job.goal).tag(job_name)'
-        else:
-            evaluation_str += '.do(job.goal).tag(job_name)'
+        """
+        if self._shutdown_requested or not ConfigLoader.reload_config(ConfigLoader.env(), force=True):
+            return []
+
+        schedule, definitions = Scheduler._configured_schedule(), Scheduler._configured_jobs()
+        with self._lock:
+            if schedule != self._schedule_definition:
+                every, unit, at, cron, jitter, spread = schedule
+                try:
+                    compile_schedule(every, unit, at, cron)
+                except ValueError as e:
+                    audit_params(Sc.OPERATION_CONFIGURATION, Sc.STATUS_INVALID, 'Schedule ignored: ' + str(e))
+                    return []
+                self._every, self._unit, self._at_time, self._cron = every, unit, at, cron
+                self._jitter = jitter if isnone(self._jitter_override) else self._jitter_override
+                self._spread = spread if isnone(self._spread_override) else self._spread_override
+                changed = list(self._configured)
+            else:
+                changed = [name for name in self._configured
+                           if definitions.get(name) != self._job_definitions.get(name)]
+            self._schedule_definition, self._job_definitions = schedule, definitions
+
+            trigger = compile_schedule(self._every, self._unit, self._at_time, self._cron)
+            triggers = {}
+            for name in changed:
+                jitter, spread = self._configured[name]
+                try:
+                    triggers[name] = self._job_schedule(name, trigger, None, jitter, spread, definitions)
+                except ValueError as e:
+                    audit_params(Sc.OPERATION_CONFIGURATION, Sc.STATUS_INVALID,
+                                 'Schedule of {} ignored: {}'.format(name, e))
+
+            rescheduled = self._dispatcher.reschedule(triggers, time.time())
+            if not isnone(self._job_store):
+                for scheduled in rescheduled:
+                    self._job_store.add(scheduled)
+
+        names = sorted({scheduled.name for scheduled in rescheduled})
+        if names:
+            print(Sc.MSG_JOBS_RESCHEDULED.format(', '.join(names)))
+            audit_params(Sc.OPERATION_SCHEDULE, Sc.STATUS_SCHEDULED, Sc.MSG_JOBS_RESCHEDULED.format(', '.join(names)))
+        return names
+
+    def _spread_schedule(self, trigger: Trigger, name: str, jitter: float, spread: bool) -> Trigger:
+        """
+        Applies jitter and spread of a job, or the defaults of this instance, please see ``spread_schedule``.
+
+        """
+        return spread_schedule(trigger, name, self._jitter if isnone(jitter) else jitter,
+                               self._spread if isnone(spread) else spread)
+
+    def _execution(self, job: Job, execute_parallel: bool, execution: str) -> str:
+        """
+        Resolves and validates the execution mode of a job. Starts the worker process pool if required.
+
+        """
+        if isnone(execution):
+            execution = Sc.EXECUTION_THREAD if execute_parallel else Sc.EXECUTION_INLINE
+
+        if execution not in Sc.EXECUTION_MODES:
+            raise ValueError(Sc.MSG_EX_ILLEGAL_EXECUTION)
 
-        eval(evaluation_str)
+        if execution == Sc.EXECUTION_PROCESS:
+            Scheduler._ensure_picklable(job)
+            if isnone(self._process_pool):
+                self._process_pool = ProcessPool(**self._process_pool_args)
 
+        return execution
+
+    def _summary(self, scheduled: ScheduledJob, count: int) -> str:
         comments = StringBuilder(', ')
-        comments.append('A job scheduled. Summary (Every=' + str(self._every)) \
+        comments.append('{} job(s) scheduled. Summary (Every={}'.format(count, self._every)) \
             .append('TimeUnit=' + str(self._unit)) \
             .append('At=' + str(self._at_time)) \
+            .append('Cron=' + str(self._cron)) \
+            .append('Trigger=' + repr(scheduled.trigger)) \
             .append('SeparateThread=' + str(self._separate_thread)) \
-            .append('RunningContinuously=' + str(self._run_continuous)) \
-            .append('Pulse=' + str(self._pulse) + ')')
+            .append('Execution=' + scheduled.execution) \
+            .append('MaxInstances=' + str(scheduled.max_instances)) \
+            .append('OverlapPolicy=' + str(scheduled.overlap_policy)) \
+            .append('MisfireGraceTime=' + str(scheduled.misfire_grace_time)) \
+            .append('CatchUp=' + scheduled.catch_up) \
+            .append('Timeout=' + str(scheduled.timeout)) \
+            .append('Priority=' + str(scheduled.priority)) \
+            .append('Weight=' + str(scheduled.weight)) \
+            .append('RunningContinuously=' + str(self._run_continuous) + ')')
+        return comments.to_string()
+
+    def pool_stats(self, execution: str = Sc.EXECUTION_THREAD) -> dict:
+        """
+        Retrieves statistics of the worker pool executing parallel jobs
+
+        Parameters
+        ----------
+        execution : str
+                    ``thread`` for the worker pool, ``process`` for the worker process pool
 
-        audit_params(Sc.OPERATION_SCHEDULE, Sc.STATUS_SCHEDULED, comments.to_string())
+        Returns
+        --------
+        dict
+            ``active``, ``queued``, ``completed``, ``rejected`` and ``dropped`` counts along with pool limits
+            and queue ``wait`` (count, mean and max seconds) by priority,
+            empty if no job has been scheduled for ``process`` execution
 
-        print(Sc.MSG_JOB_SCHEDULED)
+        """
+        if execution == Sc.EXECUTION_PROCESS:
+            return {} if isnone(self._process_pool) else self._process_pool.stats()
+        return self._pool.stats()
+
+    def _submit(self, scheduled: ScheduledJob, lease: Lease, kwargs: dict, token: CancellationToken,
+                timer: RunTimer, coalesced: bool = False):
+        """
+        Submits a job goal to the worker pool. A rejected firing and a failed job are audited.
+        A coalesced run is submitted by the worker completing the previous run, it never waits for room
+        in the queue and is skipped if the queue is full.
+
+        Parameters
+        ----------
+        scheduled : ScheduledJob
+                    a due job
+        lease : Lease
+                lease of the run, released once the run completes
+        kwargs : dict
+                 keyword arguments of the goal
+        token : CancellationToken
+                cancelled along with abandoning the worker once the run exceeds its timeout, the timeout starts
+                once a worker picked the run up, time waiting in the queue does not count
+        timer : RunTimer
+                measures the run once a worker picked it up
+        coalesced : bool
+                    ``True`` if it is a coalesced run. Default ``False``
+
+        """
+        try:
+            future = self._pool.enqueue(timer.wrap(scheduled.job.goal), kwargs=kwargs, priority=scheduled.priority,
+                                        weight=scheduled.weight, flow=scheduled.name, block=not coalesced,
+                                        on_start=None if isnone(scheduled.timeout)
+                                        else lambda f: self._watch(scheduled, f, token))
+        except RuntimeError:
+            future, reason = None, 'worker pool has been shutdown'
+        else:
+            reason = 'worker pool queue is full'
+        if isnone(future):
+            self._reject(scheduled, lease, reason, coalesced)
+            return
+
+        future.add_done_callback(lambda f: self._complete(f, scheduled, lease))
+
+    def _watch(self, scheduled: ScheduledJob, future, token: CancellationToken):
+        """
+        Starts the timeout of a ``thread`` run, it is called by the worker which picked the run up.
+
+        """
+        handle = self._watchdog.watch(scheduled.timeout, lambda: self._time_out(scheduled, future, token))
+        future.add_done_callback(lambda f: Watchdog.cancel(handle))
+
+    def _time_out(self, scheduled: ScheduledJob, future, token: CancellationToken):
+        """
+        Cancels the token of a timed out ``thread`` run and abandons its worker,
+        the run then completes as timed out.
+
+        """
+        token.cancel()
+        self._pool.abandon(future, JobTimeoutError(scheduled.timeout))
+
+    def _submit_process(self, scheduled: ScheduledJob, lease: Lease, kwargs: dict, timer: RunTimer,
+                        coalesced: bool = False):
+        """
+        Submits a job instance to the worker process pool. The outcome including the result is audited.
+        A coalesced run never waits for room in the queue, please see ``_submit``.
+
+        Parameters
+        ----------
+        scheduled : ScheduledJob
+                    a due job having a picklable job instance
+        lease : Lease
+                lease of the run, released once the run completes
+        kwargs : dict
+                 keyword arguments of the goal
+        timer : RunTimer
+                measures the run once it is sent to a worker process
+        coalesced : bool
+                    ``True`` if it is a coalesced run. Default ``False``
+
+        """
+        try:
+            future = self._process_pool.submit(scheduled.job, timeout=scheduled.timeout, priority=scheduled.priority,
+                                               weight=scheduled.weight, on_start=timer.start, block=not coalesced,
+                                               **kwargs)
+        except RuntimeError:
+            future, reason = None, 'process pool has been shutdown'
+        else:
+            reason = 'process pool queue is full'
+        if isnone(future):
+            self._reject(scheduled, lease, reason, coalesced)
+        else:
+            future.add_done_callback(lambda f: timer.stop())
+            future.add_done_callback(lambda f: self._complete(f, scheduled, lease, audit_result=True))
+
+    def _reject(self, scheduled: ScheduledJob, lease: Lease, reason: str, coalesced: bool):
+        """
+        Audits a firing which could not be submitted, a coalesced run is skipped, others are rejected.
+
+        """
+        if coalesced:
+            audit_params(Sc.OPERATION_JOB_RUN, Sc.STATUS_SKIPPED, scheduled.name + ' coalesced run skipped, ' + reason)
+            self._checkpoint(scheduled, Sc.STATUS_SKIPPED)
+        else:
+            audit_params(Sc.OPERATION_JOB_RUN, Sc.STATUS_REJECTED, scheduled.name + ' rejected, ' + reason)
+            self._checkpoint(scheduled, Sc.STATUS_REJECTED)
+        self._release(scheduled, lease)
+
+    def _complete(self, future, scheduled: ScheduledJob, lease: Lease, audit_result: bool = False):
+        self._checkpoint(scheduled, Scheduler._audit_outcome(future, scheduled.name, audit_result))
+        self._release(scheduled, lease)
+
+    def _take_lease(self, scheduled: ScheduledJob, fire_time: float):
+        """
+        Acquires the lease of a due job for the fire time being run. A refused lease is audited,
+        a lease store failure is audited and refuses the lease.
+
+        Parameters
+        ----------
+        scheduled : ScheduledJob
+                    a due job
+        fire_time : float
+                    the fire time being run, not the next deadline of the job which may have moved on already,
+                    e.g. for a coalesced run
+
+        Returns
+        --------
+        Lease
+            the granted lease, ``None`` if refused
+
+        """
+        try:
+            lease = self._lease_store.acquire(scheduled.name, self._owner, fire_time,
+                                              scheduled.trigger.next_fire(fire_time), self._lease_ttl)
+        except Exception as e:
+            audit_params(Sc.OPERATION_JOB_RUN, Sc.STATUS_FAILED,
+                         scheduled.name + ' lease could not be acquired: ' + repr(e))
+            return None
+
+        if isnone(lease):
+            audit_params(Sc.OPERATION_JOB_RUN, Sc.STATUS_SKIPPED,
+                         scheduled.name + ' skipped, leased by another instance')
+            self._checkpoint(scheduled, Sc.STATUS_SKIPPED)
+        return lease
+
+    def _persist(self, scheduled_jobs: list, restore: bool):
+        """
+        Adds newly scheduled jobs to the job store. If ``restore`` is true, a job continues from its stored
+        last run and, unless its schedule changed, its stored next run.
 
-    def _spawn_thread(self, goal):
-        _job_thread = threading.Thread(target=goal)
-        _job_thread.start()
+        """
+        if isnone(self._job_store):
+            return
 
-    def _override_schedule(self, schedule_config: ScheduleConfig):
+        for scheduled in scheduled_jobs:
+            stored = self._restored.pop(scheduled.name, None)
+            if restore and not isnone(stored):
+                scheduled.last_run = stored.last_run
+                if stored.trigger == scheduled.trigger:
+                    scheduled.deadline = stored.deadline
+                elif not isnone(stored.last_run):
+                    scheduled.deadline = scheduled.trigger.next_fire(stored.last_run)
+            self._job_store.add(scheduled)
+
+    def _checkpoint(self, scheduled: ScheduledJob, outcome: str = None):
+        if not isnone(outcome):
+            self._metrics.count(scheduled.name, outcome)
+        if not isnone(self._job_store):
+            self._job_store.update(scheduled, outcome)
+
+    def _acquire(self, scheduled: ScheduledJob) -> bool:
         """
-        User must not provide values for both Every and At, this will result in ValueError.
-        After validating it overides time unit, every or at
+        Checks the overlap limits of a due job, a skipped or coalesced firing is audited.
+
+        Returns
+        --------
+        bool
+            ``True`` if the job may run now
+
+        """
+        with self._lock:
+            if scheduled.acquire():
+                self._runs[scheduled.name] = self._runs.get(scheduled.name, 0) + 1
+                return True
+            running = scheduled.running
+
+        audit_params(Sc.OPERATION_JOB_RUN, Sc.STATUS_SKIPPED,
+                     '{} skipped, {} run(s) in progress, overlap policy {}'
+                     .format(scheduled.name, running, scheduled.overlap_policy))
+        self._checkpoint(scheduled, Sc.STATUS_SKIPPED)
+        return False
+
+    def _release(self, scheduled: ScheduledJob, lease: Lease = None):
+        """
+        Releases the lease of a completed run, counts the run and starts a coalesced run if one is pending,
+        unless shutdown is requested. A draining shutdown is notified once no run is in flight.
+
+        """
+        if not isnone(lease):
+            try:
+                self._lease_store.release(lease)
+            except Exception as e:
+                audit_params(Sc.OPERATION_JOB_RUN, Sc.STATUS_FAILED,
+                             scheduled.name + ' lease could not be released: ' + repr(e))
+
+        with self._lock:
+            rerun = scheduled.release() and not self._shutdown_requested
+            remaining = self._runs.get(scheduled.name, 0) - 1
+            if remaining > 0:
+                self._runs[scheduled.name] = remaining
+            else:
+                self._runs.pop(scheduled.name, None)
+            if not self._runs:
+                self._runs_done.notify_all()
+        if rerun:
+            self._fire(scheduled, coalesced=True)
+
+    @staticmethod
+    def _audit_outcome(future, job_name: str, audit_result: bool = False) -> str:
+        if future.cancelled():
+            audit_params(Sc.OPERATION_JOB_RUN, Sc.STATUS_DROPPED, job_name + ' dropped, worker pool queue is full')
+            return Sc.STATUS_DROPPED
+        if isinstance(future.exception(), JobTimeoutError):
+            audit_params(Sc.OPERATION_JOB_RUN, Sc.STATUS_TIMED_OUT, job_name + ' ' + str(future.exception()))
+            return Sc.STATUS_TIMED_OUT
+        if not isnone(future.exception()):
+            audit_params(Sc.OPERATION_JOB_RUN, Sc.STATUS_FAILED, job_name + ' failed: ' + str(future.exception()))
+            return Sc.STATUS_FAILED
+        if audit_result:
+            audit_params(Sc.OPERATION_JOB_RUN, Sc.STATUS_COMPLETE, job_name + ' result: ' + repr(future.result()))
+        return Sc.STATUS_COMPLETE
+
+    @staticmethod
+    def _ensure_picklable(job: Job):
+        try:
+            pickle.dumps(job)
+        except Exception as e:
+            raise ValueError(Sc.MSG_EX_JOB_NOT_PICKLABLE) from e
+
+    def _compile(self, schedule_config: ScheduleConfig) -> Trigger:
+        """
+        Compiles the schedule into a trigger. If ``schedule_config`` is provided, it overrides every, at and
+        time unit of this instance, otherwise schedule from configurations (or the last override) is used.
+        The instance is only changed if the schedule is valid.
 
         Parameters
         ----------
         schedule_config : ScheduleConfig
                             a job specific schedule configurations. Every or At and/or Time Unit.
 
+        Returns
+        --------
+        Trigger
+            compiled schedule
+
         Raises
         ------
         ValueError
-            If values for every and at are provided (both), then this rejects scheduling the job
+            If values for every and at are provided (both) or the combination with time unit is invalid,
+            then this rejects scheduling the job
 
         """
+        if isnone(schedule_config):
+            return compile_schedule(self._every, self._unit, self._at_time, self._cron)
+
         if not schedule_config.is_valid():
             raise ValueError(Sc.MSG_EX_INVALID_SCHEDULE_CONFIG)
 
+        trigger = schedule_config.trigger()
+        self._every = schedule_config.every()
         self._unit = schedule_config.time_unit()
-
-        if not isnone(schedule_config.every()):
-            self._every = schedule_config.every()
-
-        elif not is_empty(schedule_config.at()):
-            self._at_time = schedule_config.at()
+        self._at_time = schedule_config.at()
+        self._cron = schedule_config.cron()
+        return trigger
 
     def cancel_job(self, job_name: str):
         """
@@ -341,7 +992,53 @@ class Scheduler:
 
         """
         if not isnone(job_name) and not self._shutdown_requested:
-            schedule.clear(job_name)
+            with self._lock:
+                self._dispatcher.cancel(job_name)
+                self._configured.pop(job_name, None)
+                self._restored.pop(job_name, None)
+                if not isnone(self._job_store):
+                    self._job_store.remove(job_name)
+
+    def jobs(self) -> list:
+        """
+        Retrieves names of all jobs scheduled on this instance, earliest next run first
+
+        Returns
+        --------
+        list
+            a list of job names
+
+        """
+        return [scheduled.name for scheduled in self._dispatcher.jobs()]
+
+    def run_stats(self) -> dict:
+        """
+        Retrieves run statistics of all jobs scheduled on this instance. Lateness is the delay between
+        the fire time and dispatching the job, it grows when the scheduler falls behind.
+
+        Returns
+        --------
+        dict
+            job name to ``last_run`` and ``next_run`` fire time (seconds since epoch), number of ``runs`` and
+            ``misfires``, ``lateness_last``, ``lateness_max`` and ``lateness_mean`` in seconds
+
+        """
+        return {scheduled.name: scheduled.stats() for scheduled in self._dispatcher.jobs()}
+
+    def metrics(self) -> dict:
+        """
+        Retrieves run metrics of all jobs run by this instance, including cancelled jobs.
+
+        Returns
+        --------
+        dict
+            job name to histograms of ``lateness`` (seconds between fire time and start of the goal),
+            ``queue_wait`` (seconds between dispatch and start of the goal) and ``duration`` in seconds, each
+            holding ``count``, ``mean``, ``max``, estimated ``p50``, ``p90`` and ``p99`` and cumulative ``buckets``,
+            and ``outcomes``, number of runs by outcome, e.g. ``Complete``, ``Failed`` and ``Skipped``
+
+        """
+        return self._metrics.snapshot()
 
     def what_is_next_run(self):
         """
@@ -349,13 +1046,13 @@ class Scheduler:
 
         Returns
         --------
-        object
-            next run schedule
+        datetime
+            next run schedule, ``None`` if no job is scheduled
 
         """
-        return self._next_run
+        return self._dispatcher.next_run()
 
-    def start(self, print_next_run=True):
+    def start(self, print_next_run=True, metrics_port: int = None):
         """
         Starts the scheduler as per the configurations and parameters. Calling this method more than once has
         no effect if ``shutdown`` requested or already started.
@@ -365,8 +1062,10 @@ class Scheduler:
         Parameters
         ----------
         print_next_run : bool
-                         if ``True`` it will keep printing next rnu schedule at every ``pulse_seconds``.
-                         Default every 5 seconds
+                         if ``True`` it will print next run schedule whenever the earliest job changes.
+        metrics_port : int
+                       if provided, metrics are served in the Prometheus text format on this port of localhost
+                       by a ``PrometheusExporter``. Default ``None``
 
         """
         if self._shutdown_requested or self._started:
@@ -378,54 +1077,116 @@ class Scheduler:
 
         audit_params(Sc.OPERATION_START_JOBS, Sc.STATUS_STARTING, 'Starting scheduled jobs')
 
+        if not isnone(metrics_port):
+            self._metrics_exporters.append(PrometheusExporter(port=metrics_port))
+        for exporter in self._metrics_exporters:
+            exporter.start(self)
+        if self._watch_config:
+            self._config_watcher = ConfigWatcher(ConfigLoader.config_paths(), self.reload_config)
+            self._config_watcher.start()
+            print(Sc.MSG_CONFIG_WATCHING.format(', '.join(ConfigLoader.config_paths())))
+
+        with self._lock:
+            if self._restored:
+                restored, self._restored = list(self._restored.values()), {}
+                self._dispatcher.add_all(restored)
+                audit_params(Sc.OPERATION_SCHEDULE, Sc.STATUS_SCHEDULED,
+                             '{} job(s) restored from job store'.format(len(restored)))
+
+        self._drained.clear()
         if self._separate_thread:
-            self._stop_event = self._schedule_in_separate_thread()
+            self._schedule_in_separate_thread()
         else:
             self._schedule_in_main_thread()
 
-    def shutdown(self, force: bool = False):
+    def shutdown(self, force: bool = False, timeout: float = None) -> dict:
         """
-        Shuts down the scheduler. When requested, calling cancel any job has no effect.
+        Shuts down the scheduler by draining it, no more firings are dispatched and jobs which are not due
+        are not run. When requested, calling cancel any job has no effect. Calling it more than once, e.g. by
+        a user, a signal handler and at exit, has no effect after the first call, which shuts down.
 
         Parameters
         ----------
         force : bool
-                if ``True`` it will not wait until the jobs complete, otherwise will wait until
-                all jobs complete and then safely shutdown
+                if ``True`` it will not wait until the running jobs complete and queued firings are cancelled,
+                otherwise it waits until all running and queued runs complete and then safely shutdown
+        timeout : float
+                  maximum seconds to wait for runs to complete, afterwards queued firings are cancelled and
+                  runs still in flight are reported. Queued audit trails are flushed within the same time.
+                  Default ``None``, waits until all runs complete and all audit trails are captured
 
-        """
+        Returns
+        --------
+        dict
+            job name to number of runs still in flight once shutdown returns, empty if all runs completed
+            or shutdown has already been requested
 
-        if inspect.stack()[1].function != '_shut_it_down':
-            return
+        """
+        with self._lock:
+            if self._shutdown_requested:
+                return {}
+            self._shutdown_requested = True
 
+        deadline = None if isnone(timeout) else time.monotonic() + timeout
         print(Sc.MSG_SHUTTING_DOWN_SCHEDULER)
         audit_params(Sc.OPERATION_SHUTDOWN, Sc.STATUS_STARTING, Sc.MSG_SHUTTING_DOWN_SCHEDULER + ' Force=' + str(force))
 
-        if self._run_continuous:
-            self.__wait = True
-            self._shutdown_requested = True
-            if self._separate_thread:
-                self._stop_event.set()
-            else:
-                self._run_continuous = False
-
-            if not force:
-                self._wait_until_safely_shutdown()
-        schedule.clear()
+        self._dispatcher.stop()
+        if not isnone(self._config_watcher):
+            self._config_watcher.stop()
+
+        if not force:
+            self._drain(deadline)
+        with self._lock:
+            in_flight = dict(self._runs)
+            self._dispatcher.clear()
+        if in_flight:
+            report = Sc.MSG_SHUTDOWN_IN_FLIGHT.format(', '.join('{} ({})'.format(name, count)
+                                                                for name, count in sorted(in_flight.items())))
+            print(report)
+            audit_params(Sc.OPERATION_SHUTDOWN, Sc.STATUS_INTERRUPTED, report)
+
+        abandon = force or bool(in_flight)
+        self._pool.shutdown(wait=not abandon, cancel_pending=abandon)
+        if not isnone(self._process_pool):
+            self._process_pool.shutdown(wait=not abandon, cancel_pending=abandon)
+        if not isnone(self._job_store):
+            self._job_store.close()
+        self._watchdog.stop()
+        for exporter in self._metrics_exporters:
+            exporter.stop()
 
         audit_params(Sc.OPERATION_SHUTDOWN, Sc.STATUS_COMPLETE, Sc.MSG_SCHEDULER_SHUTDOWN_COMPLETE)
+        Auditor.flush(None if isnone(deadline) else max(0.0, deadline - time.monotonic()))
 
         print(Sc.MSG_SCHEDULER_SHUTDOWN_COMPLETE)
+        return in_flight
 
-    def _wait_until_safely_shutdown(self):
+    def _drain(self, deadline: float = None) -> bool:
         """
-        If not force shutdown, then this method will ensure all jobs will complete before shutdown safely.
+        Waits until the dispatch loop returned and all runs, including queued firings, completed.
+
+        Parameters
+        ----------
+        deadline : float
+                   ``time.monotonic()`` after which it stops waiting. Default ``None``, no limit
+
+        Returns
+        --------
+        bool
+            ``True`` if no run is in flight
 
         """
         audit_params(Sc.OPERATION_SHUTDOWN, Sc.STATUS_WAITING, Sc.MSG_WAIT_UNTIL_SAFE_SHUTDOWN)
-        while self.__wait:
-            print("Please wait...")
-            time.sleep(2)
+        if not self._drained.wait(None if isnone(deadline) else max(0.0, deadline - time.monotonic())):
+            return False
+        with self._runs_done:
+            while self._runs:
+                remaining = None if isnone(deadline) else deadline - time.monotonic()
+                if not isnone(remaining) and remaining <= 0:
+                    return False
+                self._runs_done.wait(remaining)
+        return True
 
     def _schedule_in_main_thread(self):
         """
@@ -434,123 +1195,161 @@ class Scheduler:
         Otherwise run all jobs at once.
 
         """
+        audit_params(Sc.OPERATION_START_JOBS, Sc.STATUS_STARTED, Sc.MSG_JOB_STARTED.format(str(self._print_etr)))
 
-        if self._run_continuous:
-            audit_params(Sc.OPERATION_START_JOBS, Sc.STATUS_STARTED, Sc.MSG_JOB_STARTED.format(str(self._print_etr)))
-            self._started = True
-            while True:
-                try:
-                    if not self._run_continuous:
-                        print(Sc.MSG_SHUTDOWN_SCHEDULER_RUNNING_ALL)
-                        schedule.run_all()
-                        self.__wait = False
-                        self._shutdown_requested = False
-                        self._started = False
-                        break
-
-                    self._next_run = schedule.next_run()
-                    self._idle_seconds = schedule.idle_seconds()
-                    self._log_etr()
-
-                    schedule.run_pending()
-
-                    time.sleep(self._pulse)
-                except KeyboardInterrupt:
-                    audit_params(operation=Sc.OPERATION_SHUTDOWN,
-                                 status=Sc.STATUS_INTERRUPTED,
-                                 comments=Sc.MSG_SCHEDULER_INTERRUPTED)
-                    schedule.run_all()
-                    self.__wait = False
-                    self._shutdown_requested = False
-                    self._started = False
-                    break
-        else:
-            audit_params(Sc.OPERATION_START_JOBS, Sc.STATUS_STARTED, Sc.MSG_JOB_STARTED.format(str(self._print_etr)))
-            schedule.run_all()
-            # time.sleep(self._pulse)
+        interrupted = False
+        try:
+            if self._run_continuous:
+                interrupted = self._run_loop()
+            else:
+                self._run_all()
+        finally:
+            self._drained.set()
+        if interrupted:
+            self.shutdown()
 
-    def _schedule_in_separate_thread(self) -> threading.Event:
+    def _schedule_in_separate_thread(self):
         """
         Run scheduler in a separate thread written in inner class.
         If ``run_continuous`` is true then it will continuously run the jobs on schedule.
-        Otherwise run all jobs at once.
-
-        Parameters
-        ----------
-        threading.Event
-                        A threading event which will later use to safely shutdown scheduler
+        Otherwise run all jobs at once. ``shutdown`` stops the dispatch loop of the thread.
 
         """
-        stop_continuous_run = threading.Event()
-
         class SeparateThread(threading.Thread):
             @classmethod
             def run(cls):
-                if self._run_continuous:
-                    audit_params(Sc.OPERATION_START_JOBS, Sc.STATUS_STARTED,
-                                 Sc.MSG_JOB_STARTED.format(str(self._print_etr)))
-                    self._started = True
-                    while True:
-                        try:
-                            if stop_continuous_run.is_set():
-                                print(Sc.MSG_SHUTDOWN_SCHEDULER_RUNNING_ALL)
-                                schedule.run_all()
-                                self.__wait = False
-                                self._shutdown_requested = False
-                                self._started = False
-                                break
-
-                            self._next_run = schedule.next_run()
-                            self._idle_seconds = schedule.idle_seconds()
-                            self._log_etr()
-
-                            schedule.run_pending()
-
-                            time.sleep(self._pulse)
-                        except KeyboardInterrupt:
-                            audit_params(operation=Sc.OPERATION_SHUTDOWN,
-                                         status=Sc.STATUS_INTERRUPTED,
-                                         comments=Sc.MSG_SCHEDULER_INTERRUPTED)
-                            self._stop_event.set()
-                            schedule.run_all()
-                            self.__wait = False
-                            self._shutdown_requested = False
-                            self._started = False
-                            break
-                else:
-                    audit_params(Sc.OPERATION_START_JOBS, Sc.STATUS_STARTED,
-                                 Sc.MSG_JOB_STARTED.format(str(self._print_etr)))
-                    schedule.run_all()
-                    # time.sleep(self._pulse)
+                self._schedule_in_main_thread()
 
         continuous_thread = SeparateThread()
         continuous_thread.start()
 
-        return stop_continuous_run
+    def _run_loop(self) -> bool:
+        """
+        Runs the dispatch loop until shutdown is requested or interrupted. Once interrupted the caller shuts down
+        the scheduler, i.e. jobs are not run once more and it waits until running jobs complete.
+
+        Returns
+        --------
+        bool
+            ``True`` if the dispatch loop has been interrupted
 
-    def _at(self):
         """
-        If at is provided then this method will set the clock time on schedule.
+        self._started = True
+        try:
+            self._dispatcher.run()
+        except KeyboardInterrupt:
+            audit_params(operation=Sc.OPERATION_SHUTDOWN,
+                         status=Sc.STATUS_INTERRUPTED,
+                         comments=Sc.MSG_SCHEDULER_INTERRUPTED)
+            return True
+        finally:
+            self._started = False
+        return False
+
+    def _fire(self, scheduled: ScheduledJob, coalesced: bool = False, fire_time: float = None) -> bool:
+        """
+        Runs a due job as per its execution mode. A failure of an ``inline`` job is audited
+        and does not stop the dispatch loop.
+
+        Parameters
+        ----------
+        scheduled : ScheduledJob
+                    a due job
+        coalesced : bool
+                    ``True`` if it is a coalesced run started by the completion of the previous run. Default ``False``
+        fire_time : float
+                    the fire time being run, in seconds since epoch. Default the last fire time the job began,
+                    i.e. the due fire time or the fire time a coalesced run stands for
 
         Returns
         --------
-        str
-            a schedule having clock time set, blank if every is provided
+        bool
+            ``True`` to keep the job for its next run
+
+        """
+        if not self._acquire(scheduled):
+            return True
+
+        if isnone(fire_time):
+            fire_time = time.time() if isnone(scheduled.last_run) else scheduled.last_run
+        lease = None
+        if not isnone(self._lease_store):
+            lease = self._take_lease(scheduled, fire_time)
+            if isnone(lease):
+                self._release(scheduled)
+                return True
+        kwargs = {'lease': lease} if not isnone(lease) and scheduled.accepts('lease') else {}
+
+        token = None
+        if not isnone(scheduled.timeout) and scheduled.execution != Sc.EXECUTION_PROCESS:
+            token = CancellationToken()
+            if scheduled.accepts('cancel_token'):
+                kwargs['cancel_token'] = token
+
+        timer = self._metrics.timer(scheduled.name, fire_time)
+        if scheduled.execution == Sc.EXECUTION_PROCESS:
+            self._submit_process(scheduled, lease, kwargs, timer, coalesced)
+        elif scheduled.execution == Sc.EXECUTION_THREAD:
+            self._submit(scheduled, lease, kwargs, token, timer, coalesced)
+        else:
+            self._run_inline(scheduled, lease, kwargs, token, timer)
+        return True
 
+    def _run_inline(self, scheduled: ScheduledJob, lease: Lease, kwargs: dict, token: CancellationToken,
+                    timer: RunTimer):
         """
-        if not is_empty(self._at_time) \
-                and not Scheduler._is_number(self._at_time) \
-                and ":" in self._at_time:
-            print('time clock')
-            return '.at(self._at_time)'
-        return ''
+        Runs a job on the scheduler thread. Once its timeout elapses, the token is cancelled
+        and the run is audited as timed out when it returns.
+
+        """
+        handle = None
+        if not isnone(token):
+            handle = self._watchdog.watch(scheduled.timeout, token.cancel)
+
+        outcome = Sc.STATUS_COMPLETE
+        timer.start()
+        try:
+            scheduled.job.goal(**kwargs)
+        except Exception as e:
+            outcome = Sc.STATUS_FAILED
+            audit_params(Sc.OPERATION_JOB_RUN, Sc.STATUS_FAILED, scheduled.name + ' failed: ' + repr(e))
+        finally:
+            timer.stop()
+            if not isnone(handle):
+                Watchdog.cancel(handle)
+                if token.is_cancelled():
+                    outcome = Sc.STATUS_TIMED_OUT
+                    audit_params(Sc.OPERATION_JOB_RUN, Sc.STATUS_TIMED_OUT,
+                                 scheduled.name + ' ' + str(JobTimeoutError(scheduled.timeout)))
+            self._checkpoint(scheduled, outcome)
+            self._release(scheduled, lease)
+
+    def _run_all(self):
+        """
+        Runs all scheduled jobs once, regardless of their schedule.
+
+        """
+        for scheduled in self._dispatcher.jobs():
+            self._fire(scheduled, fire_time=time.time())
+
+    def _on_misfire(self, scheduled: ScheduledJob, lateness: float):
+        audit_params(Sc.OPERATION_JOB_RUN, Sc.STATUS_MISFIRED,
+                     '{} missed its fire time by {:.3f} seconds, catch up policy {}'
+                     .format(scheduled.name, lateness, scheduled.catch_up))
+        self._checkpoint(scheduled, Sc.STATUS_MISFIRED)
+
+    def _on_next_run(self, next_run, idle_seconds):
+        self._next_run = next_run
+        self._idle_seconds = idle_seconds
+        self._log_etr()
 
     def _log_etr(self):
         """
-        Prints Estimated Time to Next Run and remaining time (in seconds) on console
+        Prints Estimated Time to Next Run and remaining time (in seconds) on console,
+        whenever the earliest job changes
 
         """
-        if self._print_etr:
+        if self._print_etr and not isnone(self._next_run):
             # __nextrun = self._next_run
             # remaining_time = self._next_run - datetime.datetime.now()
             print(Sc.MSG_NEXT_RUN_SCHEDULE.format(str(self._next_run), str(self._idle_seconds)))
@@ -0,0 +1,318 @@
+"""
+A hierarchical timing wheel, an index of scheduled jobs by next fire time for very large numbers of jobs.
+
+Time is divided into ticks of ``resolution`` seconds. The wheel has ``6`` levels of ``64`` slots, a slot of level
+``n`` spans ``64 ** n`` ticks, therefore the levels cover about 2177 years at the default resolution of 1 second.
+A job is placed by the digits (base 64) of its fire tick: at the lowest level whose higher digits are equal to
+the digits of the current tick, in the slot of its digit at that level. Jobs further away than the top level
+are kept aside until the top level wraps around.
+
+* insert and cancel cost O(1), a slot is a dict and the job location is remembered
+* every level keeps an occupancy bitmask, bit ``n`` is set if slot ``n`` holds a job. The next occupied slot
+  is found by a few integer operations instead of visiting empty slots
+* once the current tick reaches a slot of a higher level, its jobs cascade down to lower levels. A job cascades
+  at most once per level, therefore expiry is amortised O(1)
+* expired jobs are ordered by fire time and priority in a small heap of due jobs
+* the earliest job of a slot is cached, therefore the next fire time is known without scanning jobs
+
+The cost per job does not grow with the number of jobs, whereas the cost of the default heap grows
+logarithmically. The heap is implemented in C though, please compare both with ``benchmarks.timing_wheel``.
+
+Example
+--------
+1.  sche = Scheduler(timing_wheel=True)
+
+"""
+
+import heapq
+import itertools
+import math
+import operator
+
+import utils.Constants as Sc
+
+_BITS = 6
+_SLOTS = 1 << _BITS
+_MASK = _SLOTS - 1
+_LEVELS = 6
+_SPAN = _BITS * _LEVELS
+
+# location of a job which is due, i.e. held by the heap of due jobs
+_DUE = (-1, -1)
+
+_order = operator.attrgetter('deadline', 'priority')
+
+
+def _lowest_bit(mask: int) -> int:
+    return (mask & -mask).bit_length() - 1
+
+
+class TimingWheel:
+    """
+    Indexes scheduled jobs by fire time, please see module documentation.
+    Instances are not thread safe, ``Dispatcher`` accesses the index under its lock.
+
+    """
+
+    def __init__(self, resolution: float = Sc.DEFAULT_WHEEL_RESOLUTION, now: float = None):
+        """
+        Creates an empty wheel.
+
+        Parameters
+        ----------
+        resolution : float
+                     seconds per tick. Jobs expire from the wheel once their tick is reached,
+                     the dispatcher still fires them at their exact fire time. Default 1.0
+        now : float
+              current time in seconds since epoch, the wheel starts at this tick
+
+        """
+        if resolution <= 0:
+            raise ValueError(Sc.MSG_EX_ILLEGAL_RESOLUTION.format(resolution))
+        self._resolution = resolution
+        self._tick = math.floor((0.0 if now is None else now) / resolution)
+        self._slots = [[{} for _ in range(_SLOTS)] for _ in range(_LEVELS)]
+        self._occupied = [0] * _LEVELS
+        self._earliest = [[None] * _SLOTS for _ in range(_LEVELS)]
+        self._locations = {}
+        self._due = []
+        self._overflow = {}
+        self._never = {}
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._locations)
+
+    def push(self, entry):
+        """
+        Inserts a scheduled job by its ``deadline``.
+
+        """
+        deadline = entry.deadline
+        if deadline == float('inf'):
+            self._never[entry] = None
+            self._locations[entry] = None
+            return
+
+        tick = math.floor(deadline / self._resolution)
+        if tick <= self._tick:
+            heapq.heappush(self._due, (deadline, entry.priority, next(self._counter), entry))
+            self._locations[entry] = _DUE
+            return
+
+        level = ((tick ^ self._tick).bit_length() - 1) // _BITS
+        if level >= _LEVELS:
+            self._overflow[entry] = None
+            self._locations[entry] = None
+            return
+
+        digit = (tick >> (_BITS * level)) & _MASK
+        slot = self._slots[level][digit]
+        slot[entry] = None
+        self._occupied[level] |= 1 << digit
+        earliest = self._earliest[level]
+        if len(slot) == 1 or (earliest[digit] is not None and _order(entry) < _order(earliest[digit])):
+            earliest[digit] = entry
+        self._locations[entry] = (level, digit)
+
+    def push_all(self, entries):
+        for entry in entries:
+            self.push(entry)
+
+    def discard(self, entry):
+        """
+        Removes a job unless it is due, a due job is discarded by ``peek`` once it is cancelled.
+
+        """
+        location = self._locations.get(entry, _DUE)
+        if location is _DUE:
+            return
+
+        del self._locations[entry]
+        if location is None:
+            self._overflow.pop(entry, None)
+            self._never.pop(entry, None)
+            return
+
+        level, digit = location
+        slot = self._slots[level][digit]
+        del slot[entry]
+        if not slot:
+            self._occupied[level] &= ~(1 << digit)
+        if self._earliest[level][digit] is entry:
+            self._earliest[level][digit] = None
+
+    def discard_all(self, entries: list):
+        """
+        Removes active jobs at once, including due jobs, e.g. before their deadline moves.
+
+        """
+        due = set()
+        for entry in entries:
+            if self._locations.get(entry) is _DUE:
+                due.add(entry)
+                del self._locations[entry]
+            else:
+                self.discard(entry)
+        if due:
+            self._due = [item for item in self._due if item[3] not in due]
+            heapq.heapify(self._due)
+
+    def remove(self, entry):
+        """
+        Removes a job returned by ``peek``.
+
+        """
+        if self._locations.get(entry) is _DUE:
+            heapq.heappop(self._due)
+            del self._locations[entry]
+        else:
+            self.discard(entry)
+
+    def peek(self, now: float):
+        """
+        Advances the wheel to the current time and retrieves the earliest active job.
+
+        Parameters
+        ----------
+        now : float
+              current time in seconds since epoch
+
+        Returns
+        --------
+        ScheduledJob
+            the job having the earliest deadline (and the highest priority among equal deadlines),
+            ``None`` if there is none
+
+        """
+        self._advance(math.floor(now / self._resolution))
+
+        while self._due:
+            entry = self._due[0][3]
+            if not entry.cancelled:
+                return entry
+            heapq.heappop(self._due)
+            self._locations.pop(entry, None)
+
+        slot = self._next_slot()
+        if slot is None:
+            if self._overflow:
+                return min(self._overflow, key=_order)
+            return next(iter(self._never), None)
+        level, digit = slot
+        earliest = self._earliest[level][digit]
+        if earliest is None:
+            earliest = min(self._slots[level][digit], key=_order)
+            self._earliest[level][digit] = earliest
+        return earliest
+
+    def entries(self) -> list:
+        return list(self._locations)
+
+    def clear(self):
+        for level in range(_LEVELS):
+            for slot in self._slots[level]:
+                slot.clear()
+            self._earliest[level] = [None] * _SLOTS
+        self._occupied = [0] * _LEVELS
+        self._locations.clear()
+        self._due.clear()
+        self._overflow.clear()
+        self._never.clear()
+
+    def _next_slot(self):
+        """
+        Finds the first occupied slot after the current tick. An occupied slot of a lower level is always
+        earlier than the occupied slots of higher levels.
+
+        Returns
+        --------
+        tuple
+            level and digit of the slot, ``None`` if all slots are empty
+
+        """
+        for level in range(_LEVELS):
+            digit = (self._tick >> (_BITS * level)) & _MASK
+            ahead = self._occupied[level] >> (digit + 1)
+            if ahead:
+                return level, digit + 1 + _lowest_bit(ahead)
+        return None
+
+    def _next_tick(self):
+        """
+        Returns
+        --------
+        int
+            the first tick of the next occupied slot, or of the next top level rotation if jobs are kept aside.
+            ``None`` otherwise
+
+        """
+        slot = self._next_slot()
+        if slot is not None:
+            level, digit = slot
+            shift = _BITS * (level + 1)
+            return ((self._tick >> shift) << shift) | (digit << (_BITS * level))
+        if self._overflow:
+            return ((self._tick >> _SPAN) + 1) << _SPAN
+        return None
+
+    def _advance(self, target: int):
+        """
+        Moves the current tick to the target, jumping from occupied slot to occupied slot. Jobs of a reached
+        slot are cascaded down to lower levels, jobs of a reached slot of the lowest level are due.
+        The earliest job of a slot receiving cascaded jobs is found once it is required.
+
+        """
+        while self._tick < target:
+            tick = self._next_tick()
+            if tick is None or tick > target:
+                self._tick = target
+                return
+
+            self._tick = tick
+            if tick & ((1 << _SPAN) - 1) == 0 and self._overflow:
+                overflow, self._overflow = self._overflow, {}
+                for entry in overflow:
+                    self.push(entry)
+
+            for level in range(_LEVELS - 1, 0, -1):
+                if tick & ((1 << (_BITS * level)) - 1):
+                    continue
+                digit = (tick >> (_BITS * level)) & _MASK
+                if self._occupied[level] >> digit & 1:
+                    self._cascade(level, digit)
+
+            digit = tick & _MASK
+            if self._occupied[0] >> digit & 1:
+                slot = self._take(0, digit)
+                self._due.extend((entry.deadline, entry.priority, next(self._counter), entry) for entry in slot)
+                heapq.heapify(self._due)
+                self._locations.update(dict.fromkeys(slot, _DUE))
+
+    def _take(self, level: int, digit: int) -> dict:
+        slot, self._slots[level][digit] = self._slots[level][digit], {}
+        self._occupied[level] &= ~(1 << digit)
+        self._earliest[level][digit] = None
+        return slot
+
+    def _cascade(self, level: int, digit: int):
+        """
+        Moves the jobs of a reached slot to lower levels, all of them share the digits of the current tick
+        from this level up.
+
+        """
+        tick, resolution, locations = self._tick, self._resolution, self._locations
+        slots, earliest = self._slots, self._earliest
+        occupied = self._occupied
+        for entry in self._take(level, digit):
+            fire_tick = math.floor(entry.deadline / resolution)
+            if fire_tick <= tick:
+                heapq.heappush(self._due, (entry.deadline, entry.priority, next(self._counter), entry))
+                locations[entry] = _DUE
+                continue
+            lower = ((fire_tick ^ tick).bit_length() - 1) // _BITS
+            lower_digit = (fire_tick >> (_BITS * lower)) & _MASK
+            slots[lower][lower_digit][entry] = None
+            occupied[lower] |= 1 << lower_digit
+            earliest[lower][lower_digit] = None
+            locations[entry] = (lower, lower_digit)
@@ -0,0 +1,358 @@
+"""
+Compiled schedule triggers.
+
+A ``ScheduleConfig`` (every, time unit and at) is compiled once into an immutable trigger which computes
+the next fire time of a job in constant time. Invalid combinations of every, time unit and at are rejected
+when the trigger is compiled, i.e. before a job is scheduled.
+All fire times are seconds since epoch, clock times (at) are interpreted in local time.
+
+Examples
+--------
+| 1. ``compile_schedule(every=10, time_unit='minutes')`` fires every 10 minutes
+| 2. ``compile_schedule(time_unit='friday', at='14:00')`` fires on every Friday at 14:00
+| 3. ``compile_schedule(time_unit='day')`` fires every day at 00:00
+| 4. ``compile_schedule(cron='*/15 8-17 * * MON-FRI')`` fires as per the cron expression, please see ``CronTrigger``
+| 5. ``spread_schedule(trigger, 'job-1', jitter=30, spread=True)`` fires at a stable offset within the period
+|    plus up to 30 seconds of jitter, please see ``SpreadTrigger``
+
+"""
+
+import datetime
+import functools
+import math
+import zlib
+from abc import ABCMeta, abstractmethod
+
+import utils.Constants as Sc
+
+_INTERVAL_UNITS = {Sc.SECOND: 1, Sc.SECONDS: 1,
+                   Sc.MINUTE: 60, Sc.MINUTES: 60,
+                   Sc.HOUR: 3600, Sc.HOURS: 3600}
+_SINGULAR_UNITS = {Sc.SECOND, Sc.MINUTE, Sc.HOUR, Sc.DAY}
+_DAY_UNITS = {Sc.DAY, Sc.DAYS}
+_WEEKDAYS = {Sc.MONDAY: 0, Sc.TUESDAY: 1, Sc.WEDNESDAY: 2, Sc.THURSDAY: 3,
+             Sc.FRIDAY: 4, Sc.SATURDAY: 5, Sc.SUNDAY: 6}
+
+_ONE_DAY = datetime.timedelta(days=1)
+
+
+class Trigger(metaclass=ABCMeta):
+    """
+    An immutable schedule which computes next fire times.
+    Subclasses define ``__slots__`` and set their fields only once, in the constructor.
+
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def next_fire(self, after: float) -> float:
+        """
+        Computes the first fire time strictly after the given time
+
+        Parameters
+        ----------
+        after : float
+                seconds since epoch
+
+        Returns
+        --------
+        float
+            next fire time in seconds since epoch
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def period(self) -> float:
+        """
+        Returns
+        --------
+        float
+            nominal seconds between two fire times
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _key(self) -> tuple:
+        raise NotImplementedError
+
+    def __setattr__(self, name, value):
+        raise AttributeError('{} is immutable'.format(type(self).__name__))
+
+    def __reduce__(self):
+        return type(self), self._key()
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash((type(self), self._key()))
+
+    def __repr__(self):
+        return '{}{}'.format(type(self).__name__, self._key())
+
+
+class IntervalTrigger(Trigger):
+    """
+    Fires every ``seconds`` after the previous fire time.
+
+    """
+
+    __slots__ = ('_seconds',)
+
+    def __init__(self, seconds: float):
+        if seconds <= 0:
+            raise ValueError(Sc.MSG_EX_ILLEGAL_EVERY.format(seconds))
+        object.__setattr__(self, '_seconds', float(seconds))
+
+    def next_fire(self, after: float) -> float:
+        return after + self._seconds
+
+    def period(self) -> float:
+        return self._seconds
+
+    def _key(self) -> tuple:
+        return self._seconds,
+
+
+class DailyTrigger(Trigger):
+    """
+    Fires at a clock time every ``days`` days.
+
+    """
+
+    __slots__ = ('_days', '_at')
+
+    def __init__(self, days: int, at: datetime.time):
+        object.__setattr__(self, '_days', int(days))
+        object.__setattr__(self, '_at', at)
+
+    def next_fire(self, after: float) -> float:
+        moment = datetime.datetime.fromtimestamp(after)
+        candidate = datetime.datetime.combine(moment.date(), self._at)
+        if candidate <= moment:
+            candidate += _ONE_DAY * self._days
+        return candidate.timestamp()
+
+    def period(self) -> float:
+        return self._days * 86400.0
+
+    def _key(self) -> tuple:
+        return self._days, self._at
+
+
+class WeeklyTrigger(Trigger):
+    """
+    Fires on a weekday (Monday = 0) at a clock time.
+
+    """
+
+    __slots__ = ('_weekday', '_at')
+
+    def __init__(self, weekday: int, at: datetime.time):
+        object.__setattr__(self, '_weekday', int(weekday))
+        object.__setattr__(self, '_at', at)
+
+    def next_fire(self, after: float) -> float:
+        moment = datetime.datetime.fromtimestamp(after)
+        days_ahead = (self._weekday - moment.weekday()) % 7
+        candidate = datetime.datetime.combine(moment.date() + _ONE_DAY * days_ahead, self._at)
+        if candidate <= moment:
+            candidate += _ONE_DAY * 7
+        return candidate.timestamp()
+
+    def period(self) -> float:
+        return 7 * 86400.0
+
+    def _key(self) -> tuple:
+        return self._weekday, self._at
+
+
+class SpreadTrigger(Trigger):
+    """
+    Delays every fire time of another trigger by a fixed ``offset`` plus a jitter between 0 and ``jitter`` seconds.
+    The jitter is derived from a hash of the ``seed`` and the fire time, therefore fire times are deterministic,
+    e.g. equal on every scheduler instance sharing a lease store and after a restart.
+    Every fire time of the other trigger is delayed by less than its period, the average rate is unchanged.
+    Fire times of an ``IntervalTrigger`` are aligned to multiples of its interval since epoch first,
+    the offset then positions the job within the interval.
+
+    """
+
+    __slots__ = ('_trigger', '_offset', '_jitter', '_seed')
+
+    def __init__(self, trigger: Trigger, offset: float, jitter: float, seed: str):
+        object.__setattr__(self, '_trigger', trigger)
+        object.__setattr__(self, '_offset', float(offset))
+        object.__setattr__(self, '_jitter', float(jitter))
+        object.__setattr__(self, '_seed', str(seed))
+
+    def next_fire(self, after: float) -> float:
+        nominal = self._nominal(after - self._offset - self._jitter)
+        while nominal != float('inf'):
+            fire = nominal + self._delay(nominal)
+            if fire > after:
+                return fire
+            nominal = self._nominal(nominal)
+        return nominal
+
+    def period(self) -> float:
+        return self._trigger.period()
+
+    def _nominal(self, after: float) -> float:
+        if isinstance(self._trigger, IntervalTrigger):
+            interval = self._trigger.period()
+            return (math.floor(after / interval) + 1) * interval
+        return self._trigger.next_fire(after)
+
+    def _delay(self, nominal: float) -> float:
+        if not self._jitter:
+            return self._offset
+        return self._offset + self._jitter * _fraction('{}@{!r}'.format(self._seed, nominal))
+
+    def _key(self) -> tuple:
+        return self._trigger, self._offset, self._jitter, self._seed
+
+
+def spread_schedule(trigger: Trigger, name: str, jitter: float = None, spread: bool = False) -> Trigger:
+    """
+    Spreads the fire times of jobs sharing a schedule, e.g. to avoid all of them connecting to an SFTP host
+    at the same instant.
+
+    Parameters
+    ----------
+    trigger : Trigger
+              the shared schedule
+    name : str
+           name of the job, it determines the offset and jitter of the job
+    jitter : float
+             maximum seconds a fire time is delayed at random, limited to the period of the trigger
+    spread : bool
+             if ``True`` fire times are delayed by an offset within the period (less jitter) derived
+             from a hash of the name, i.e. jobs are spread evenly across the period
+
+    Returns
+    --------
+    Trigger
+        a ``SpreadTrigger``, or the trigger itself if neither jitter nor spread apply
+
+    Raises
+    ------
+    ValueError
+        if jitter is negative
+
+    """
+    if _blank(jitter):
+        jitter = 0.0
+    if not isinstance(jitter, (int, float)) or jitter < 0:
+        raise ValueError(Sc.MSG_EX_ILLEGAL_JITTER.format(jitter))
+
+    window = trigger.period()
+    jitter = min(float(jitter), window)
+    offset = (window - jitter) * _fraction(name) if spread else 0.0
+    if not offset and not jitter:
+        return trigger
+    return SpreadTrigger(trigger, offset, jitter, name)
+
+
+def compile_schedule(every=None, time_unit: str = Sc.HOUR, at: str = None, cron: str = None) -> Trigger:
+    """
+    Compiles and validates a schedule into a trigger. Triggers are immutable, therefore equal schedules
+    share the same compiled trigger.
+
+    Parameters
+    ----------
+    every : int
+            number of time units between two fire times, default 1
+    time_unit : str
+                please see ``ScheduleConfig``
+    at : str
+         clock time (HH:MM or HH:MM:SS) for day and weekday units, default 00:00
+    cron : str
+           a cron expression, if provided every and at must be blank and time unit is ignored
+
+    Returns
+    --------
+    Trigger
+        a compiled trigger
+
+    Raises
+    ------
+    ValueError
+        if the combination of every, time unit and at is invalid
+
+    """
+    every = None if _blank(every) else every
+    at = None if _blank(at) else str(at).strip()
+    if not _blank(cron):
+        if every is not None or at is not None:
+            raise ValueError(Sc.MSG_EX_CRON_NOT_ALLOWED)
+        return _compile_cron(' '.join(str(cron).split()))
+    return _compile(every, str(time_unit).strip().lower(), at)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_cron(cron: str) -> Trigger:
+    from scheduling.CronTrigger import CronTrigger
+    return CronTrigger(cron)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(every, time_unit: str, at: str) -> Trigger:
+    if every is not None and at is not None:
+        raise ValueError(Sc.MSG_EX_INVALID_SCHEDULE_CONFIG)
+
+    count = _every(every)
+
+    if time_unit in _SINGULAR_UNITS and count != 1:
+        raise ValueError(Sc.MSG_EX_EVERY_NOT_ALLOWED.format(time_unit))
+
+    if time_unit in _INTERVAL_UNITS:
+        if at is not None:
+            raise ValueError(Sc.MSG_EX_AT_NOT_ALLOWED.format(time_unit))
+        return IntervalTrigger(count * _INTERVAL_UNITS[time_unit])
+
+    if time_unit in _DAY_UNITS:
+        return DailyTrigger(count, _clock_time(at))
+
+    if time_unit in _WEEKDAYS:
+        if count != 1:
+            raise ValueError(Sc.MSG_EX_EVERY_NOT_ALLOWED.format(time_unit))
+        return WeeklyTrigger(_WEEKDAYS[time_unit], _clock_time(at))
+
+    raise ValueError(Sc.MSG_EX_ILLEGAL_TIME_UNIT.format(time_unit))
+
+
+def _every(every) -> int:
+    if every is None:
+        return 1
+    try:
+        count = int(every)
+    except (TypeError, ValueError):
+        raise ValueError(Sc.MSG_EX_ILLEGAL_EVERY.format(every))
+    if count < 1 or count != float(every):
+        raise ValueError(Sc.MSG_EX_ILLEGAL_EVERY.format(every))
+    return count
+
+
+def _clock_time(at: str) -> datetime.time:
+    if at is None:
+        return datetime.time(0, 0)
+
+    parts = at.split(':')
+    try:
+        if len(parts) not in (2, 3) or not all(p.isdigit() for p in parts):
+            raise ValueError
+        return datetime.time(*map(int, parts))
+    except ValueError:
+        raise ValueError(Sc.MSG_EX_ILLEGAL_AT.format(at))
+
+
+def _fraction(text: str) -> float:
+    return zlib.crc32(text.encode('utf-8')) / 4294967296.0
+
+
+def _blank(value) -> bool:
+    return value is None or (isinstance(value, str) and len(value.strip()) == 0)
@@ -0,0 +1,97 @@
+"""
+A single thread which invokes callbacks once their timeouts elapse. It is used by ``Scheduler`` to time out
+job runs without starting a timer thread per run.
+
+"""
+
+import heapq
+import itertools
+import threading
+import time
+
+
+class Watchdog:
+
+    def __init__(self, name: str = 'Watchdog'):
+        """
+        Creates a watchdog, its thread is started when the first callback is watched.
+
+        Parameters
+        ----------
+        name : str
+               name of the watchdog thread
+
+        """
+        self._name = name
+        self._heap = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._stopped = False
+
+    def watch(self, seconds: float, callback) -> list:
+        """
+        Invokes the callback on the watchdog thread after the given seconds, unless cancelled.
+
+        Parameters
+        ----------
+        seconds : float
+                  timeout in seconds
+        callback : callable
+                   invoked without arguments
+
+        Returns
+        --------
+        list
+            a handle to cancel the callback
+
+        """
+        entry = [time.monotonic() + seconds, next(self._counter), callback]
+        with self._condition:
+            heapq.heappush(self._heap, entry)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+                self._thread.start()
+            elif self._heap[0] is entry:
+                self._condition.notify()
+        return entry
+
+    @staticmethod
+    def cancel(handle: list):
+        """
+        Cancels a watched callback, cancelling a callback which has been invoked has no effect.
+
+        Parameters
+        ----------
+        handle : list
+                 a handle returned by ``watch``
+
+        """
+        handle[2] = None
+
+    def stop(self):
+        """
+        Stops the watchdog thread, pending callbacks are not invoked.
+
+        """
+        with self._condition:
+            self._stopped = True
+            self._heap.clear()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._stopped and (not self._heap or self._heap[0][2] is None
+                                             or self._heap[0][0] > time.monotonic()):
+                    if self._heap and self._heap[0][2] is None:
+                        heapq.heappop(self._heap)
+                    elif self._heap:
+                        self._condition.wait(self._heap[0][0] - time.monotonic())
+                    else:
+                        self._condition.wait()
+                if self._stopped:
+                    return
+                callback = heapq.heappop(self._heap)[2]
+
+            callback()
@@ -0,0 +1,315 @@
+"""
+A bounded pool of worker threads used by ``Scheduler`` to execute jobs in parallel.
+
+The number of threads never exceeds ``max_workers`` and at most ``queue_depth`` firings wait for a free worker.
+When the queue is full, the ``overflow_policy`` decides what happens with a new firing.
+
++---------------+-------------------------------------------------------------------+
+|  Policy       |     Behaviour when the queue is full                              |
++===============+===================================================================+
+|  reject       |  the new firing is rejected and counted as rejected               |
++---------------+-------------------------------------------------------------------+
+|  queue        |  the caller waits until a queued firing is picked up by a worker  |
++---------------+-------------------------------------------------------------------+
+|  drop-oldest  |  the oldest queued firing of the lowest priority is cancelled to  |
+|               |  make room for the new                                            |
++---------------+-------------------------------------------------------------------+
+
+Queued firings are picked up by priority, a lower ``priority`` value first, so a burst of low priority
+firings does not delay a high priority one. Firings of the same priority are picked up by weighted fair
+queuing (self clocked), every ``flow`` (i.e. a job) gets a share of the workers proportional to its ``weight``,
+therefore a job firing often does not starve the others. Time spent waiting in the queue is measured per priority.
+
+A worker executing a hung firing can be abandoned, the firing fails with the given exception and
+a new worker takes its slot. The abandoned thread exits once the firing returns.
+
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+
+import utils.Constants as Sc
+
+
+class WorkerPool:
+
+    def __init__(self, max_workers: int = Sc.DEFAULT_MAX_WORKERS, queue_depth: int = Sc.DEFAULT_QUEUE_DEPTH,
+                 overflow_policy: str = Sc.DEFAULT_OVERFLOW_POLICY, name: str = 'Worker'):
+        """
+        Creates a pool without any thread. Threads are started on demand up to ``max_workers`` and reused.
+
+        Parameters
+        ----------
+        max_workers : int
+                      maximum number of threads executing jobs at the same time
+        queue_depth : int
+                      maximum number of firings waiting for a free worker
+        overflow_policy : str
+                          one of ``reject``, ``queue`` or ``drop-oldest``
+        name : str
+               prefix for worker thread names
+
+        Raises
+        ------
+        ValueError
+                if pool size or queue depth is less than 1 or the overflow policy is unknown
+
+        """
+        if overflow_policy not in Sc.OVERFLOW_POLICIES:
+            raise ValueError(Sc.MSG_EX_ILLEGAL_OVERFLOW_POLICY)
+
+        if max_workers < 1 or queue_depth < 1:
+            raise ValueError(Sc.MSG_EX_ILLEGAL_POOL_SIZE)
+
+        self._max_workers = max_workers
+        self._queue_depth = queue_depth
+        self._overflow_policy = overflow_policy
+        self._name = name
+        self._queue = []
+        self._sequence = itertools.count()
+        self._virtual_time = 0.0
+        self._finish_tags = {}
+        self._waits = {}
+        self._condition = threading.Condition()
+        self._workers = []
+        self._active = 0
+        self._completed = 0
+        self._rejected = 0
+        self._dropped = 0
+        self._abandoned = 0
+        self._running = {}
+        self._shutdown = False
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Submits a callable to be executed by a worker, with default priority and weight.
+
+        Parameters
+        ----------
+        fn : callable
+             a callable to be executed, i.e. ``goal`` of a job
+        args : tuple
+               positional arguments for the callable
+        kwargs : dict
+                 keyword arguments for the callable
+
+        Returns
+        --------
+        Future
+            a future holding the result, ``None`` if the firing has been rejected
+
+        Raises
+        ------
+        RuntimeError
+                if the pool has been shutdown
+
+        """
+        return self.enqueue(fn, args, kwargs)
+
+    def enqueue(self, fn, args: tuple = (), kwargs: dict = None, priority: int = Sc.DEFAULT_PRIORITY,
+                weight: float = Sc.DEFAULT_WEIGHT, flow=None, block: bool = True, on_start=None):
+        """
+        Submits a callable to be executed by a worker as per its priority and weight.
+
+        Parameters
+        ----------
+        fn : callable
+             a callable to be executed, i.e. ``goal`` of a job
+        args : tuple
+               positional arguments for the callable
+        kwargs : dict
+                 keyword arguments for the callable
+        priority : int
+                   priority class, ``0`` critical, ``1`` high, ``2`` normal or ``3`` low, a lower value is picked up
+                   first. Default 2 (normal)
+        weight : float
+                 relative share of workers of the flow among flows of the same priority. Default 1
+        flow : object
+               identifies the firings sharing a weight, e.g. a job name. Default ``None``, a shared flow
+        block : bool
+                if ``False`` the caller never waits, a firing is rejected when the queue is full even with
+                the ``queue`` policy, e.g. when it is submitted by a worker itself. Default ``True``
+        on_start : callable
+                   invoked with the future on the worker thread once a worker picked the firing up, before
+                   the callable, e.g. to start a timeout. Default ``None``
+
+        Returns
+        --------
+        Future
+            a future holding the result, ``None`` if the firing has been rejected
+
+        Raises
+        ------
+        RuntimeError
+                if the pool has been shutdown
+
+        """
+        future = Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError(Sc.MSG_EX_POOL_SHUTDOWN)
+
+            if len(self._queue) >= self._queue_depth:
+                if self._overflow_policy == Sc.POLICY_REJECT or \
+                        (self._overflow_policy == Sc.POLICY_QUEUE and not block):
+                    self._rejected += 1
+                    return None
+
+                if self._overflow_policy == Sc.POLICY_DROP_OLDEST:
+                    dropped = max(self._queue, key=lambda entry: (entry[0], -entry[2]))
+                    self._queue.remove(dropped)
+                    heapq.heapify(self._queue)
+                    dropped[3].cancel()
+                    self._dropped += 1
+                else:
+                    while len(self._queue) >= self._queue_depth and not self._shutdown:
+                        self._condition.wait()
+                    if self._shutdown:
+                        raise RuntimeError(Sc.MSG_EX_POOL_SHUTDOWN)
+
+            finish = max(self._virtual_time, self._finish_tags.get(flow, 0.0)) + 1.0 / weight
+            self._finish_tags[flow] = finish
+            heapq.heappush(self._queue, (priority, finish, next(self._sequence), future, fn, args,
+                                         kwargs or {}, time.monotonic(), on_start))
+            self._start_worker_if_required()
+            self._condition.notify_all()
+
+        return future
+
+    def stats(self) -> dict:
+        """
+        Retrieves current statistics of this pool.
+
+        Returns
+        --------
+        dict
+            ``workers`` started, ``active`` executing, ``queued`` waiting, ``completed``, ``rejected``,
+            ``dropped`` and ``abandoned`` firings, and queue ``wait`` by priority, i.e. number of firings
+            picked up along with mean and max seconds they waited
+
+        """
+        with self._condition:
+            return {'max_workers': self._max_workers,
+                    'queue_depth': self._queue_depth,
+                    'workers': len(self._workers),
+                    'active': self._active,
+                    'queued': len(self._queue),
+                    'completed': self._completed,
+                    'rejected': self._rejected,
+                    'dropped': self._dropped,
+                    'abandoned': self._abandoned,
+                    'wait': {priority: {'count': count, 'mean': total / count, 'max': longest}
+                             for priority, (count, total, longest) in sorted(self._waits.items())}}
+
+    def abandon(self, future: Future, exception: BaseException) -> bool:
+        """
+        Abandons the worker executing a firing, e.g. a hung job. The firing fails with the exception
+        and the worker slot is freed for another worker, the abandoned thread exits once the firing returns.
+
+        Parameters
+        ----------
+        future : Future
+                 a future returned by ``submit``
+        exception : BaseException
+                    the exception set on the future
+
+        Returns
+        --------
+        bool
+            ``True`` if abandoned, ``False`` if the firing is not executing (anymore)
+
+        """
+        with self._condition:
+            worker = self._running.pop(future, None)
+            if worker is None:
+                return False
+            self._workers.remove(worker)
+            self._active -= 1
+            self._abandoned += 1
+            self._start_worker_if_required()
+            self._condition.notify_all()
+
+        future.set_exception(exception)
+        return True
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False):
+        """
+        Stops accepting new firings. Workers exit once the queue is empty.
+
+        Parameters
+        ----------
+        wait : bool
+               if ``True`` blocks until all workers exit
+        cancel_pending : bool
+                         if ``True`` queued firings are cancelled instead of executed
+
+        """
+        with self._condition:
+            self._shutdown = True
+            if cancel_pending:
+                for entry in self._queue:
+                    entry[3].cancel()
+                self._queue.clear()
+            self._condition.notify_all()
+            workers = list(self._workers)
+
+        if wait:
+            for worker in workers:
+                if worker is not threading.current_thread():
+                    worker.join()
+
+    def _start_worker_if_required(self):
+        idle = len(self._workers) - self._active
+        if idle < len(self._queue) and len(self._workers) < self._max_workers:
+            worker = threading.Thread(target=self._work,
+                                      name='{}-{}'.format(self._name, len(self._workers) + 1),
+                                      daemon=True)
+            self._workers.append(worker)
+            worker.start()
+
+    def _work(self):
+        while True:
+            with self._condition:
+                while not self._queue and not self._shutdown:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                priority, finish, _, future, fn, args, kwargs, queued, on_start = heapq.heappop(self._queue)
+                self._virtual_time = finish
+                if not self._queue:
+                    self._finish_tags.clear()
+                self._record_wait(priority, time.monotonic() - queued)
+                self._active += 1
+                self._running[future] = threading.current_thread()
+                self._condition.notify_all()
+
+            result, error = None, None
+            if future.set_running_or_notify_cancel():
+                try:
+                    if on_start is not None:
+                        on_start(future)
+                    result = fn(*args, **kwargs)
+                except BaseException as e:
+                    error = e
+
+            with self._condition:
+                if self._running.pop(future, None) is None:
+                    return
+
+            if future.running():
+                if error is None:
+                    future.set_result(result)
+                else:
+                    future.set_exception(error)
+
+            with self._condition:
+                self._active -= 1
+                self._completed += 1
+                self._condition.notify_all()
+
+    def _record_wait(self, priority: int, seconds: float):
+        count, total, longest = self._waits.get(priority, (0, 0.0, 0.0))
+        self._waits[priority] = (count + 1, total + seconds, max(longest, seconds))
@@ -0,0 +1,84 @@
+from abc import ABCMeta, abstractmethod
+
+from scheduling.ScheduledJob import ScheduledJob
+
+
+class JobStore(metaclass=ABCMeta):
+    """
+    This class will be used to create a custom persistent store of scheduled jobs.
+    A store keeps job definitions, triggers, last and next run and the outcome of the last run,
+    therefore a scheduler rebuilds its jobs after a restart. Jobs are identified by their name.
+    A ``SQLiteJobStore`` has been created for a reference.
+
+    """
+
+    @abstractmethod
+    def add(self, scheduled: ScheduledJob):
+        """
+        Persists a newly scheduled job, replaces a job having the same name.
+
+        Parameters
+        ----------
+        scheduled : ScheduledJob
+                    a scheduled job having a picklable job instance
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def update(self, scheduled: ScheduledJob, outcome: str = None):
+        """
+        Checkpoints the run state of a job, i.e. last and next run. It is called on the dispatch path,
+        therefore it should not block on I/O.
+
+        Parameters
+        ----------
+        scheduled : ScheduledJob
+                    a scheduled job
+        outcome : str
+                  status of the last run, e.g. ``Complete`` or ``Failed``. ``None`` keeps the last outcome
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove(self, name: str):
+        """
+        Removes a job from the store.
+
+        Parameters
+        ----------
+        name : str
+               a job identifier
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def load(self) -> list:
+        """
+        Rebuilds all stored jobs.
+
+        Returns
+        --------
+        list
+            a list of ``ScheduledJob`` having their persisted next run as deadline, earliest first
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def flush(self):
+        """
+        Writes all pending changes to the store.
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self):
+        """
+        Flushes pending changes and releases the store. Changes after closing are ignored.
+
+        """
+        raise NotImplementedError
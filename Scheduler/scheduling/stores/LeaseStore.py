@@ -0,0 +1,98 @@
+from abc import ABCMeta, abstractmethod
+
+
+class Lease:
+    """
+    A granted lease of a job for one fire time. The fencing ``token`` increases with every lease granted
+    for the same job, therefore a resource receiving the token from a job can reject writes from
+    an older lease holder, e.g. a stalled instance whose lease has expired meanwhile.
+
+    """
+
+    __slots__ = ('key', 'owner', 'token', 'fire_time', 'expires')
+
+    def __init__(self, key: str, owner: str, token: int, fire_time: float, expires: float):
+        self.key = key
+        self.owner = owner
+        self.token = token
+        self.fire_time = fire_time
+        self.expires = expires
+
+    def __repr__(self):
+        return 'Lease(key={}, owner={}, token={}, fire_time={}, expires={})' \
+            .format(self.key, self.owner, self.token, self.fire_time, self.expires)
+
+
+class LeaseStore(metaclass=ABCMeta):
+    """
+    This class will be used to create a custom lease store shared by scheduler instances,
+    e.g. on a database or a distributed lock service. An instance runs a job only while it holds its lease,
+    therefore a job runs at most once per fire time across all instances sharing the store.
+    A ``SQLiteLeaseStore`` has been created for a reference, usable by scheduler processes on one host.
+
+    A lease of a job must be granted only if
+
+    * the job has never been leased, or
+    * the fire time is at or after the next fire time of the last granted lease, and
+    * the last granted lease has been released or has expired
+
+    """
+
+    @abstractmethod
+    def acquire(self, key: str, owner: str, fire_time: float, next_fire_time: float, ttl: float):
+        """
+        Acquires the lease of a job for a fire time.
+
+        Parameters
+        ----------
+        key : str
+              a job identifier shared by all instances
+        owner : str
+                a unique identifier of the requesting scheduler instance
+        fire_time : float
+                    fire time to be run, seconds since epoch
+        next_fire_time : float
+                         the following fire time of the job, a lease for an earlier fire time is refused afterwards
+        ttl : float
+              seconds until the lease expires, if not released
+
+        Returns
+        --------
+        Lease
+            the granted lease, ``None`` if refused
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def renew(self, lease: Lease, ttl: float) -> bool:
+        """
+        Extends the expiry of a held lease, e.g. by a long running job.
+
+        Parameters
+        ----------
+        lease : Lease
+                a granted lease
+        ttl : float
+              seconds from now until the lease expires
+
+        Returns
+        --------
+        bool
+            ``True`` if renewed, ``False`` if the lease is no longer held by its owner
+
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def release(self, lease: Lease):
+        """
+        Releases a held lease once the job completed. Releasing a lease which is no longer held has no effect.
+
+        Parameters
+        ----------
+        lease : Lease
+                a granted lease
+
+        """
+        raise NotImplementedError
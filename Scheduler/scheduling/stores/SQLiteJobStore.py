@@ -0,0 +1,213 @@
+"""
+A job store backed by a local SQLite database.
+
+The database runs in WAL mode, so reads do not block the writer and a crash never leaves a partially
+written checkpoint. Checkpoints are not written on the dispatch path, they are collected in memory,
+collapsed per job (only the latest state of a job is written) and written in one transaction
+by a background thread, once ``batch_size`` jobs changed or ``linger`` seconds elapsed.
+Jobs are indexed by next run, therefore a scheduler rebuilds its heap with one indexed query.
+
+Example
+--------
+1.  store = SQLiteJobStore('/var/lib/scheduler/jobs.db')
+    sche = Scheduler(job_store=store)
+
+"""
+
+import json
+import pickle
+import sqlite3
+import threading
+import time
+
+import utils.Constants as Sc
+from scheduling.ScheduledJob import ScheduledJob
+from scheduling.stores.JobStore import JobStore
+from auditlogging.Auditor import audit_params
+
+_SCHEMA = ('CREATE TABLE IF NOT EXISTS jobs ('
+           'name TEXT PRIMARY KEY, job BLOB NOT NULL, trigger BLOB NOT NULL, options TEXT NOT NULL, '
+           'next_run REAL, last_run REAL, outcome TEXT, updated REAL NOT NULL)',
+           'CREATE INDEX IF NOT EXISTS jobs_next_run ON jobs (next_run)')
+
+_PUT = 'INSERT OR REPLACE INTO jobs (name, job, trigger, options, next_run, last_run, outcome, updated) ' \
+       'VALUES (?, ?, ?, ?, ?, ?, ?, ?)'
+_STATE = 'UPDATE jobs SET next_run = ?, last_run = ?, outcome = COALESCE(?, outcome), updated = ? WHERE name = ?'
+_DELETE = 'DELETE FROM jobs WHERE name = ?'
+_LOAD = 'SELECT name, job, trigger, options, next_run, last_run FROM jobs ORDER BY next_run'
+
+_OP_PUT = 'put'
+_OP_STATE = 'state'
+_OP_DELETE = 'delete'
+
+
+class SQLiteJobStore(JobStore):
+    """
+    Persists scheduled jobs in a SQLite database, please see module documentation.
+
+    """
+
+    def __init__(self, path: str, batch_size: int = Sc.DEFAULT_STORE_BATCH_SIZE,
+                 linger: float = Sc.DEFAULT_STORE_LINGER):
+        """
+        Opens or creates the database and starts the writer thread.
+
+        Parameters
+        ----------
+        path : str
+               database file path
+        batch_size : int
+                     number of changed jobs written at once. Default 100
+        linger : float
+                 maximum seconds a change waits to be batched with others. Default 1 second
+
+        """
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        for statement in _SCHEMA:
+            self._connection.execute(statement)
+
+        self._batch_size = batch_size
+        self._linger = linger
+        self._pending = {}
+        self._condition = threading.Condition()
+        self._db_lock = threading.Lock()
+        self._closed = False
+        self._writer = threading.Thread(target=self._run, name='SQLiteJobStore-writer', daemon=True)
+        self._writer.start()
+
+    def add(self, scheduled: ScheduledJob):
+        options = {'execution': scheduled.execution,
+                   'max_instances': scheduled.max_instances,
+                   'overlap_policy': scheduled.overlap_policy,
+                   'misfire_grace_time': scheduled.misfire_grace_time,
+                   'catch_up': scheduled.catch_up,
+                   'timeout': scheduled.timeout,
+                   'priority': scheduled.priority,
+                   'weight': scheduled.weight}
+        row = [scheduled.name, pickle.dumps(scheduled.job), pickle.dumps(scheduled.trigger), json.dumps(options),
+               _real(scheduled.deadline), scheduled.last_run, None, time.time()]
+        self._enqueue(scheduled.name, _OP_PUT, row)
+
+    def update(self, scheduled: ScheduledJob, outcome: str = None):
+        self._enqueue(scheduled.name, _OP_STATE,
+                      [_real(scheduled.deadline), scheduled.last_run, outcome, time.time()])
+
+    def remove(self, name: str):
+        self._enqueue(name, _OP_DELETE, None)
+
+    def load(self) -> list:
+        self.flush()
+        with self._db_lock:
+            rows = self._connection.execute(_LOAD).fetchall()
+
+        jobs = []
+        for name, job, trigger, options, next_run, last_run in rows:
+            options = json.loads(options)
+            trigger = pickle.loads(trigger)
+            deadline = next_run if next_run is not None else float('inf')
+            scheduled = ScheduledJob(pickle.loads(job), trigger, options['execution'], deadline,
+                                     options['max_instances'], options['overlap_policy'],
+                                     options['misfire_grace_time'], options['catch_up'],
+                                     timeout=options.get('timeout'),
+                                     priority=options.get('priority', Sc.DEFAULT_PRIORITY),
+                                     weight=options.get('weight', Sc.DEFAULT_WEIGHT))
+            scheduled.last_run = last_run
+            jobs.append(scheduled)
+        return jobs
+
+    def flush(self):
+        self._write_pending()
+
+    def close(self):
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._writer.join()
+        with self._db_lock:
+            self._connection.close()
+
+    def _enqueue(self, name: str, op: str, values):
+        """
+        Collects a change, a later change of the same job replaces or updates an earlier one.
+
+        """
+        with self._condition:
+            if self._closed:
+                return
+
+            current = self._pending.get(name)
+            if op == _OP_STATE and current is not None:
+                if current[0] == _OP_DELETE:
+                    return
+                if current[0] == _OP_PUT:
+                    next_run, last_run, outcome, updated = values
+                    row = current[1]
+                    row[4], row[5], row[7] = next_run, last_run, updated
+                    if outcome is not None:
+                        row[6] = outcome
+                    return
+                if values[2] is None:
+                    values[2] = current[1][2]
+
+            first = not self._pending
+            self._pending[name] = (op, values)
+            if first or len(self._pending) >= self._batch_size:
+                self._condition.notify_all()
+
+    def _run(self):
+        """
+        Writer thread, writes pending changes once the batch is full, it lingered long enough or the store closes.
+
+        """
+        while True:
+            with self._condition:
+                if not self._pending and not self._closed:
+                    self._condition.wait()
+                if self._pending and len(self._pending) < self._batch_size and not self._closed:
+                    self._condition.wait(self._linger)
+                closed = self._closed
+
+            try:
+                self._write_pending()
+            except sqlite3.Error as e:
+                audit_params(Sc.OPERATION_CHECKPOINT, Sc.STATUS_FAILED, 'Job store write failed: ' + repr(e))
+            if closed:
+                return
+
+    def _write_pending(self):
+        with self._db_lock:
+            with self._condition:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return
+
+            puts, states, deletes = [], [], []
+            for name, (op, values) in batch.items():
+                if op == _OP_PUT:
+                    puts.append(values)
+                elif op == _OP_STATE:
+                    states.append(values + [name])
+                else:
+                    deletes.append((name,))
+
+            self._connection.execute('BEGIN')
+            try:
+                self._connection.executemany(_DELETE, deletes)
+                self._connection.executemany(_PUT, puts)
+                self._connection.executemany(_STATE, states)
+                self._connection.execute('COMMIT')
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+
+
+def _real(deadline: float):
+    """
+    SQLite stores infinity as a real number, a job which never fires again is stored without next run instead.
+
+    """
+    return None if deadline == float('inf') else deadline
@@ -0,0 +1,100 @@
+"""
+A lease store backed by a local SQLite database, shared by scheduler processes on one host.
+
+Every job has one row holding its last granted lease. A lease is acquired in an immediate transaction,
+therefore concurrent instances are serialised by the database lock and exactly one of them is granted
+the lease of a fire time.
+
+Example
+--------
+1.  sche = Scheduler(lease_store=SQLiteLeaseStore('/var/lib/scheduler/leases.db'))
+
+"""
+
+import sqlite3
+import threading
+import time
+
+from scheduling.stores.LeaseStore import Lease, LeaseStore
+
+_SCHEMA = 'CREATE TABLE IF NOT EXISTS leases (' \
+          'key TEXT PRIMARY KEY, owner TEXT NOT NULL, token INTEGER NOT NULL, fire_time REAL NOT NULL, ' \
+          'next_fire_time REAL, expires REAL NOT NULL, released INTEGER NOT NULL)'
+
+_SELECT = 'SELECT token, next_fire_time, expires, released FROM leases WHERE key = ?'
+_GRANT = 'INSERT OR REPLACE INTO leases (key, owner, token, fire_time, next_fire_time, expires, released) ' \
+         'VALUES (?, ?, ?, ?, ?, ?, 0)'
+_RENEW = 'UPDATE leases SET expires = ? WHERE key = ? AND owner = ? AND token = ? AND released = 0'
+_RELEASE = 'UPDATE leases SET released = 1 WHERE key = ? AND owner = ? AND token = ?'
+
+# fire times computed by different instances may differ by floating point rounding
+_TOLERANCE = 0.001
+
+
+class SQLiteLeaseStore(LeaseStore):
+    """
+    Grants job leases from a SQLite database, please see module documentation.
+
+    """
+
+    def __init__(self, path: str, timeout: float = 5.0):
+        """
+        Opens or creates the database.
+
+        Parameters
+        ----------
+        path : str
+               database file path, the same path for all scheduler processes
+        timeout : float
+                  seconds to wait for the database lock held by another instance. Default 5 seconds
+
+        """
+        self._connection = sqlite3.connect(path, timeout=timeout, check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, owner: str, fire_time: float, next_fire_time: float, ttl: float):
+        now = time.time()
+        with self._lock:
+            self._connection.execute('BEGIN IMMEDIATE')
+            try:
+                row = self._connection.execute(_SELECT, (key,)).fetchone()
+                if row is not None:
+                    token, last_next_fire_time, expires, released = row
+                    if last_next_fire_time is None or fire_time + _TOLERANCE < last_next_fire_time \
+                            or (not released and expires > now):
+                        self._connection.execute('ROLLBACK')
+                        return None
+                else:
+                    token = 0
+
+                lease = Lease(key, owner, token + 1, fire_time, now + ttl)
+                self._connection.execute(_GRANT, (key, owner, lease.token, fire_time,
+                                                  None if next_fire_time == float('inf') else next_fire_time,
+                                                  lease.expires))
+                self._connection.execute('COMMIT')
+                return lease
+            except Exception:
+                self._connection.execute('ROLLBACK')
+                raise
+
+    def renew(self, lease: Lease, ttl: float) -> bool:
+        expires = time.time() + ttl
+        with self._lock:
+            renewed = self._connection.execute(_RENEW, (expires, lease.key, lease.owner, lease.token)).rowcount == 1
+        if renewed:
+            lease.expires = expires
+        return renewed
+
+    def release(self, lease: Lease):
+        with self._lock:
+            self._connection.execute(_RELEASE, (lease.key, lease.owner, lease.token))
+
+    def close(self):
+        """
+        Closes the database connection.
+
+        """
+        with self._lock:
+            self._connection.close()
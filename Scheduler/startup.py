@@ -27,8 +27,8 @@ from jobs.TestJob import TestJob
 #     _test_cases(scheduler)
 #     # _job = LoadOrdersJob()
 #     # scheduler.schedule_job(job=_job, pulse_seconds=30, run_continuous=True)
-#     # step 4 - start scheduler
-#     scheduler.start()
+#     # step 4 - start scheduler, serving metrics to Prometheus if a port is configured
+#     scheduler.start(metrics_port=ConfigLoader.snapshot().metrics_port)
 # else:
 #     print(Sc.ERR_MSG_STARTUP)
 #
@@ -0,0 +1,61 @@
+import threading
+import unittest
+
+import utils.Constants as Sc
+from jobs.Job import Job
+from scheduling.ScheduleConfig import ScheduleConfig
+from scheduling.Scheduler import Scheduler
+
+
+class _BlockingJob(Job):
+
+    def __init__(self, name: str, release: threading.Event, done: threading.Event):
+        self._name = name
+        self._release = release
+        self._done = done
+        self.runs = 0
+
+    def name(self):
+        return self._name
+
+    def goal(self):
+        self.runs += 1
+        self._release.wait(5)
+        self._done.set()
+
+
+class CoalesceTest(unittest.TestCase):
+
+    def test_coalesced_run_does_not_block_a_full_queue(self):
+        """
+        A coalesced run is submitted by the worker completing the previous run, with a single worker and
+        a full queue it must be skipped instead of waiting for room the worker itself should make.
+
+        """
+        scheduler = Scheduler(max_workers=1, queue_depth=1, overflow_policy=Sc.POLICY_QUEUE)
+        release, a_done, b_done = threading.Event(), threading.Event(), threading.Event()
+        a = _BlockingJob('coalesced', release, a_done)
+        b = _BlockingJob('queued', release, b_done)
+        schedule = ScheduleConfig(every=1, time_unit=Sc.HOUR)
+        scheduler.schedule_job(a, schedule_config=schedule, execution=Sc.EXECUTION_THREAD,
+                               max_instances=1, overlap_policy=Sc.OVERLAP_COALESCE)
+        scheduler.schedule_job(b, schedule_config=schedule, execution=Sc.EXECUTION_THREAD)
+        jobs = {scheduled.name: scheduled for scheduled in scheduler._dispatcher.jobs()}
+        try:
+            scheduler._fire(jobs['coalesced'])
+            scheduler._fire(jobs['coalesced'])
+            scheduler._fire(jobs['queued'])
+            self.assertTrue(jobs['coalesced'].pending)
+
+            release.set()
+            self.assertTrue(b_done.wait(5), 'the queued job never ran, the worker is blocked')
+            self.assertEqual(1, a.runs)
+            # the coalesced firing and the rerun skipped for the full queue
+            self.assertEqual(2, scheduler.metrics()['coalesced']['outcomes'].get(Sc.STATUS_SKIPPED))
+            self.assertEqual(1, scheduler.pool_stats()['rejected'])
+        finally:
+            scheduler.shutdown(force=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
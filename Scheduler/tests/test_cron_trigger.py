@@ -0,0 +1,75 @@
+import datetime
+import unittest
+
+from scheduling.CronTrigger import CronTrigger
+
+
+def _next(expression: str, after: datetime.datetime) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(CronTrigger(expression).next_fire(after.timestamp()))
+
+
+class CronTriggerTest(unittest.TestCase):
+
+    def assertFires(self, expression: str, after: tuple, *expected: tuple):
+        """
+        Asserts the fire times following ``after``, one after the other.
+
+        """
+        moment = datetime.datetime(*after)
+        for fire_time in expected:
+            moment = _next(expression, moment)
+            self.assertEqual(datetime.datetime(*fire_time), moment, expression)
+
+    def test_last_day_of_month(self):
+        self.assertFires('0 18 L * *', (2024, 1, 31, 18, 0),
+                         (2024, 2, 29, 18, 0), (2024, 3, 31, 18, 0), (2024, 4, 30, 18, 0))
+        self.assertFires('0 18 L * *', (2023, 2, 1), (2023, 2, 28, 18, 0))
+
+    def test_last_business_day_of_month(self):
+        # 2024-03-31 and 2024-06-30 are Sundays, 2024-08-31 is a Saturday
+        self.assertFires('0 18 LW * *', (2024, 3, 1),
+                         (2024, 3, 29, 18, 0), (2024, 4, 30, 18, 0), (2024, 5, 31, 18, 0), (2024, 6, 28, 18, 0))
+        self.assertFires('0 18 LW * *', (2024, 8, 1), (2024, 8, 30, 18, 0))
+
+    def test_day_of_month_or_day_of_week(self):
+        # 2024-09-13 is a Friday, both fields match
+        self.assertFires('0 0 13 * FRI', (2024, 9, 1),
+                         (2024, 9, 6), (2024, 9, 13), (2024, 9, 20), (2024, 9, 27), (2024, 10, 4), (2024, 10, 11),
+                         (2024, 10, 13))
+
+    def test_unrestricted_day_field_does_not_widen(self):
+        self.assertFires('0 0 ? * MON', (2024, 9, 1), (2024, 9, 2), (2024, 9, 9))
+        self.assertFires('0 0 13 * *', (2024, 9, 1), (2024, 9, 13), (2024, 10, 13))
+
+    def test_ranges_and_steps(self):
+        self.assertFires('*/15 8-17 * * MON-FRI', (2024, 9, 6, 17, 50),
+                         (2024, 9, 9, 8, 0), (2024, 9, 9, 8, 15), (2024, 9, 9, 8, 30))
+        self.assertFires('5-20/5 * * * *', (2024, 9, 9, 10, 20), (2024, 9, 9, 11, 5), (2024, 9, 9, 11, 10))
+        self.assertFires('30 6 1,15 JAN,JUL *', (2024, 1, 15, 6, 30), (2024, 7, 1, 6, 30), (2024, 7, 15, 6, 30),
+                         (2025, 1, 1, 6, 30))
+
+    def test_sunday_is_zero_or_seven(self):
+        self.assertEqual(_next('0 0 * * 0', datetime.datetime(2024, 9, 3)),
+                         _next('0 0 * * 7', datetime.datetime(2024, 9, 3)))
+        self.assertFires('0 0 * * SAT-7', (2024, 9, 3), (2024, 9, 7), (2024, 9, 8), (2024, 9, 14))
+
+    def test_skips_short_months_and_years(self):
+        self.assertFires('0 0 31 * *', (2024, 4, 1), (2024, 5, 31), (2024, 7, 31))
+        self.assertFires('0 0 29 2 *', (2025, 1, 1), (2028, 2, 29))
+
+    def test_macros(self):
+        for macro, expression in (('@monthly', '0 0 1 * *'), ('@weekly', '0 0 * * 0'), ('@hourly', '0 * * * *'),
+                                  ('@yearly', '0 0 1 1 *'), ('@daily', '0 0 * * *')):
+            after = datetime.datetime(2024, 9, 3, 10, 30)
+            self.assertEqual(_next(expression, after), _next(macro, after), macro)
+
+    def test_invalid_expressions(self):
+        for expression in ('', '* * * *', '* * * * * *', '60 * * * *', '* 24 * * *', '* * 0 * *', '* * 32 * *',
+                           '* * * 13 *', '* * * * 8', '*/0 * * * *', '5-1 * * * *', 'a * * * *', '* * * FOO *',
+                           '1,,2 * * * *', '@reboot', '0 0 30 2 *'):
+            with self.assertRaises(ValueError, msg=expression):
+                CronTrigger(expression)
+
+
+if __name__ == '__main__':
+    unittest.main()
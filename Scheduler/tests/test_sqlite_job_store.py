@@ -0,0 +1,103 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+import utils.Constants as Sc
+from jobs.Job import Job
+from scheduling.CronTrigger import CronTrigger
+from scheduling.ScheduleConfig import ScheduleConfig
+from scheduling.ScheduledJob import ScheduledJob
+from scheduling.Scheduler import Scheduler
+from scheduling.stores.SQLiteJobStore import SQLiteJobStore
+
+
+class _NamedJob(Job):
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def name(self):
+        return self._name
+
+    def goal(self):
+        pass
+
+
+class SQLiteJobStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'jobs.db')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _scheduled(self, name: str, deadline: float, **options) -> ScheduledJob:
+        return ScheduledJob(_NamedJob(name), CronTrigger('0 * * * *'), Sc.EXECUTION_THREAD, deadline, **options)
+
+    def _reopen(self, store: SQLiteJobStore) -> dict:
+        store.close()
+        store = SQLiteJobStore(self.path)
+        try:
+            return {scheduled.name: scheduled for scheduled in store.load()}
+        finally:
+            store.close()
+
+    def test_restore_after_restart(self):
+        store = SQLiteJobStore(self.path, linger=60)
+        scheduled = self._scheduled('hourly', 1000.0, max_instances=2, overlap_policy=Sc.OVERLAP_COALESCE,
+                                    timeout=30.0, priority=Sc.PRIORITY_HIGH, weight=2.0)
+        store.add(scheduled)
+        scheduled.deadline, scheduled.last_run = 4600.0, 1000.0
+        store.update(scheduled, Sc.STATUS_COMPLETE)
+
+        restored = self._reopen(store)['hourly']
+        self.assertEqual((4600.0, 1000.0), (restored.deadline, restored.last_run))
+        self.assertEqual(CronTrigger('0 * * * *'), restored.trigger)
+        self.assertEqual('hourly', restored.job.name())
+        self.assertEqual((Sc.EXECUTION_THREAD, 2, Sc.OVERLAP_COALESCE, 30.0, Sc.PRIORITY_HIGH, 2.0),
+                         (restored.execution, restored.max_instances, restored.overlap_policy, restored.timeout,
+                          restored.priority, restored.weight))
+
+    def test_never_firing_job_is_stored_without_next_run(self):
+        store = SQLiteJobStore(self.path)
+        store.add(self._scheduled('done', float('inf')))
+        store.flush()
+
+        with sqlite3.connect(self.path) as connection:
+            self.assertEqual([(None,)], connection.execute('SELECT next_run FROM jobs').fetchall())
+        self.assertEqual(float('inf'), self._reopen(store)['done'].deadline)
+
+    def test_removed_job_is_not_restored(self):
+        store = SQLiteJobStore(self.path)
+        kept, removed = self._scheduled('kept', 10.0), self._scheduled('removed', 20.0)
+        store.add(kept)
+        store.add(removed)
+        store.flush()
+        store.remove('removed')
+        store.update(removed)
+
+        self.assertEqual(['kept'], list(self._reopen(store)))
+
+    def test_scheduler_continues_from_stored_state(self):
+        schedule = ScheduleConfig(every=1, time_unit=Sc.HOUR)
+        scheduler = Scheduler(job_store=SQLiteJobStore(self.path))
+        scheduler.schedule_job(_NamedJob('hourly'), schedule_config=schedule)
+        scheduled = scheduler._dispatcher.jobs()[0]
+        deadline, last_run = scheduled.deadline, scheduled.deadline - 3600
+        scheduled.last_run = last_run
+        scheduler._checkpoint(scheduled, Sc.STATUS_COMPLETE)
+        scheduler.shutdown()
+
+        scheduler = Scheduler(job_store=SQLiteJobStore(self.path))
+        try:
+            scheduler.schedule_job(_NamedJob('hourly'), schedule_config=schedule)
+            restored = scheduler._dispatcher.jobs()[0]
+            self.assertEqual((deadline, last_run), (restored.deadline, restored.last_run))
+        finally:
+            scheduler.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import os
+import tempfile
+import time
+import unittest
+
+from scheduling.stores.SQLiteLeaseStore import SQLiteLeaseStore
+
+
+class SQLiteLeaseStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        path = os.path.join(self.directory.name, 'leases.db')
+        # two instances sharing the database, as two scheduler processes do
+        self.first, self.second = SQLiteLeaseStore(path), SQLiteLeaseStore(path)
+
+    def tearDown(self):
+        self.first.close()
+        self.second.close()
+        self.directory.cleanup()
+
+    def test_one_holder_per_fire_time(self):
+        lease = self.first.acquire('job', 'a', 100.0, 160.0, 60)
+        self.assertEqual(('job', 'a', 1, 100.0), (lease.key, lease.owner, lease.token, lease.fire_time))
+        self.assertIsNone(self.second.acquire('job', 'b', 100.0, 160.0, 60))
+        self.assertIsNone(self.second.acquire('job', 'b', 160.0, 220.0, 60), 'the lease is still held')
+
+        self.first.release(lease)
+        self.assertIsNone(self.second.acquire('job', 'b', 100.0, 160.0, 60), 'the fire time has been run')
+        following = self.second.acquire('job', 'b', 160.0, 220.0, 60)
+        self.assertEqual(('b', 2), (following.owner, following.token))
+
+    def test_stale_fire_time_is_refused(self):
+        self.first.release(self.first.acquire('job', 'a', 160.0, 220.0, 60))
+        self.assertIsNone(self.second.acquire('job', 'b', 100.0, 160.0, 60))
+        self.assertIsNotNone(self.second.acquire('job', 'b', 220.0 + 0.0005, 280.0, 60), 'within rounding tolerance')
+
+    def test_expired_lease_is_taken_over_and_fenced(self):
+        stalled = self.first.acquire('job', 'a', 100.0, 160.0, 0.05)
+        time.sleep(0.1)
+        lease = self.second.acquire('job', 'b', 160.0, 220.0, 60)
+        self.assertEqual(2, lease.token)
+
+        self.assertFalse(self.first.renew(stalled, 60))
+        self.first.release(stalled)
+        self.assertIsNone(self.first.acquire('job', 'a', 220.0, 280.0, 60), 'a stale release has no effect')
+        self.assertTrue(self.second.renew(lease, 60))
+
+    def test_last_fire_time_is_never_leased_again(self):
+        self.first.release(self.first.acquire('once', 'a', 100.0, float('inf'), 60))
+        self.assertIsNone(self.second.acquire('once', 'b', 200.0, float('inf'), 60))
+
+    def test_jobs_are_leased_independently(self):
+        self.assertIsNotNone(self.first.acquire('one', 'a', 100.0, 160.0, 60))
+        self.assertIsNotNone(self.second.acquire('other', 'b', 100.0, 160.0, 60))
+
+
+if __name__ == '__main__':
+    unittest.main()
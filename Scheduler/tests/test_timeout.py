@@ -0,0 +1,74 @@
+import threading
+import time
+import unittest
+
+import utils.Constants as Sc
+from jobs.Job import Job
+from scheduling.ScheduleConfig import ScheduleConfig
+from scheduling.Scheduler import Scheduler
+
+
+class _SleepingJob(Job):
+
+    def __init__(self, name: str, seconds: float):
+        self._name = name
+        self._seconds = seconds
+        self.cancelled_at_start = None
+        self.done = threading.Event()
+
+    def name(self):
+        return self._name
+
+    def goal(self, cancel_token=None):
+        self.cancelled_at_start = cancel_token.is_cancelled()
+        cancel_token.wait(self._seconds)
+        self.done.set()
+
+
+class TimeoutTest(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = Scheduler(max_workers=1)
+        self.schedule = ScheduleConfig(every=1, time_unit=Sc.HOUR)
+
+    def tearDown(self):
+        self.scheduler.shutdown(force=True)
+
+    def _fire(self, *jobs, timeouts=()):
+        for job, timeout in zip(jobs, timeouts):
+            self.scheduler.schedule_job(job, schedule_config=self.schedule, execution=Sc.EXECUTION_THREAD,
+                                        timeout=timeout)
+        scheduled = {entry.name: entry for entry in self.scheduler._dispatcher.jobs()}
+        for job in jobs:
+            self.scheduler._fire(scheduled[job.name()])
+
+    def _outcomes(self, job: Job) -> dict:
+        return self.scheduler.metrics()[job.name()]['outcomes']
+
+    def test_time_waiting_in_the_queue_does_not_count(self):
+        """
+        With a single worker busy for longer than the timeout of a queued run, the queued run must start with
+        an uncancelled token and complete, its timeout starts once the worker picked it up.
+
+        """
+        busy = _SleepingJob('busy', 0.6)
+        queued = _SleepingJob('queued', 0.05)
+        self._fire(busy, queued, timeouts=(5, 0.3))
+
+        self.assertTrue(queued.done.wait(5), 'the queued job never ran')
+        self.assertFalse(queued.cancelled_at_start)
+        time.sleep(0.1)
+        self.assertEqual({Sc.STATUS_COMPLETE: 1}, self._outcomes(queued))
+
+    def test_run_exceeding_its_timeout_times_out(self):
+        hung = _SleepingJob('hung', 5)
+        self._fire(hung, timeouts=(0.2,))
+
+        self.assertTrue(hung.done.wait(2), 'the token of the run has not been cancelled')
+        self.assertFalse(hung.cancelled_at_start)
+        time.sleep(0.1)
+        self.assertEqual({Sc.STATUS_TIMED_OUT: 1}, self._outcomes(hung))
+
+
+if __name__ == '__main__':
+    unittest.main()
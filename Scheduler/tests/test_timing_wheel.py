@@ -0,0 +1,164 @@
+import heapq
+import itertools
+import random
+import unittest
+
+from scheduling.TimingWheel import TimingWheel
+
+_START = 1000000.0
+# ticks covered by the six levels of the wheel, deadlines further away are kept aside
+_RANGE = 64 ** 6
+
+
+class _Entry:
+
+    __slots__ = ('name', 'deadline', 'priority', 'cancelled')
+
+    def __init__(self, name: int, deadline: float, priority: int):
+        self.name = name
+        self.deadline = deadline
+        self.priority = priority
+        self.cancelled = False
+
+    def __repr__(self):
+        return '_Entry({}, {}, {})'.format(self.name, self.deadline, self.priority)
+
+
+class _Heap:
+    """
+    The reference index, a heap of deadlines and priorities as used by the dispatcher by default.
+
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._counter = itertools.count()
+
+    def push(self, entry: _Entry):
+        heapq.heappush(self._heap, (entry.deadline, entry.priority, next(self._counter), entry))
+
+    def peek(self):
+        return self._heap[0][3] if self._heap else None
+
+    def pop(self):
+        return heapq.heappop(self._heap)[3]
+
+    def discard_all(self, entries: list):
+        self._heap = [item for item in self._heap if item[3] not in entries]
+        heapq.heapify(self._heap)
+
+
+class TimingWheelTest(unittest.TestCase):
+
+    def setUp(self):
+        self.random = random.Random(7)
+        self.names = itertools.count()
+        self.wheel = TimingWheel(resolution=1.0, now=_START)
+        self.heap = _Heap()
+
+    def _push(self, deadline: float, priority: int = None) -> _Entry:
+        entry = _Entry(next(self.names), deadline, self.random.randint(0, 3) if priority is None else priority)
+        self.wheel.push(entry)
+        self.heap.push(entry)
+        return entry
+
+    def _push_random(self, now: float, count: int):
+        """
+        Pushes deadlines spread over all levels, beyond the top level (kept aside) and never firing.
+
+        """
+        for _ in range(count):
+            level = self.random.randint(0, 7)
+            if level == 7:
+                self._push(float('inf'))
+            else:
+                self._push(now + self.random.uniform(0, 64 ** level * 1.5))
+        self._push(now + _RANGE * 1.2)
+        self._push(now + _RANGE * 2.5)
+        self._push(now + _RANGE * 2.5, priority=0)
+
+    def _run_until(self, now: float) -> list:
+        """
+        Removes all jobs due at the given time from both indices as the dispatcher does, comparing them one by one.
+
+        """
+        fired = []
+        while True:
+            expected, actual = self.heap.peek(), self.wheel.peek(now)
+            if expected is not None and expected.deadline == float('inf'):
+                # jobs never firing are not ordered
+                self.assertEqual(expected.deadline, actual.deadline)
+                return fired
+            self.assertIs(expected, actual, 'at {}'.format(now))
+            if actual is None or actual.deadline > now:
+                return fired
+            self.heap.pop()
+            self.wheel.remove(actual)
+            fired.append(actual)
+
+    def _run_all(self, now: float, limit: float = float('inf')) -> float:
+        """
+        Jumps from deadline to deadline, and just before some of them, until the limit or only jobs never firing
+        are left.
+
+        """
+        while True:
+            head = self.heap.peek()
+            if head is None or head.deadline > limit or head.deadline == float('inf'):
+                return now
+            deadline = head.deadline
+            between = now + self.random.uniform(0, deadline - now)
+            if now < between < deadline and self.random.random() < 0.3:
+                self.assertFalse(self._run_until(between))
+            now = max(now, deadline)
+            self.assertTrue(self._run_until(now))
+
+    def test_same_order_as_a_heap(self):
+        self._push_random(_START, 3000)
+        now = self._run_all(_START, limit=_START + _RANGE * 1.1)
+
+        # once the top level wrapped around, jobs kept aside are ordered among jobs pushed meanwhile
+        self._push_random(now, 3000)
+        now = self._run_all(now)
+
+        # jobs kept aside beyond the top level fired, only jobs never firing are left
+        self.assertGreaterEqual(now, _START + _RANGE * 2.5)
+        self.assertEqual(float('inf'), self.wheel.peek(now).deadline)
+        self.wheel.discard_all(self.wheel.entries())
+        self.assertIsNone(self.wheel.peek(now))
+
+    def test_same_order_after_discarding_due_jobs(self):
+        self._push_random(_START, 2000)
+        now = self._run_all(_START, limit=_START + 64 ** 3)
+
+        # make jobs due without removing them, then move some of them and some jobs ahead to new deadlines
+        for _ in range(100):
+            self._push(now + self.random.uniform(0, 64 ** 2))
+        now += 64 ** 2
+        self.wheel.peek(now)
+        due = [entry for entry in self.wheel.entries() if entry.deadline <= now]
+        ahead = [entry for entry in self.wheel.entries() if now < entry.deadline < float('inf')]
+        self.assertTrue(due)
+        moved = self.random.sample(due, len(due) // 2) + self.random.sample(ahead, 50)
+        self.wheel.discard_all(moved)
+        self.heap.discard_all(set(moved))
+        for entry in moved:
+            entry.deadline = now + self.random.uniform(0, 64 ** self.random.randint(0, 6))
+            self.wheel.push(entry)
+            self.heap.push(entry)
+
+        self._run_all(now)
+
+    def test_cancelled_due_job_is_skipped(self):
+        first, second = self._push(_START + 10), self._push(_START + 20)
+        self.assertIs(first, self.wheel.peek(_START + 30))
+        first.cancelled = True
+        self.assertIs(second, self.wheel.peek(_START + 30))
+
+    def test_equal_deadlines_by_priority(self):
+        low, critical, high = self._push(_START + 5000, 3), self._push(_START + 5000, 0), self._push(_START + 5000, 1)
+        self.assertEqual([critical, high, low], self._run_until(_START + 5000))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,6 +15,9 @@ Having them at one place makes easier to manage. Also prevents redundant strings
 
 # configs
 CONFIG_FILE = "/config.yaml"
+CONFIG_CACHE_SUFFIX = ".cache"
+CONFIG_JOBS_DIRECTORY = "jobs.d"
+CONFIG_ENV_PREFIX = "SCHEDULER__"
 ENV_DEV = "DEV"
 ENV_TEST = "TEST"
 ENV_PROD = "PROD"
@@ -34,12 +37,18 @@ MSG_NEXT_RUN_SCHEDULE = "(i) Next job to run at {}, which is {} seconds from now
 MSG_JOB_STARTED = "Scheduled jobs started and will run on schedule. (Print Estimated Time to Run (ETR)= {})"
 MSG_SHUTTING_DOWN_SCHEDULER = "(i) Shutting down scheduler..."
 MSG_WAIT_UNTIL_SAFE_SHUTDOWN = "(i) Waiting until safely shutdown. " \
-                               "NOTE: This operation will complete all pending jobs and then shutdown."
-MSG_SHUTDOWN_SCHEDULER_RUNNING_ALL = "(i) Running all pending jobs before shutting down scheduler..."
+                               "NOTE: This operation will complete all running and queued jobs and then shutdown."
+MSG_SHUTDOWN_IN_FLIGHT = "(i) Shutdown did not wait for job runs still in flight: {}"
 MSG_SCHEDULER_SHUTDOWN_COMPLETE = "(i) Scheduler shutdown complete."
 MSG_FORCE_STOP = "(i) Force stopping scheduler..."
+MSG_METRICS_SERVING = "(i) Serving metrics on http://{}:{}/metrics"
+MSG_METRICS_JOB = "(i) {} [{}] lateness {} | queue wait {} | duration {}"
+MSG_CONFIG_WATCHING = "(i) Watching configurations in {} for changes"
+MSG_JOBS_RESCHEDULED = "(i) Configurations reloaded, job(s) rescheduled: {}"
+MSG_AUDIT_AGENT_FAILED = "(!) Audit agent {} failed to capture {} trail(s): {}"
+MSG_AUDIT_SPILL_FAILED = "(!) Audit trails could not be spilled to {}: {}"
 MSG_SCHEDULER_INTERRUPTED = "*** (><) Scheduler interrupted, trying to safely shutdown. " \
-                            "All pending jobs will be executed immediately."
+                            "Running jobs will complete, no more jobs will be started."
 # messages > exception
 MSG_EX_ILLEGAL_DOWNLOADER = "(EX) Illegal downloader argument"
 MSG_EX_ILLEGAL_UPLOADER = "(EX) Illegal uploader argument"
@@ -47,6 +56,42 @@ MSG_EX_ILLEGAL_NOTIFIER = "(EX) Illegal notifier argument"
 MSG_EX_ILLEGAL_JOB = "(EX) Illegal job argument"
 MSG_EX_INVALID_SCHEDULE_CONFIG = "(EX) Either 'every' or 'at' should be provided, " \
                                  "not both. Job rejected due to invalid schedule configurations."
+MSG_EX_ILLEGAL_OVERFLOW_POLICY = "(EX) Illegal overflow policy, valid values are 'reject', 'queue' and 'drop-oldest'"
+MSG_EX_ILLEGAL_POOL_SIZE = "(EX) Worker pool size and queue depth must be at least 1"
+MSG_EX_POOL_SHUTDOWN = "(EX) Worker pool has been shutdown, no more jobs can be submitted"
+MSG_EX_ILLEGAL_EXECUTION = "(EX) Illegal execution mode, valid values are 'inline', 'thread' and 'process'"
+MSG_EX_JOB_NOT_PICKLABLE = "(EX) Job must be picklable to be executed in a separate process"
+MSG_EX_WORKER_PROCESS_DIED = "(EX) Worker process exited unexpectedly while running a job"
+MSG_EX_ILLEGAL_TIME_UNIT = "(EX) Illegal time unit '{}'"
+MSG_EX_ILLEGAL_EVERY = "(EX) Illegal value '{}' for every, it should be a positive number"
+MSG_EX_EVERY_NOT_ALLOWED = "(EX) Time unit '{}' does not allow every greater than 1, please use its plural"
+MSG_EX_AT_NOT_ALLOWED = "(EX) Time unit '{}' does not allow at, it is only valid for day and weekdays"
+MSG_EX_ILLEGAL_CRON = "(EX) Illegal cron expression '{}'"
+MSG_EX_CRON_NEVER_FIRES = "(EX) Cron expression '{}' never fires"
+MSG_EX_CRON_NOT_ALLOWED = "(EX) Cron expression can not be combined with every or at"
+MSG_EX_ILLEGAL_AT = "(EX) Illegal clock time '{}' for at, valid values are 00:00 - 23:59 or 00:00:00 - 23:59:59"
+MSG_EX_ILLEGAL_MAX_INSTANCES = "(EX) Illegal value '{}' for max instances, it should be at least 1"
+MSG_EX_ILLEGAL_OVERLAP_POLICY = "(EX) Illegal overlap policy, valid values are 'skip-if-running' and 'coalesce'"
+MSG_EX_ILLEGAL_MISFIRE_GRACE_TIME = "(EX) Illegal value '{}' for misfire grace time, it should be 0 or more seconds"
+MSG_EX_ILLEGAL_CATCH_UP = "(EX) Illegal catch up policy, valid values are 'once', 'all' and 'skip'"
+MSG_EX_ILLEGAL_PRIORITY = "(EX) Illegal value '{}' for priority, it should be 0 (critical), 1 (high), 2 (normal) " \
+                          "or 3 (low)"
+MSG_EX_ILLEGAL_WEIGHT = "(EX) Illegal value '{}' for weight, it should be a positive number"
+MSG_EX_ILLEGAL_JITTER = "(EX) Illegal value '{}' for jitter, it should be 0 or more seconds"
+MSG_EX_ILLEGAL_RESOLUTION = "(EX) Illegal value '{}' for timing wheel resolution, it should be a positive number"
+MSG_EX_ILLEGAL_TIMEOUT = "(EX) Illegal value '{}' for timeout, it should be a positive number of seconds"
+MSG_EX_JOB_TIMED_OUT = "(EX) Job did not complete within its timeout of {} seconds"
+MSG_EX_JOB_CANCELLED = "(EX) Job run has been cancelled"
+MSG_EX_DUPLICATE_STEP = "(EX) Pipeline step '{}' already exists"
+MSG_EX_UNKNOWN_STEP = "(EX) Unknown step '{}' in dependencies of step '{}', steps must be added after their dependencies"
+MSG_EX_ILLEGAL_RETRIES = "(EX) Illegal value '{}' for retries, it should be 0 or more"
+MSG_EX_ILLEGAL_METRICS_INTERVAL = "(EX) Illegal value '{}' for metrics interval, " \
+                                  "it should be a positive number of seconds"
+MSG_EX_ILLEGAL_POLL_INTERVAL = "(EX) Illegal value '{}' for poll interval, it should be a positive number of seconds"
+MSG_EX_ILLEGAL_AUDIT_OVERFLOW_POLICY = "(EX) Illegal audit overflow policy, " \
+                                       "valid values are 'block', 'drop' and 'spill'"
+MSG_EX_ILLEGAL_AUDIT_QUEUE = "(EX) Audit queue and batch size must be at least 1 and linger 0 or more seconds"
+MSG_EX_PIPELINE_FAILED = "(EX) Pipeline {} failed. Failed steps: [{}], steps not run: [{}]"
 # messages > Error
 ERR_MSG_INVALID_CONFIGS = "(X) *** Invalid configurations present, " \
                           "please resolve errors to be able to start scheduler ***"
@@ -59,6 +104,9 @@ ERR_MSG_SMTP_INVALID = "(X) Invalid SMTP or Email configurations"
 ERR_MSG_SCHEDULE_INVALID = "(X) Invalid schedule configurations. Value for both EVERY and AT are not allowed," \
                            " it should be either one."
 ERR_MSG_TIME_UNIT_EMPTY = "(X) At least one Time Unit should be present."
+ERR_MSG_CRON_INVALID = "(X) Invalid schedule configurations. CRON can not be combined with EVERY or AT."
+ERR_MSG_NUMBER_INVALID = "(X) Invalid configurations. Value '{1}' of {0} should be a number."
+ERR_MSG_JOB_CONFIG_INVALID = "(X) Invalid configurations of job {}, it should be a mapping of keys to values."
 # messages > Audit
 # messages > Audit > operation
 OPERATION_CONFIGURATION = "Configuration"
@@ -72,6 +120,8 @@ OPERATION_NOTIFICATION = "Notification"
 OPERATION_SCHEDULE = "Scheduler"
 OPERATION_START_JOBS = "Start-Jobs"
 OPERATION_SHUTDOWN = "Shutdown"
+OPERATION_JOB_RUN = "Job-Run"
+OPERATION_CHECKPOINT = "Checkpoint"
 
 # messages > Audit > status
 STATUS_LOADED = "Loaded"
@@ -85,11 +135,78 @@ STATUS_STARTING = "Starting"
 STATUS_STARTED = "Started"
 STATUS_WAITING = "Waiting"
 STATUS_INTERRUPTED = "Interrupted"
+STATUS_FAILED = "Failed"
+STATUS_REJECTED = "Rejected"
+STATUS_DROPPED = "Dropped"
+STATUS_SKIPPED = "Skipped"
+STATUS_MISFIRED = "Misfired"
+STATUS_TIMED_OUT = "Timed-Out"
+STATUS_RETRYING = "Retrying"
 
 # default configs
 DEFAULT_SCHEDULER_ACTION = "create"
 DEFAULT_PULSE = 5
 DEFAULT_SFTP_PORT = 22
+DEFAULT_MAX_WORKERS = 10
+DEFAULT_QUEUE_DEPTH = 100
+DEFAULT_OVERFLOW_POLICY = 'queue'
+DEFAULT_MAX_TASKS_PER_PROCESS = 100
+DEFAULT_MISFIRE_GRACE_TIME = 1
+DEFAULT_CATCH_UP = 'once'
+DEFAULT_STORE_BATCH_SIZE = 100
+DEFAULT_STORE_LINGER = 1.0
+DEFAULT_LEASE_TTL = 300
+DEFAULT_PRIORITY = 2
+DEFAULT_WEIGHT = 1.0
+DEFAULT_WHEEL_RESOLUTION = 1.0
+DEFAULT_METRICS_INTERVAL = 60
+DEFAULT_CONFIG_POLL_INTERVAL = 1.0
+DEFAULT_AUDIT_QUEUE_SIZE = 10000
+DEFAULT_AUDIT_BATCH_SIZE = 100
+DEFAULT_AUDIT_LINGER = 0.2
+DEFAULT_AUDIT_OVERFLOW_POLICY = 'block'
+DEFAULT_AUDIT_SPILL_FILE = 'scheduler-audit-{}.spill'
+DEFAULT_METRICS_PORT = 9100
+DEFAULT_METRICS_HOST = '127.0.0.1'
+DEFAULT_METRICS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+                           300.0, 900.0, 3600.0)
+
+# worker pool overflow policies
+POLICY_REJECT = 'reject'
+POLICY_QUEUE = 'queue'
+POLICY_DROP_OLDEST = 'drop-oldest'
+OVERFLOW_POLICIES = {POLICY_REJECT, POLICY_QUEUE, POLICY_DROP_OLDEST}
+
+# audit queue overflow policies
+AUDIT_OVERFLOW_BLOCK = 'block'
+AUDIT_OVERFLOW_DROP = 'drop'
+AUDIT_OVERFLOW_SPILL = 'spill'
+AUDIT_OVERFLOW_POLICIES = {AUDIT_OVERFLOW_BLOCK, AUDIT_OVERFLOW_DROP, AUDIT_OVERFLOW_SPILL}
+
+# job priority classes, a lower value runs first
+PRIORITY_CRITICAL = 0
+PRIORITY_HIGH = 1
+PRIORITY_NORMAL = 2
+PRIORITY_LOW = 3
+PRIORITIES = {PRIORITY_CRITICAL, PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW}
+
+# job execution modes
+EXECUTION_INLINE = 'inline'
+EXECUTION_THREAD = 'thread'
+EXECUTION_PROCESS = 'process'
+EXECUTION_MODES = {EXECUTION_INLINE, EXECUTION_THREAD, EXECUTION_PROCESS}
+EXECUTION_ASYNC = 'async'
+
+# job overlap policies, when max instances of a job are already running
+OVERLAP_SKIP_IF_RUNNING = 'skip-if-running'
+OVERLAP_COALESCE = 'coalesce'
+OVERLAP_POLICIES = {OVERLAP_SKIP_IF_RUNNING, OVERLAP_COALESCE}
+
+# catch up policies, for fire times missed by more than the misfire grace time
+CATCH_UP_ONCE = 'once'
+CATCH_UP_ALL = 'all'
+CATCH_UP_SKIP = 'skip'
+CATCH_UP_POLICIES = {CATCH_UP_ONCE, CATCH_UP_ALL, CATCH_UP_SKIP}
 
 # constants
 C_TIME_PARTS = {"hour", "minute", "second"}
@@ -112,6 +229,7 @@ HOUR = 'hour'
 HOURS = 'hours'
 
 DAY = 'day'
+DAYS = 'days'
 
 MONDAY = 'monday'
 TUESDAY = 'tuesday'
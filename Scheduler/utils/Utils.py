@@ -27,6 +27,10 @@ def cfg_by_env(key: str, envp: str):
     return Cfg_Loader.get_by_env(key, envp)
 
 
+def cfg_snapshot(envp: str = None):
+    return Cfg_Loader.snapshot(envp)
+
+
 def time_taken(start) -> str:
     sb = Sb.StringBuilder()
     taken = current_time_in_millis() - start